@@ -0,0 +1,27 @@
+from timeit import Timer
+
+from main.BoardFactory import BoardFactory, BoardFactoryImpl, Difficulty
+from main.TransformBoardFactory import TransformBoardFactory
+
+
+def boards_per_second(factory: BoardFactory, difficulty: Difficulty, number: int = 500) -> float:
+    timer = Timer(lambda: factory.generate_board(difficulty))
+    return number / min(timer.repeat(repeat=5, number=number))
+
+
+def grids_per_second(factory: TransformBoardFactory, number: int = 5000) -> float:
+    timer = Timer(factory.random_grid)
+    return number / min(timer.repeat(repeat=5, number=number))
+
+
+def main():
+    factories = {"BoardFactoryImpl": BoardFactoryImpl(), "TransformBoardFactory": TransformBoardFactory()}
+    for difficulty in (Difficulty.OFF, Difficulty.HARD):
+        for name, factory in factories.items():
+            print(f"{name:<22} {difficulty.name:<5} {boards_per_second(factory, difficulty):>10.0f} boards/s")
+
+    print(f"{'TransformBoardFactory':<22} grid  {grids_per_second(factories['TransformBoardFactory']):>10.0f} grids/s")
+
+
+if __name__ == '__main__':
+    main()
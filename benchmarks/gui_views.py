@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+from tkinter import TclError, Tk
+
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.Sudoku import Sudoku
+from main.gui.CanvasGameBoard import CanvasGameBoard
+from main.gui.GuiRunner import GameBoard
+
+VIEWS = {"widgets": GameBoard, "canvas": CanvasGameBoard}
+
+
+def count_widgets(widget) -> int:
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def new_view(view_type, root: Tk, size: int):
+    sudoku = Sudoku(BoardFactoryImpl(size=size))
+    if view_type is CanvasGameBoard:
+        return CanvasGameBoard(root, sudoku, size)
+    return view_type(root, sudoku)
+
+
+def time_startup(view_type, runs: int, size: int) -> (float, int):
+    times = []
+    widgets = 0
+    for _ in range(runs):
+        started = perf_counter()
+        root = Tk()
+        new_view(view_type, root, size)
+        root.update()
+        times.append(perf_counter() - started)
+        widgets = count_widgets(root)
+        root.destroy()
+    return median(times), widgets
+
+
+def time_selects(view_type, rounds: int, size: int) -> float:
+    root = Tk()
+    presenter = new_view(view_type, root, size).get_presenter()
+    random.seed(1234)
+    presenter.start_new_game(Difficulty.EASY)
+    while presenter.is_generating():
+        root.update()
+        root.after(10)
+
+    times = []
+    for _ in range(rounds):
+        for row in range(size):
+            for col in range(size):
+                started = perf_counter()
+                presenter.select(row, col, (row * size + col) % size + 1)
+                root.update_idletasks()
+                times.append(perf_counter() - started)
+    root.destroy()
+    return median(times)
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Compare startup and select latency of the widget and canvas boards")
+    parser.add_argument("--startup-runs", type=int, default=10)
+    parser.add_argument("--select-rounds", type=int, default=5, help="passes over every cell of the board")
+    parser.add_argument("--size", type=int, default=9, help="board size; the widget board only shows 9x9")
+    args = parser.parse_args()
+
+    try:
+        Tk().destroy()
+    except TclError as error:
+        print(f"No display available ({error}); run under a virtual display, e.g. xvfb-run", file=sys.stderr)
+        return 1
+
+    for name, view_type in VIEWS.items():
+        if view_type is GameBoard and args.size != 9:
+            continue
+        startup, widgets = time_startup(view_type, args.startup_runs, args.size)
+        select = time_selects(view_type, args.select_rounds, args.size)
+        print(f"{name:<8} startup {startup * 1000:>8.2f}ms  select {select * 1000:>7.3f}ms  widgets {widgets}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
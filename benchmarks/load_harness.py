@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import platform
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timezone
+from random import Random
+from time import perf_counter, perf_counter_ns
+from typing import Callable
+
+from main.BoardFactory import BoardFactory, BoardFactoryImpl, Difficulty
+from main.GameBoard import GameBoard
+from main.Sudoku import Sudoku, Guess
+
+DIFFICULTIES = (Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD)
+
+
+@dataclass
+class PlayerResult:
+    games: int = 0
+    wins: int = 0
+    guesses: int = 0
+    start_ns: list[int] = field(default_factory=list)
+    guess_ns: list[int] = field(default_factory=list)
+
+
+@dataclass
+class LoadReport:
+    players: int
+    mode: str
+    games: int
+    wins: int
+    guesses: int
+    elapsed_seconds: float
+    games_per_second: float
+    guesses_per_second: float
+    start_latency_ms: dict[str, float]
+    guess_latency_ms: dict[str, float]
+    timestamp: str = ""
+    python: str = ""
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+
+class RecordingBoardFactory(BoardFactory):
+    last_board: GameBoard = None
+
+    def __init__(self, factory: BoardFactory):
+        self.__factory = factory
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        self.last_board = self.__factory.generate_board(difficulty)
+        return self.last_board
+
+
+def percentiles(samples_ns: list[int]) -> dict[str, float]:
+    if not samples_ns:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+    ordered = sorted(samples_ns)
+    result = {}
+    for pct in (50, 95, 99):
+        rank = max(0, -(-pct * len(ordered) // 100) - 1)
+        result[f"p{pct}"] = ordered[rank] / 1e6
+    return result
+
+
+def play_games(factory_type: Callable[[], BoardFactory], games: int, wrong_rate: float, seed: int) -> PlayerResult:
+    rng = Random(seed)
+    recorder = RecordingBoardFactory(factory_type())
+    sudoku = Sudoku(recorder)
+    result = PlayerResult()
+
+    for _ in range(games):
+        started = perf_counter_ns()
+        sudoku.start_new_game(rng.choice(DIFFICULTIES))
+        result.start_ns.append(perf_counter_ns() - started)
+
+        moves = sorted(recorder.last_board.get_moves())
+        rng.shuffle(moves)
+        for (row, col, num) in moves:
+            if rng.random() < wrong_rate:
+                num = num % 9 + 1
+            started = perf_counter_ns()
+            sudoku.guess_number(Guess(row, col, num))
+            result.guess_ns.append(perf_counter_ns() - started)
+            result.guesses += 1
+            if sudoku.game_over():
+                break
+
+        if sudoku.game_over() and sudoku.is_winner():
+            result.wins += 1
+        sudoku.end_game()
+        result.games += 1
+
+    return result
+
+
+def run_load(players: int = 4, games_per_player: int = 10, processes: bool = False, wrong_rate: float = 0.05,
+             seed: int = 0, factory_type: Callable[[], BoardFactory] = BoardFactoryImpl) -> LoadReport:
+    executor_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    started = perf_counter()
+    with executor_type(max_workers=players) as executor:
+        futures = [executor.submit(play_games, factory_type, games_per_player, wrong_rate, seed + player)
+                   for player in range(players)]
+        results = [future.result() for future in futures]
+    elapsed = perf_counter() - started
+
+    games = sum(result.games for result in results)
+    guesses = sum(result.guesses for result in results)
+    return LoadReport(players=players,
+                      mode="processes" if processes else "threads",
+                      games=games,
+                      wins=sum(result.wins for result in results),
+                      guesses=guesses,
+                      elapsed_seconds=elapsed,
+                      games_per_second=games / elapsed,
+                      guesses_per_second=guesses / elapsed,
+                      start_latency_ms=percentiles([ns for result in results for ns in result.start_ns]),
+                      guess_latency_ms=percentiles([ns for result in results for ns in result.guess_ns]),
+                      timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                      python=platform.python_version())
+
+
+def main():
+    parser = ArgumentParser(description="Simulate concurrent Sudoku players")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--games", type=int, default=25, help="games per player")
+    parser.add_argument("--processes", action="store_true", help="run players in processes instead of threads")
+    parser.add_argument("--wrong-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run_load(args.players, args.games, args.processes, args.wrong_rate, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report.to_json() + "\n")
+    print(report.to_json())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import platform
+import random
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import fmean, median, quantiles, stdev
+from timeit import Timer
+from typing import Callable
+
+from main.BoardConstraints import BoardConstraints
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.GameBoard import GameBoard
+from main.Sudoku import BoardFormatter
+
+HERE = Path(__file__).parent
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    loops: int
+    samples: int
+    median: float
+    mean: float
+    stdev: float
+    min: float
+    p95: float
+
+    def __str__(self):
+        return (f"{self.name:<28} median {self.median * 1e6:>10.2f}us  min {self.min * 1e6:>10.2f}us  "
+                f"p95 {self.p95 * 1e6:>10.2f}us  ±{self.stdev / self.median * 100 if self.median else 0:>5.1f}%")
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self):
+        return (f"REGRESSION {self.name}: median {self.baseline * 1e6:.2f}us -> {self.current * 1e6:.2f}us "
+                f"({(self.ratio() - 1) * 100:+.1f}%)")
+
+
+def measure(name: str, func: Callable[[], object], repeat: int = 15, warmup: int = 3,
+            min_time: float = 0.02) -> BenchmarkResult:
+    timer = Timer(func)
+    loops = 1
+    while timer.timeit(loops) < min_time:
+        loops *= 2
+
+    for _ in range(warmup):
+        timer.timeit(loops)
+    times = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+
+    return BenchmarkResult(name=name,
+                           loops=loops,
+                           samples=len(times),
+                           median=median(times),
+                           mean=fmean(times),
+                           stdev=stdev(times) if len(times) > 1 else 0.0,
+                           min=min(times),
+                           p95=quantiles(times, n=20, method='inclusive')[18] if len(times) > 1 else times[0])
+
+
+def find_regressions(results: list[BenchmarkResult], baseline: dict[str, dict],
+                     threshold: float) -> list[Regression]:
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        if result.median > base["median"] * (1 + threshold) and result.min > base["median"]:
+            regressions.append(Regression(result.name, base["median"], result.median))
+    return regressions
+
+
+def append_history(path: Path, results: list[BenchmarkResult]):
+    entry = {"timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+             "python": platform.python_version(),
+             "results": {result.name: asdict(result) for result in results}}
+    with open(path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: Path, results: list[BenchmarkResult]):
+    with open(path, "w") as f:
+        json.dump({result.name: asdict(result) for result in results}, f, indent=2)
+        f.write("\n")
+
+
+def hot_paths() -> dict[str, Callable[[], object]]:
+    factory = BoardFactoryImpl()
+    random.seed(1234)
+    game_board = factory.generate_board(Difficulty.HARD)
+    grid = game_board.get_board()
+    solution = game_board.get_moves()
+    checks = [(row, col, num) for row in range(9) for col in range(9) for num in (1, 5, 9)]
+    digits = list(range(1, 10))
+
+    def fill_grid():
+        board = [[0] * 9 for _ in range(9)]
+        constraints = BoardConstraints(9)
+        for num in digits:
+            factory.place_number(board, num, 0, constraints)
+
+    def valid_places():
+        for (row, col, num) in checks:
+            factory.is_valid_place(grid, row, col, num)
+
+    def selections():
+        for row in range(9):
+            for col in range(9):
+                game_board.get_selection(row, col, grid[row][col])
+
+    def cold_selections():
+        board = GameBoard(grid, solution)
+        for row in range(9):
+            for col in range(9):
+                board.get_selection(row, col, grid[row][col])
+
+    benchmarks = {f"generate_board[{difficulty.name}]": (lambda d=difficulty: factory.generate_board(d))
+                  for difficulty in Difficulty}
+    benchmarks.update({
+        "place_number[fill grid]": fill_grid,
+        "is_valid_place[x243]": valid_places,
+        "get_selection[x81 cached]": selections,
+        "get_selection[x81 cold]": cold_selections,
+        "get_values": game_board.get_values,
+        "BoardFormatter.format": lambda: BoardFormatter(grid).format(),
+    })
+    return benchmarks
+
+
+def run(names: list[str] = None, repeat: int = 15, warmup: int = 3) -> list[BenchmarkResult]:
+    results = []
+    for name, func in hot_paths().items():
+        if names and not any(part in name for part in names):
+            continue
+        random.seed(1234)
+        result = measure(name, func, repeat=repeat, warmup=warmup)
+        print(result)
+        results.append(result)
+    return results
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Time the board generation and gameplay hot paths")
+    parser.add_argument("names", nargs="*", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--repeat", type=int, default=15, help="samples per benchmark")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed warmup rounds per benchmark")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed median slowdown, e.g. 0.10 = 10%%")
+    parser.add_argument("--history", type=Path, default=HERE / "history.jsonl")
+    parser.add_argument("--baseline", type=Path, default=HERE / "baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    args = parser.parse_args()
+
+    results = run(args.names, args.repeat, args.warmup)
+    append_history(args.history, results)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,18 +1,58 @@
+import asyncio
+from main import BulkGenerator, BulkSolver
 from main.BoardFactory import BoardFactoryImpl
 from main.CliRunner import CliRunner
+from main.PooledBoardFactory import PooledBoardFactory
+from main.gui.CanvasGameBoard import CanvasGameBoard
 from main.gui.GuiRunner import GameBoard
 from main.Sudoku import Sudoku
+from main.SudokuServer import SudokuServer
 from tkinter import *
 from sys import argv
 
+
+async def run_server(port: int, factory: BoardFactoryImpl):
+    server = SudokuServer(PooledBoardFactory(factory))
+    port = await server.start("0.0.0.0", port)
+    size = factory.get_size()
+    print(f"Serving {size}x{size} Sudoku on port {port}")
+    await server.serve_forever()
+
+
+def pop_size(args: list[str]) -> (int, list[str]):
+    if "--size" not in args:
+        return 9, args
+    i = args.index("--size")
+    if i + 1 >= len(args) or not args[i + 1].isdigit():
+        exit("--size needs a square number up to 25 such as 4, 9 or 16")
+    return int(args[i + 1]), args[:i] + args[i + 2:]
+
+
 if __name__ == '__main__':
     if len(argv) < 2:
         print("Must specify type")
-        print("\t--cli or --gui")
+        print("\t--cli [--size N], --gui [--canvas] [--size N], --server [port] [--size N], --solve [file] "
+              "or --generate N [--difficulty LEVEL] [--size N]")
     else:
-        if argv[1] == "--cli":
-            cli: CliRunner = CliRunner(Sudoku(BoardFactoryImpl()))
-            cli.run()
-        elif argv[1] == "--gui":
-            game = GameBoard(Tk())
-            game.run()
+        if argv[1] in ("--cli", "--gui", "--server"):
+            size, args = pop_size(argv[2:])
+            try:
+                factory = BoardFactoryImpl(size=size)
+            except ValueError as e:
+                exit(str(e))
+
+            if argv[1] == "--cli":
+                cli: CliRunner = CliRunner(Sudoku(PooledBoardFactory(factory)))
+                cli.run()
+            elif argv[1] == "--gui" and "--canvas" in args:
+                CanvasGameBoard(Tk(), Sudoku(PooledBoardFactory(factory)), size).run()
+            elif argv[1] == "--gui":
+                if size != 9:
+                    exit("The widget board only shows 9x9 games; use --gui --canvas --size N")
+                GameBoard(Tk()).run()
+            else:
+                asyncio.run(run_server(int(args[0]) if args else 8765, factory))
+        elif argv[1] == "--solve":
+            exit(BulkSolver.main(argv[2:]))
+        elif argv[1] == "--generate":
+            exit(BulkGenerator.main(argv[2:]))
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from math import isqrt
+
+
+class BoardConstraints:
+    __slots__ = ('__size', '__box', '__rows', '__cols', '__boxes')
+
+    def __init__(self, size: int = 9):
+        self.__size = size
+        self.__box = isqrt(size)
+        self.__rows = [0] * size
+        self.__cols = [0] * size
+        self.__boxes = [0] * size
+
+    @classmethod
+    def from_board(cls, board: list[list[int]]) -> BoardConstraints:
+        constraints = cls(len(board))
+        for row in range(len(board)):
+            for col in range(len(board[row])):
+                if board[row][col] != 0:
+                    constraints.place(row, col, board[row][col])
+
+        return constraints
+
+    def can_place(self, row: int, col: int, num: int) -> bool:
+        box = (row // self.__box) * self.__box + col // self.__box
+        return not (self.__rows[row] | self.__cols[col] | self.__boxes[box]) & (1 << num)
+
+    def place(self, row: int, col: int, num: int):
+        bit = 1 << num
+        self.__rows[row] |= bit
+        self.__cols[col] |= bit
+        self.__boxes[(row // self.__box) * self.__box + col // self.__box] |= bit
+
+    def remove(self, row: int, col: int, num: int):
+        mask = ~(1 << num)
+        self.__rows[row] &= mask
+        self.__cols[col] &= mask
+        self.__boxes[(row // self.__box) * self.__box + col // self.__box] &= mask
+
+    def candidates(self, row: int, col: int) -> int:
+        box = (row // self.__box) * self.__box + col // self.__box
+        used = self.__rows[row] | self.__cols[col] | self.__boxes[box]
+        return ~used & (((1 << self.__size) - 1) << 1)
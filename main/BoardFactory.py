@@ -1,8 +1,22 @@
 from __future__ import annotations
+import pickle
 from abc import ABC, abstractmethod
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from random import shuffle, random
-from .GameBoard import GameBoard
+from math import isqrt
+from os import cpu_count
+from random import Random, getrandbits, seed as seed_random, shuffle
+from threading import Lock
+from statistics import fmean, quantiles
+from time import perf_counter
+from typing import Callable, Iterator
+from .BoardConstraints import BoardConstraints
+from .GameBoard import GameBoard, SYMBOLS
+from .Metrics import metrics
+from .PuzzleCarver import PuzzleCarver
+from .solver.DancingLinksSolver import DancingLinksSolver
 
 
 class Difficulty(Enum):
@@ -10,9 +24,38 @@ class Difficulty(Enum):
     EASY = 15
     MEDIUM = 25
     HARD = 35
+    EXPERT = 64
 
-    def empty_squares(self) -> int:
-        return self.value
+    def empty_squares(self, size: int = 9) -> int:
+        if self is Difficulty.EXPERT and size > 9:
+            # Carving towards a minimal puzzle takes exponentially more search as
+            # boards grow, so large boards stop at a measured share of the cells.
+            return round(_LARGE_EXPERT_SHARE.get(size, Difficulty.HARD.value / 81) * size * size)
+        return round(self.value * size * size / 81)
+
+
+_LARGE_EXPERT_SHARE = {16: 0.55, 25: 0.46}
+
+# Values are written with one symbol each, and the solver recurses once per open cell.
+MAX_BOARD_SIZE = len(SYMBOLS) - 1
+
+
+@dataclass(frozen=True)
+class GenerationReport:
+    boards: int
+    workers: int
+    seconds: float
+    boards_per_second: float
+    mean_latency: float
+    p50_latency: float
+    p95_latency: float
+    max_latency: float
+
+    def __str__(self):
+        return (f"{self.boards} boards in {self.seconds:.2f}s on {self.workers} workers "
+                f"({self.boards_per_second:.1f} boards/s), latency mean {self.mean_latency * 1000:.2f}ms "
+                f"p50 {self.p50_latency * 1000:.2f}ms p95 {self.p95_latency * 1000:.2f}ms "
+                f"max {self.max_latency * 1000:.2f}ms")
 
 
 class BoardFactory(ABC):
@@ -21,48 +64,225 @@ class BoardFactory(ABC):
     def generate_board(self, difficulty: Difficulty) -> GameBoard:
         pass
 
+    def generate_boards(self, count: int, difficulty: Difficulty, workers: int = None, chunk_size: int = 64,
+                        seed: int = None, report: Callable[[GenerationReport], None] = None) -> Iterator[GameBoard]:
+        # Chunks run in worker processes, so the factory is pickled once per chunk.
+        # Wrappers holding locks or threads must override this and delegate.
+        try:
+            pickle.dumps(self)
+        except (TypeError, AttributeError, pickle.PicklingError) as error:
+            raise TypeError(f"{type(self).__name__} cannot be sent to worker processes; override "
+                            f"generate_boards to delegate to a picklable factory") from error
+
+        workers = workers if workers is not None else cpu_count() or 1
+        seeds = Random(seed)
+        chunks = deque(min(chunk_size, count - start) for start in range(0, count, chunk_size))
+        pending = deque()
+        latencies: list[float] = []
+        started = perf_counter()
+
+        executor = ProcessPoolExecutor(workers)
+        try:
+            while chunks or pending:
+                while chunks and len(pending) < 2 * workers:
+                    pending.append(executor.submit(_generate_chunk, self, difficulty, chunks.popleft(),
+                                                   seeds.getrandbits(64)))
+
+                boards, chunk_latencies = pending.popleft().result()
+                latencies.extend(chunk_latencies)
+                yield from boards
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        if report is not None:
+            report(_build_report(latencies, workers, perf_counter() - started))
+
+
+def _generate_chunk(factory: BoardFactory, difficulty: Difficulty, count: int,
+                    chunk_seed: int) -> (list[GameBoard], list[float]):
+    seed_random(chunk_seed)
+    boards, latencies = [], []
+    for _ in range(count):
+        started = perf_counter()
+        boards.append(factory.generate_board(difficulty))
+        latencies.append(perf_counter() - started)
+
+    return boards, latencies
+
+
+def _build_report(latencies: list[float], workers: int, seconds: float) -> GenerationReport:
+    if len(latencies) > 1:
+        cuts = quantiles(latencies, n=20, method='inclusive')
+        p50, p95 = cuts[9], cuts[18]
+    else:
+        p50 = p95 = latencies[0] if latencies else 0.0
+
+    return GenerationReport(boards=len(latencies),
+                            workers=workers,
+                            seconds=seconds,
+                            boards_per_second=len(latencies) / seconds if seconds > 0 else 0.0,
+                            mean_latency=fmean(latencies) if latencies else 0.0,
+                            p50_latency=p50,
+                            p95_latency=p95,
+                            max_latency=max(latencies, default=0.0))
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SeedCache:
+
+    def __init__(self, max_size: int = 128):
+        self.__max_size = max_size
+        self.__entries: OrderedDict[(int | str, Difficulty), (list[list[int]], set[(int, int, int)])] = OrderedDict()
+        self.__lock = Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key: (int | str, Difficulty)) -> (list[list[int]], set[(int, int, int)]) | None:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+            return entry
+
+    def put(self, key: (int | str, Difficulty), entry: (list[list[int]], set[(int, int, int)])):
+        if self.__max_size <= 0:
+            return
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = self.__misses = 0
+
+    def info(self) -> CacheInfo:
+        with self.__lock:
+            return CacheInfo(self.__hits, self.__misses, len(self.__entries), self.__max_size)
+
+    def __getstate__(self):
+        return self.__max_size
+
+    def __setstate__(self, max_size: int):
+        self.__init__(max_size)
+
 
 class BoardFactoryImpl(BoardFactory):
     __size = 9
+    __box = 3
+    __carver: PuzzleCarver = None
+    __cache: SeedCache = None
 
-    def generate_board(self, difficulty: Difficulty) -> GameBoard:
-        board = [[0 for x in range(self.__size)] for x in range(self.__size)]
-        self.__fill_board(board)
-        return GameBoard(board, self.__generate_solution(board, difficulty))
+    def __init__(self, carver: PuzzleCarver = None, cache_size: int = 128, size: int = 9):
+        self.__box = isqrt(size)
+        if size < 1 or self.__box * self.__box != size:
+            raise ValueError(f"Board size {size} is not a square number")
+        if size > MAX_BOARD_SIZE:
+            raise ValueError(f"Board size {size} is larger than {MAX_BOARD_SIZE}")
+        self.__size = size
+        self.__carver = carver if carver is not None else PuzzleCarver()
+        self.__cache = SeedCache(cache_size)
+
+    def get_size(self) -> int:
+        return self.__size
+
+    def generate_board(self, difficulty: Difficulty, seed: int | str = None) -> GameBoard:
+        if seed is None:
+            board = [[0 for x in range(self.__size)] for x in range(self.__size)]
+            self.__fill_board(board)
+            return GameBoard(board, self.__generate_solution(board, difficulty))
 
-    def place_number(self, board, num, col: int = 0) -> bool:
+        key = (seed, difficulty)
+        entry = self.__cache.get(key)
+        if entry is None:
+            rng = Random(seed)
+            board = [[0 for x in range(self.__size)] for x in range(self.__size)]
+            self.__fill_board(board, rng)
+            entry = (board, self.__carver.carve(board, difficulty.empty_squares(self.__size), rng))
+            self.__cache.put(key, entry)
+        return GameBoard(*entry)
+
+    def cache_info(self) -> CacheInfo:
+        return self.__cache.info()
+
+    def clear_cache(self):
+        self.__cache.clear()
+
+    def place_number(self, board, num, col: int = 0, constraints: BoardConstraints = None) -> bool:
+        if constraints is None:
+            constraints = BoardConstraints.from_board(board)
+        if metrics.enabled:
+            metrics.increment("sudoku_place_number_calls_total")
+            metrics.observe_max("sudoku_place_number_max_depth", col + 1)
         if col >= len(board):
             return True
 
         for row in range(len(board)):
-            if self.is_valid_place(board, row, col, num):
+            if board[row][col] == 0 and constraints.can_place(row, col, num):
                 board[row][col] = num
-                if self.place_number(board, num, col + 1):
+                constraints.place(row, col, num)
+                if self.place_number(board, num, col + 1, constraints):
                     return True
 
+                constraints.remove(row, col, num)
                 board[row][col] = 0
+                if metrics.enabled:
+                    metrics.increment("sudoku_place_number_backtracks_total")
 
         return False
 
-    def __fill_board(self, board):
-        vals: list[int] = [x for x in range(1, 10)]
-        shuffle(vals)
+    def __fill_board(self, board, rng: Random = None):
+        if self.__size > 9:
+            self.__fill_large_board(board, rng if rng is not None else Random(getrandbits(64)))
+            return
+
+        constraints = BoardConstraints(self.__size)
+        vals: list[int] = [x for x in range(1, self.__size + 1)]
+        if rng is not None:
+            rng.shuffle(vals)
+        else:
+            shuffle(vals)
         for num in vals:
-            self.place_number(board, num)
+            self.place_number(board, num, 0, constraints)
 
-    def __generate_solution(self, board, difficulty):
-        solution_steps = set([])
-        while len(solution_steps) < difficulty.empty_squares():
-            (x, y) = int(random() * 8), int(random() * 8)
-            val = board[x][y]
-            solution_steps.add((x, y, val))
+    def __fill_large_board(self, board, rng: Random):
+        # The diagonal boxes share no row or column, so they can be filled
+        # independently; the randomised exact cover search completes the rest.
+        box = self.__box
+        while True:
+            for b in range(box):
+                vals = list(range(1, self.__size + 1))
+                rng.shuffle(vals)
+                for i, num in enumerate(vals):
+                    board[b * box + i // box][b * box + i % box] = num
 
-        for (x, y, _) in solution_steps:
-            board[x][y] = 0
+            solved = DancingLinksSolver(rng).solve(board)
+            if solved is not None:
+                board[:] = solved
+                return
 
-        return solution_steps
+    def __generate_solution(self, board, difficulty):
+        return self.__carver.carve(board, difficulty.empty_squares(self.__size))
 
     def is_valid_place(self, board: list[list[int]], row: int, col: int, num: int):
+        if metrics.enabled:
+            metrics.increment("sudoku_is_valid_place_probes_total")
         if row > (len(board) - 1) or col > (len(board[0]) - 1):
             return False
         elif board[row][col] != 0:
@@ -77,27 +297,7 @@ class BoardFactoryImpl(BoardFactory):
             return True
 
     def __get_sub_square(self, row: int, col: int) -> (int, int):
-        if row < 3:
-            if col < 3:
-                return 0, 0
-            elif col < 6:
-                return 0, 3
-            else:
-                return 0, 6
-        elif row < 6:
-            if col < 3:
-                return 3, 0
-            elif col < 6:
-                return 3, 3
-            else:
-                return 3, 6
-        else:
-            if col < 3:
-                return 6, 0
-            elif col < 6:
-                return 6, 3
-            else:
-                return 6, 6
+        return row - row % self.__box, col - col % self.__box
 
     def __get_col_numbers(self, board, col) -> set[int]:
         col_nums = set([])
@@ -109,8 +309,8 @@ class BoardFactoryImpl(BoardFactory):
     def __get_sub_square_numbers(self, board, row, col) -> set[int]:
         start_row, start_col = self.__get_sub_square(row, col)
         square_nums = set([])
-        for i in range(start_row, start_row + 3):
-            for j in range(start_col, start_col + 3):
+        for i in range(start_row, start_row + self.__box):
+            for j in range(start_col, start_col + self.__box):
                 square_nums.add(board[i][j])
 
         return square_nums
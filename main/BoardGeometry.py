@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from math import isqrt
+
+
+class BoardGeometry:
+    __cache: dict[int, BoardGeometry] = {}
+
+    def __init__(self, size: int):
+        box = isqrt(size)
+        if box * box != size:
+            raise ValueError(f"Board size {size} is not a square number")
+
+        self.size = size
+        self.box = box
+        self.cells = size * size
+        self.row_of = tuple(cell // size for cell in range(self.cells))
+        self.col_of = tuple(cell % size for cell in range(self.cells))
+        self.box_of = tuple((cell // size // box) * box + cell % size // box for cell in range(self.cells))
+
+        rows = [tuple(row * size + col for col in range(size)) for row in range(size)]
+        cols = [tuple(row * size + col for row in range(size)) for col in range(size)]
+        boxes = [tuple(cell for cell in range(self.cells) if self.box_of[cell] == b) for b in range(size)]
+        self.units: tuple[tuple[int, ...], ...] = tuple(rows + cols + boxes)
+
+        unit_slots = [[] for _ in range(self.cells)]
+        for unit, members in enumerate(self.units):
+            for index, cell in enumerate(members):
+                unit_slots[cell].append((unit, index))
+        self.unit_slots: tuple[tuple[(int, int), ...], ...] = tuple(tuple(slots) for slots in unit_slots)
+
+        self.peers: tuple[tuple[int, ...], ...] = tuple(
+            tuple(sorted({peer for (unit, _) in unit_slots[cell] for peer in self.units[unit]} - {cell}))
+            for cell in range(self.cells))
+
+    def cell(self, row: int, col: int) -> int:
+        return row * self.size + col
+
+    def position(self, cell: int) -> (int, int):
+        return self.row_of[cell], self.col_of[cell]
+
+    @classmethod
+    def for_size(cls, size: int) -> BoardGeometry:
+        geometry = cls.__cache.get(size)
+        if geometry is None:
+            geometry = cls.__cache[size] = BoardGeometry(size)
+        return geometry
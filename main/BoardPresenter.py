@@ -1,6 +1,9 @@
+from concurrent.futures import Executor, Future
+from typing import Callable
+
 from main.BoardFactory import Difficulty
-from main.GameBoard import Position
-from main.gui.SudokuViewInterface import SudokuViewInterface
+from main.GameBoard import Position, SYMBOLS
+from main.gui.SudokuViewInterface import SudokuViewInterface, CellChange, CellStyle
 from main.Sudoku import Sudoku, Guess, IllegalStateException
 
 
@@ -14,32 +17,55 @@ class SudokuPresenter:
     __current_row = -1
     __current_col = -1
     __current_num = -1
+    __size = 9
+    __new_executor: Callable[[], Executor] = None
+    __generation: Future = None
 
-    def __init__(self, view: SudokuViewInterface, sudoku_game: Sudoku):
+    def __init__(self, view: SudokuViewInterface, sudoku_game: Sudoku,
+                 new_executor: Callable[[], Executor] = None):
         self.__view = view
         self.__game = sudoku_game
+        self.__new_executor = new_executor
         self.__current_selection: [Position] = []
+        self.__rendered: dict[(int, int), CellChange] = {}
+        self.__pending: dict[(int, int), CellChange] = {}
 
     def start_new_game(self, difficulty: Difficulty):
+        if self.__new_executor is not None:
+            self.__generate_in_background(difficulty)
+            return
+
         try:
             self.__game.start_new_game(difficulty)
             self.__view.disable_start_button()
-            self.__view.enable_end_game_button()
-
-            for val in self.__game.get_values():
-                self.__view.set_grid_value(val.row, val.col, val.value)
+            self.__show_new_game()
 
         except IllegalStateException:
             self.__view.show_acknowledge_dialog("Info", "Please end current game to start a new one.")
 
+    def cancel_new_game(self):
+        if self.__generation is None:
+            return
+        self.__generation.cancel()
+        self.__generation = None
+        self.__view.show_generating(False)
+        self.__view.enable_start_button()
+
+    def is_generating(self) -> bool:
+        return self.__generation is not None
+
     def guess_number(self, row: int, column: int, number: str):
         g = Guess(row, column, int(number))
-        self.__view.deactivate(self.__current_row, self.__current_col)
+        if self.__is_on_board(self.__current_row, self.__current_col):
+            self.__update(self.__current_row, self.__current_col, style=CellStyle.NORMAL)
 
         if self.__game.guess_number(g):
-            self.__view.set_cell_font_color(row, column, self.__green_color)
+            self.__update(row, column, value=SYMBOLS[g.number], color=self.__green_color, notes=0)
+            for pos in self.__game.get_selection(row, column, 0):
+                self.__update(pos.row, pos.col, notes=self.__game.get_notes(pos.row, pos.col))
         else:
-            self.__view.set_cell_font_color(row, column, self.__red_color)
+            self.__update(row, column, value=SYMBOLS[g.number], color=self.__red_color)
+        self.__flush()
 
         if self.__game.game_over():
             if self.__game.is_winner():
@@ -51,28 +77,129 @@ class SudokuPresenter:
     def select(self, row: int, col: int, num: int = 0):
         self.__unhighlight_selection()
         self.__highlight_new_selection(row, col, num)
+        self.__flush()
+
+    def toggle_note(self, row: int, col: int, number: str):
+        if not self.__game.game_started():
+            return
+        notes = self.__game.toggle_note(row, col, int(number))
+        if self.__game.get_value(row, col) == 0:
+            # Notes replace a wrong guess shown in the cell, so the guess is cleared too.
+            self.__update(row, col, value=" ", notes=notes)
+        self.__flush()
+
+    def show_hint(self):
+        if not self.__game.game_started():
+            return
+        hint = self.__game.get_hint()
+        if hint is None:
+            return
+
+        self.__unhighlight_selection()
+        for pos in hint.reasons:
+            self.__update(pos.row, pos.col, style=CellStyle.HIGHLIGHTED)
+        self.__update(hint.row, hint.col, style=CellStyle.ACTIVE)
+        self.__flush()
+
+        self.__current_selection = list(hint.reasons)
+        self.__current_row = hint.row
+        self.__current_col = hint.col
 
     def end_game(self):
         self.__game.end_game()
-        for x in range(9):
-            for y in range(9):
-                self.__view.set_grid_value(x, y, " ")
+        for x in range(self.__size):
+            for y in range(self.__size):
+                self.__update(x, y, value=" ", notes=0)
+        self.__flush()
 
         self.__view.disable_end_game_button()
         self.__view.enable_start_button()
 
+    def __generate_in_background(self, difficulty: Difficulty):
+        if self.__game.game_started():
+            self.__view.show_acknowledge_dialog("Info", "Please end current game to start a new one.")
+            return
+        elif self.__generation is not None:
+            return
+
+        self.__view.disable_start_button()
+        self.__view.show_generating(True)
+        # Each generation gets its own worker, so a cancelled one still running cannot hold up the next.
+        executor = self.__new_executor()
+        generation = self.__generation = executor.submit(self.__game.generate_board, difficulty)
+        executor.shutdown(wait=False)
+        # The callback runs on the worker thread; the view hands it back to the UI thread.
+        generation.add_done_callback(lambda done: self.__view.post(lambda: self.__finish_generation(done)))
+
+    def __finish_generation(self, generation: Future):
+        if generation is not self.__generation:
+            return
+        self.__generation = None
+        self.__view.show_generating(False)
+
+        try:
+            board = generation.result()
+        except Exception as error:
+            self.__view.show_acknowledge_dialog("Error", f"Could not generate a board: {error}")
+            self.__view.enable_start_button()
+            return
+
+        self.__game.start_game(board)
+        self.__show_new_game()
+
+    def __show_new_game(self):
+        self.__view.enable_end_game_button()
+        self.__size = self.__game.get_size()
+
+        for val in self.__game.get_values():
+            self.__update(val.row, val.col, value=val.value, notes=0)
+        self.__flush()
+
     def __unhighlight_selection(self):
-        self.__view.deactivate(self.__current_row, self.__current_col)
+        if self.__is_on_board(self.__current_row, self.__current_col):
+            self.__update(self.__current_row, self.__current_col, style=CellStyle.NORMAL)
         for pos in self.__current_selection:
-            self.__view.unhighlight(pos.row, pos.col)
+            self.__update(pos.row, pos.col, style=CellStyle.NORMAL)
 
     def __highlight_new_selection(self, row: int, col: int, num: int):
-        self.__view.activate(row, col)
         selection = self.__game.get_selection(row, col, num)
         for pos in selection:
-            self.__view.highlight(pos.row, pos.col)
+            self.__update(pos.row, pos.col, style=CellStyle.HIGHLIGHTED)
+        self.__update(row, col, style=CellStyle.ACTIVE)
 
         self.__current_selection = selection
         self.__current_row = row
         self.__current_col = col
 
+    def __update(self, row: int, col: int, value: str = None, style: CellStyle = None, color: str = None,
+                 notes: int = None):
+        pending = self.__pending.get((row, col), CellChange(row, col))
+        self.__pending[(row, col)] = CellChange(row, col,
+                                                value if value is not None else pending.value,
+                                                style if style is not None else pending.style,
+                                                color if color is not None else pending.color,
+                                                notes if notes is not None else pending.notes)
+
+    def __flush(self):
+        changes = []
+        for key, wanted in self.__pending.items():
+            shown = self.__rendered.get(key, CellChange(wanted.row, wanted.col, notes=0))
+            change = CellChange(wanted.row, wanted.col,
+                                wanted.value if wanted.value != shown.value else None,
+                                wanted.style if wanted.style != shown.style else None,
+                                wanted.color if wanted.color != shown.color else None,
+                                wanted.notes if wanted.notes != shown.notes else None)
+            if change != CellChange(wanted.row, wanted.col):
+                changes.append(change)
+                self.__rendered[key] = CellChange(wanted.row, wanted.col,
+                                                  wanted.value if wanted.value is not None else shown.value,
+                                                  wanted.style if wanted.style is not None else shown.style,
+                                                  wanted.color if wanted.color is not None else shown.color,
+                                                  wanted.notes if wanted.notes is not None else shown.notes)
+        self.__pending.clear()
+
+        if changes:
+            self.__view.apply_changes(changes)
+
+    def __is_on_board(self, row: int, col: int) -> bool:
+        return 0 <= row < self.__size and 0 <= col < self.__size
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import isqrt
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    valid: np.ndarray
+    complete: np.ndarray
+    conflicts: np.ndarray
+
+
+class BoardValidator:
+    __chunk_size: int
+
+    def __init__(self, chunk_size: int = 16384):
+        self.__chunk_size = chunk_size
+
+    def validate(self, boards) -> ValidationResult:
+        boards = np.asarray(boards)
+        if boards.ndim == 2:
+            boards = boards[np.newaxis]
+
+        if boards.ndim != 3 or boards.shape[1] != boards.shape[2] or isqrt(boards.shape[1]) ** 2 != boards.shape[1]:
+            raise ValueError("Boards must have shape (N, S, S) where S is a square number")
+
+        count = boards.shape[0]
+        valid = np.empty(count, dtype=bool)
+        complete = np.empty(count, dtype=bool)
+        conflicts = np.zeros(boards.shape, dtype=bool)
+        for start in range(0, count, self.__chunk_size):
+            end = min(start + self.__chunk_size, count)
+            self.__validate_chunk(boards[start:end], valid[start:end], complete[start:end], conflicts[start:end])
+
+        return ValidationResult(valid=valid, complete=complete, conflicts=conflicts)
+
+    def __validate_chunk(self, boards: np.ndarray, valid: np.ndarray, complete: np.ndarray, conflicts: np.ndarray):
+        size = boards.shape[1]
+        box = isqrt(size)
+        dtype = np.uint16 if size < 16 else np.uint32 if size < 32 else np.uint64
+        full = dtype(((1 << size) - 1) << 1)
+
+        # Work on a (row, col, board) copy so every per-cell slice below is contiguous across boards.
+        cells = np.ascontiguousarray(boards.transpose(1, 2, 0))
+        out_of_range = None
+        if cells.min() < 0 or cells.max() > size:
+            out_of_range = (cells < 0) | (cells > size)
+            cells = np.where(out_of_range, 0, cells)
+        bits = np.left_shift(dtype(1), cells.astype(dtype)) & full
+
+        row_seen, row_repeated = self.__scan([bits[:, col] for col in range(size)])
+        _, col_repeated = self.__scan([bits[row] for row in range(size)])
+        squares = bits.reshape(box, box, box, box, -1)
+        _, box_repeated = self.__scan([squares[:, r, :, c] for r in range(box) for c in range(box)])
+        box_repeated = box_repeated.reshape(size, -1)
+
+        invalid = (row_repeated | col_repeated | box_repeated).any(axis=0)
+        if out_of_range is not None:
+            invalid |= out_of_range.any(axis=(0, 1))
+        np.logical_not(invalid, out=valid)
+        np.logical_and(valid, (row_seen == full).all(axis=0), out=complete)
+
+        bad = np.flatnonzero(invalid)
+        if len(bad):
+            box_repeated = box_repeated.reshape(box, 1, box, 1, -1)
+            box_repeated = np.broadcast_to(box_repeated, (box, box, box, box, box_repeated.shape[-1]))
+            repeated = (row_repeated[:, np.newaxis] | col_repeated[np.newaxis]
+                        | box_repeated.reshape(size, size, -1))
+            located = (bits[:, :, bad] & repeated[:, :, bad]) != 0
+            if out_of_range is not None:
+                located |= out_of_range[:, :, bad]
+            conflicts[bad] = located.transpose(2, 0, 1)
+
+    def __scan(self, positions: list[np.ndarray]) -> (np.ndarray, np.ndarray):
+        seen = np.zeros_like(positions[0])
+        repeated = np.zeros_like(positions[0])
+        for cell in positions:
+            repeated |= seen & cell
+            seen |= cell
+
+        return seen, repeated
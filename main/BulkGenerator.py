@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import BinaryIO, Iterable, TextIO
+
+from .BoardFactory import BoardFactory, BoardFactoryImpl, Difficulty
+from .GameBoard import GameBoard, format_values
+from .PuzzleCarver import PuzzleCarver, Symmetry
+from .PuzzleCorpus import PuzzleCorpus
+
+FORMATS = ("line", "binary")
+
+
+def format_line(board: GameBoard) -> str:
+    givens = [val for row in board.get_board() for val in row]
+    solution = givens[:]
+    size = board.get_size()
+    for (row, col, val) in board.get_moves():
+        solution[row * size + col] = val
+    return format_values(givens) + " " + format_values(solution)
+
+
+def write_lines(boards: Iterable[GameBoard], out: TextIO, chunk_size: int = 256) -> int:
+    written = 0
+    chunk = []
+    for board in boards:
+        chunk.append(format_line(board) + "\n")
+        if len(chunk) >= chunk_size:
+            written += _flush(out, "".join(chunk), len(chunk))
+            chunk = []
+    if chunk:
+        written += _flush(out, "".join(chunk), len(chunk))
+    return written
+
+
+def write_binary(boards: Iterable[GameBoard], out: BinaryIO, difficulty: Difficulty, chunk_size: int = 256) -> int:
+    if not out.seekable():
+        raise ValueError("Binary output must go to a seekable file")
+
+    # Like PuzzleCorpusWriter, the header is rewritten at the end with the records
+    # actually written, so a run that stops early still leaves a readable corpus.
+    start = out.tell()
+    out.write(PuzzleCorpus.encode_header({difficulty: 0}))
+    written = 0
+    chunk = []
+    try:
+        for board in boards:
+            chunk.append(PuzzleCorpus.encode_record(board, difficulty))
+            if len(chunk) >= chunk_size:
+                written += _flush(out, b"".join(chunk), len(chunk))
+                chunk = []
+        if chunk:
+            written += _flush(out, b"".join(chunk), len(chunk))
+    finally:
+        end = out.tell()
+        out.seek(start)
+        out.write(PuzzleCorpus.encode_header({difficulty: written}))
+        out.seek(end)
+        out.flush()
+    return written
+
+
+def _flush(out, data, records: int) -> int:
+    out.write(data)
+    out.flush()
+    return records
+
+
+def main(argv: list[str] = None, stdout: TextIO = None, stderr: TextIO = None,
+         factory: BoardFactory = None) -> int:
+    parser = ArgumentParser(prog="main.py --generate", description="Stream generated puzzles and solutions")
+    parser.add_argument("count", type=int, help="number of puzzles to generate")
+    parser.add_argument("--difficulty", choices=[d.name.lower() for d in Difficulty], default="medium")
+    parser.add_argument("--format", choices=FORMATS, default="line",
+                        help="line: '<puzzle> <solution>' per line, binary: a PuzzleCorpus file")
+    parser.add_argument("--size", type=int, default=9, help="board size, a square number up to 25 such as 4, 9 or 16")
+    parser.add_argument("--symmetry", choices=[s.name.lower() for s in Symmetry], default="none",
+                        help="remove clues in symmetric pairs")
+    parser.add_argument("--output", help="write to this file instead of stdout")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=64, help="puzzles per worker task and per flush")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    stdout = stdout if stdout is not None else sys.stdout
+    stderr = stderr if stderr is not None else sys.stderr
+    if args.format == "binary" and args.size != PuzzleCorpus.BOARD_SIZE:
+        parser.error(f"binary output only holds {PuzzleCorpus.BOARD_SIZE}x{PuzzleCorpus.BOARD_SIZE} boards")
+    if args.format == "binary" and not args.output and not stdout.buffer.seekable():
+        parser.error("binary output needs --output or stdout redirected to a file")
+    if factory is None:
+        try:
+            factory = BoardFactoryImpl(PuzzleCarver(symmetry=Symmetry[args.symmetry.upper()]), size=args.size)
+        except ValueError as error:
+            parser.error(str(error))
+    difficulty = Difficulty[args.difficulty.upper()]
+    boards = factory.generate_boards(args.count, difficulty, workers=max(args.workers, 1),
+                                     chunk_size=args.chunk_size, seed=args.seed)
+
+    started = perf_counter()
+    binary = args.format == "binary"
+    if args.output:
+        out = open(args.output, "wb" if binary else "w")
+    else:
+        out = stdout.buffer if binary else stdout
+    try:
+        if binary:
+            written = write_binary(boards, out, difficulty, args.chunk_size)
+        else:
+            written = write_lines(boards, out, args.chunk_size)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly like other pipeline tools.
+        if stdout is sys.stdout:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        boards.close()
+        if args.output:
+            out.close()
+
+    elapsed = perf_counter() - started
+    rate = written / elapsed if elapsed > 0 else 0.0
+    stderr.write(f"Generated {written} {difficulty.name} puzzles in {elapsed:.2f}s ({rate:.0f} puzzles/s)\n")
+    return 0
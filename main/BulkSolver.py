@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import os
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from math import isqrt
+from os import cpu_count
+from time import perf_counter
+from typing import Iterable, Iterator, TextIO
+
+from .GameBoard import SYMBOLS, format_values
+from .solver.DancingLinksSolver import DancingLinksSolver
+
+_solver = DancingLinksSolver()
+
+
+def parse_puzzle(line: str) -> list[list[int]] | None:
+    size = isqrt(len(line))
+    if size == 0 or size * size != len(line) or isqrt(size) ** 2 != size or size >= len(SYMBOLS):
+        return None
+
+    values = []
+    for char in line.upper():
+        val = SYMBOLS.find(char) if char != "." else 0
+        if not 0 <= val <= size:
+            return None
+        values.append(val)
+    return [values[row * size:(row + 1) * size] for row in range(size)]
+
+
+def solve_line(line: str) -> str:
+    board = parse_puzzle(line)
+    if board is None:
+        return f"{line} 0"
+
+    try:
+        found = _solver.solutions(board, 2)
+    except ValueError:
+        return f"{line} 0"
+    if not found:
+        return f"{line} 0"
+
+    solution = format_values(val for row in found[0] for val in row)
+    return f"{solution} {'1' if len(found) == 1 else 'many'}"
+
+
+def solve_chunk(lines: list[str]) -> list[str]:
+    return [solve_line(line) for line in lines]
+
+
+def solve_stream(lines: Iterable[str], executor: Executor = None, chunk_size: int = 256,
+                 window: int = 8, buffer: int = None) -> Iterator[str]:
+    puzzles = (line.split(maxsplit=1) for line in lines)
+    puzzles = (fields[0] for fields in puzzles if fields and not fields[0].startswith("#"))
+    chunks = iter(lambda: list(islice(puzzles, chunk_size)), [])
+
+    if executor is None:
+        for chunk in chunks:
+            yield from solve_chunk(chunk)
+        return
+
+    # At most `window` chunks run at once. Chunks that finish ahead of an older,
+    # slower one wait in a reorder buffer so workers keep going while output holds.
+    limit = window + (buffer if buffer is not None else 4 * window)
+    running: dict[Future, int] = {}
+    finished: dict[int, list[str]] = {}
+    submitted = emitted = 0
+    while True:
+        while len(running) < window and submitted - emitted < limit:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            running[executor.submit(solve_chunk, chunk)] = submitted
+            submitted += 1
+        if not running:
+            return
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            finished[running.pop(future)] = future.result()
+        while emitted in finished:
+            yield from finished.pop(emitted)
+            emitted += 1
+
+
+def main(argv: list[str] = None, stdin: TextIO = None, stdout: TextIO = None, stderr: TextIO = None) -> int:
+    parser = ArgumentParser(prog="main.py --solve", description="Solve a stream of puzzles, one N*N character line each")
+    parser.add_argument("file", nargs="?", help="puzzle file, one puzzle per line (default: stdin)")
+    parser.add_argument("--workers", type=int, default=cpu_count() or 1, help="solver processes, 0 to solve inline")
+    parser.add_argument("--chunk-size", type=int, default=256, help="puzzles sent to a worker at a time")
+    parser.add_argument("--window", type=int, default=None,
+                        help="chunks solved at once (default: 2 x workers)")
+    parser.add_argument("--buffer", type=int, default=None,
+                        help="finished chunks held back for in-order output (default: 4 x window)")
+    args = parser.parse_args(argv)
+
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+    stderr = stderr if stderr is not None else sys.stderr
+    window = args.window if args.window is not None else 2 * max(args.workers, 1)
+
+    source = open(args.file) if args.file else stdin
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 0 else None
+    solved = 0
+    started = perf_counter()
+    try:
+        for result in solve_stream(source, executor, args.chunk_size, max(window, 1), args.buffer):
+            stdout.write(result + "\n")
+            solved += 1
+        stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly like other pipeline tools.
+        if stdout is sys.stdout:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if source is not stdin:
+            source.close()
+
+    elapsed = perf_counter() - started
+    rate = solved / elapsed if elapsed > 0 else 0.0
+    stderr.write(f"Solved {solved} puzzles in {elapsed:.2f}s ({rate:.0f} puzzles/s)\n")
+    return 0
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from .BoardGeometry import BoardGeometry
+
+
+class CandidateGrid:
+
+    def __init__(self, board: list[list[int]]):
+        geometry = BoardGeometry.for_size(len(board))
+        size = geometry.size
+        self.geometry = geometry
+        self.stride = size + 1
+        self.values: list[int] = [val for row in board for val in row]
+        self.candidates: list[int] = [0] * geometry.cells
+        self.places: list[int] = [0] * (len(geometry.units) * self.stride)
+        self.empty = 0
+        self.__singles: list[int] = []
+        self.__hidden: list[int] = []
+
+        used = [0] * len(geometry.units)
+        for cell, val in enumerate(self.values):
+            if val:
+                for (unit, _) in geometry.unit_slots[cell]:
+                    used[unit] |= 1 << val
+
+        full = ((1 << size) - 1) << 1
+        for cell, val in enumerate(self.values):
+            if val:
+                continue
+            self.empty += 1
+            slots = geometry.unit_slots[cell]
+            mask = full
+            for (unit, _) in slots:
+                mask &= ~used[unit]
+            self.candidates[cell] = mask
+            if mask & (mask - 1) == 0:
+                self.__singles.append(cell)
+            for (unit, index) in slots:
+                base = unit * self.stride
+                bits = mask
+                while bits:
+                    low = bits & -bits
+                    self.places[base + low.bit_length() - 1] |= 1 << index
+                    bits ^= low
+
+        for key, positions in enumerate(self.places):
+            if positions and positions & (positions - 1) == 0:
+                self.__hidden.append(key)
+
+    def copy(self) -> CandidateGrid:
+        clone = CandidateGrid.__new__(CandidateGrid)
+        clone.geometry = self.geometry
+        clone.stride = self.stride
+        clone.values = self.values[:]
+        clone.candidates = self.candidates[:]
+        clone.places = self.places[:]
+        clone.empty = self.empty
+        clone.__singles = self.__singles[:]
+        clone.__hidden = self.__hidden[:]
+        return clone
+
+    def is_solved(self) -> bool:
+        return self.empty == 0
+
+    def place(self, cell: int, num: int):
+        mask = self.candidates[cell]
+        self.values[cell] = num
+        self.candidates[cell] = 0
+        self.empty -= 1
+
+        for (unit, index) in self.geometry.unit_slots[cell]:
+            base = unit * self.stride
+            clear = ~(1 << index)
+            bits = mask & ~(1 << num)
+            while bits:
+                low = bits & -bits
+                key = base + low.bit_length() - 1
+                positions = self.places[key] & clear
+                self.places[key] = positions
+                if positions & (positions - 1) == 0:
+                    self.__hidden.append(key)
+                bits ^= low
+            self.places[base + num] = 0
+
+        bit = 1 << num
+        for peer in self.geometry.peers[cell]:
+            if self.candidates[peer] & bit:
+                self.eliminate(peer, num)
+
+    def eliminate(self, cell: int, num: int) -> bool:
+        bit = 1 << num
+        mask = self.candidates[cell]
+        if not mask & bit:
+            return False
+
+        mask ^= bit
+        self.candidates[cell] = mask
+        if mask & (mask - 1) == 0:
+            self.__singles.append(cell)
+
+        for (unit, index) in self.geometry.unit_slots[cell]:
+            key = unit * self.stride + num
+            positions = self.places[key] & ~(1 << index)
+            self.places[key] = positions
+            if positions & (positions - 1) == 0:
+                self.__hidden.append(key)
+        return True
+
+    def next_naked_single(self) -> (int, int) | None:
+        while self.__singles:
+            cell = self.__singles[-1]
+            mask = self.candidates[cell]
+            if self.values[cell] == 0 and mask and mask & (mask - 1) == 0:
+                return cell, mask.bit_length() - 1
+            self.__singles.pop()
+
+        return None
+
+    def next_hidden_single(self) -> (int, int, int) | None:
+        while self.__hidden:
+            key = self.__hidden[-1]
+            positions = self.places[key]
+            if positions and positions & (positions - 1) == 0:
+                unit, num = divmod(key, self.stride)
+                return self.geometry.units[unit][positions.bit_length() - 1], num, unit
+            self.__hidden.pop()
+
+        return None
+
+    def has_contradiction(self) -> bool:
+        return any(val == 0 and mask == 0 for val, mask in zip(self.values, self.candidates))
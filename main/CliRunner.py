@@ -3,7 +3,7 @@ from main.Sudoku import Sudoku, Guess
 
 
 class CliRunner:
-    __difficulty_mapping = {1: Difficulty.EASY, 2: Difficulty.MEDIUM, 3: Difficulty.HARD}
+    __difficulty_mapping = {1: Difficulty.EASY, 2: Difficulty.MEDIUM, 3: Difficulty.HARD, 4: Difficulty.EXPERT}
     __sudoku: Sudoku = None
     __exit: bool = False
 
@@ -35,7 +35,8 @@ class CliRunner:
         print("\t1) Easy")
         print("\t2) Medium")
         print("\t3) Hard")
-        return [1, 2, 3]
+        print("\t4) Expert")
+        return [1, 2, 3, 4]
 
 
     def __print_welcome_menu(self) -> list[int]:
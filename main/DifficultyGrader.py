@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from .CandidateGrid import CandidateGrid
+from .solver.DancingLinksSolver import DancingLinksSolver
+from .solver.Solver import Solver
+from .Techniques import Deduction, Technique, TechniqueFinder
+
+
+@dataclass(frozen=True)
+class Grade:
+    rating: float
+    hardest: Technique | None
+    steps: dict[Technique, int] = field(default_factory=dict)
+
+
+class DifficultyGrader:
+    __finder: TechniqueFinder = None
+    __solver: Solver = None
+
+    def __init__(self, finder: TechniqueFinder = None, solver: Solver = None):
+        self.__finder = finder if finder is not None else TechniqueFinder()
+        self.__solver = solver if solver is not None else DancingLinksSolver()
+
+    def grade(self, board: list[list[int]]) -> Grade:
+        grid = CandidateGrid(board)
+        steps: dict[Technique, int] = {}
+        solution = None
+        while not grid.is_solved():
+            deduction = self.__finder.find(grid)
+            if deduction is None:
+                if solution is None:
+                    solution = self.__solver.solve(board)
+                    if solution is None:
+                        raise ValueError("Puzzle has no solution")
+                deduction = self.__guess(grid, solution)
+
+            deduction.apply_to(grid)
+            steps[deduction.technique] = steps.get(deduction.technique, 0) + 1
+
+        hardest = max(steps, key=Technique.weight, default=None)
+        return Grade(rating=hardest.weight() if hardest is not None else 0.0, hardest=hardest, steps=steps)
+
+    def __guess(self, grid: CandidateGrid, solution: list[list[int]]) -> Deduction:
+        open_cells = [cell for cell in range(grid.geometry.cells) if grid.values[cell] == 0]
+        cell = min(open_cells, key=lambda c: grid.candidates[c].bit_count())
+        row, col = grid.geometry.position(cell)
+        return Deduction(Technique.GUESS, placements=((cell, solution[row][col]),))
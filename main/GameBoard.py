@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+
+from .BoardGeometry import BoardGeometry
 
 
 class IllegalMoveError(Exception):
@@ -9,102 +12,187 @@ class IllegalMoveError(Exception):
 
 
 class GameBoard:
-    __game_board: list[list[int]]
-    __solution_steps: set[(int, int, int)]
+    __slots__ = ('__size', '__cells', '__solution', '__remaining', '__locations', '__version',
+                 '__selection_key', '__selection', '__notes')
+    __size: int
+    __cells: bytearray
+    __solution: bytearray
+    __remaining: int
+    __locations: list[int] | None
+    __version: int
+    __selection_key: (int, int, int, int) | None
+    __selection: tuple[Position, ...] | None
+    __notes: list[int] | None
 
     def __init__(self, board: list[list[int]], solution: set[(int, int, int)]):
-        self.__game_board = board
-        self.__solution_steps = solution
+        self.__size = len(board)
+        self.__cells = bytearray(val for row in board for val in row)
+        self.__solution = bytearray(self.__cells)
+        for (row, col, num) in solution:
+            self.__solution[row * self.__size + col] = num
+        self.__remaining = len(solution)
+        self.__locations = None
+        self.__version = 0
+        self.__selection_key = None
+        self.__selection = None
+        self.__notes = None
 
     def guess(self, row: int, col: int, num: int) -> bool:
         if self.__is_inside_board(col, row):
             return self.__process_move(col, num, row)
         else:
-            raise IllegalMoveError("Move must be inside the board, 0 <= row <= 8 and 0 <= col <= 8")
+            last = self.__size - 1
+            raise IllegalMoveError(f"Move must be inside the board, 0 <= row <= {last} and 0 <= col <= {last}")
 
     def __process_move(self, col, num, row):
-        if (row, col, num) in self.__solution_steps:
-            self.__game_board[row][col] = num
-            self.__solution_steps.remove((row, col, num))
+        index = row * self.__size + col
+        if self.__cells[index] == 0 and self.__solution[index] == num:
+            self.__cells[index] = num
+            if self.__locations is not None:
+                self.__locations[num] |= 1 << index
+            if self.__notes is not None:
+                self.__clear_notes_for(index, num)
+            self.__remaining -= 1
+            self.__version += 1
             return True
         else:
             return False
 
+    def __clear_notes_for(self, index: int, num: int):
+        notes = self.__notes
+        notes[index] = 0
+        keep = ~(1 << (num - 1))
+        for peer in peer_table(self.__size).peer_cells[index]:
+            notes[peer] &= keep
+
+    def toggle_note(self, row: int, col: int, num: int) -> int:
+        if not self.__is_inside_board(col, row):
+            raise IllegalMoveError("Note must be inside the board")
+        if not 1 <= num <= self.__size:
+            raise IllegalMoveError(f"Note must be between 1 and {self.__size}")
+
+        index = row * self.__size + col
+        if self.__cells[index] != 0:
+            return 0
+        if self.__notes is None:
+            self.__notes = [0] * len(self.__cells)
+        self.__notes[index] ^= 1 << (num - 1)
+        return self.__notes[index]
+
+    def get_notes(self, row: int, col: int) -> int:
+        if self.__notes is None:
+            return 0
+        return self.__notes[row * self.__size + col]
+
     def __is_inside_board(self, col, row) -> bool:
-        return 0 <= row <= 8 and 0 <= col <= 8
+        return 0 <= row < self.__size and 0 <= col < self.__size
+
+    def get_size(self) -> int:
+        return self.__size
 
-    def get_board(self):
-        return self.__game_board
+    def get_value(self, row: int, col: int) -> int:
+        return self.__cells[row * self.__size + col]
 
-    def get_moves(self):
-        return deepcopy(self.__solution_steps)
+    def get_board(self) -> list[list[int]]:
+        size = self.__size
+        return [list(self.__cells[row * size:(row + 1) * size]) for row in range(size)]
+
+    def get_cells(self) -> memoryview:
+        return memoryview(self.__cells).toreadonly()
+
+    def get_moves(self) -> set[(int, int, int)]:
+        size = self.__size
+        return {(index // size, index % size, self.__solution[index])
+                for index, val in enumerate(self.__cells) if val == 0}
 
     def get_selection(self, row: int, col: int, num: int) -> list[Position]:
-        result = []
-        self.__get_row_and_col(col, row, result)
-        self.__get_square(col, row, result)
-        self.__get_all_locations_of(num, result)
+        # Only the latest selection is kept: repeated clicks on one cell are the common case,
+        # and a board must stay small while the server holds thousands of them.
+        key = (row, col, num, self.__version)
+        if key != self.__selection_key:
+            self.__selection = tuple(self.__build_selection(row, col, num))
+            self.__selection_key = key
+        return list(self.__selection)
+
+    def __build_selection(self, row: int, col: int, num: int) -> list[Position]:
+        table = peer_table(self.__size)
+        cell = row * self.__size + col
+        result = list(table.peers[cell])
+        if 0 < num <= self.__size:
+            locations = self.__get_locations()[num] & ~table.peer_masks[cell]
+            while locations:
+                low = locations & -locations
+                result.append(table.positions[low.bit_length() - 1])
+                locations ^= low
         return result
 
+    def __get_locations(self) -> list[int]:
+        if self.__locations is None:
+            self.__locations = [0] * (self.__size + 1)
+            for index, val in enumerate(self.__cells):
+                self.__locations[val] |= 1 << index
+        return self.__locations
+
     def get_values(self) -> list[Value]:
         result = []
-        for row in range(9):
-            for col in range(9):
-                value = str(self.__game_board[row][col])
+        for row in range(self.__size):
+            for col in range(self.__size):
+                value = SYMBOLS[self.__cells[row * self.__size + col]]
                 if value == '0':
                     value = ' '
                 result.append(Value(row, col, value))
         return result
 
     def is_solved(self):
-        return len(self.__solution_steps) == 0
-
-    def __get_row_and_col(self, col: int, row: int, result: list[Position]):
-        for x in range(9):
-            if x != col:
-                result.append(Position(row, x))
-            if x != row:
-                result.append(Position(x, col))
-
-    def __get_square(self, col: int, row: int, result: list[Position]):
-        starting_col = self.__get_start_value(col)
-        starting_row = self.__get_start_value(row)
-        for x in range(starting_row, starting_row + 3):
-            for y in range(starting_col, starting_col + 3):
-                if x != row and y != col:
-                    result.append(Position(x, y))
-
-    def __get_all_locations_of(self, num: int, locations: list[Position]):
-        if num != 0:
-            for row in range(len(self.__game_board)):
-                for col in range(len(self.__game_board[row])):
-                    if self.__game_board[row][col] == num:
-                        locations.append(Position(row, col))
-
-        return locations
-
-    def __get_start_value(self, num: int) -> int:
-        if 0 <= num <= 2:
-            return 0
-        elif num <= 5:
-            return 3
-        else:
-            return 6
+        return self.__remaining == 0
 
     def __eq__(self, other):
         if isinstance(other, GameBoard):
-            return self.__game_board == other.__game_board
+            return self.__cells == other.__cells
         else:
             return False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class PeerTable:
+    positions: tuple[Position, ...]
+    peers: tuple[tuple[Position, ...], ...]
+    peer_cells: tuple[tuple[int, ...], ...]
+    peer_masks: tuple[int, ...]
+
+
+@lru_cache(maxsize=None)
+def peer_table(size: int) -> PeerTable:
+    geometry = BoardGeometry.for_size(size)
+    positions = tuple(Position(*geometry.position(cell)) for cell in range(geometry.cells))
+    peers = tuple(tuple(positions[peer] for peer in geometry.peers[cell]) for cell in range(geometry.cells))
+    peer_masks = tuple(sum(1 << peer for peer in geometry.peers[cell]) for cell in range(geometry.cells))
+    return PeerTable(positions, peers, geometry.peers, peer_masks)
+
+
+SYMBOLS = "0123456789ABCDEFGHIJKLMNOP"
+
+
+def format_values(values: Iterable[int]) -> str:
+    return "".join(SYMBOLS[val] for val in values)
+
+
+def note_digits(notes: int) -> list[int]:
+    digits = []
+    while notes:
+        low = notes & -notes
+        digits.append(low.bit_length())
+        notes ^= low
+    return digits
+
+
+@dataclass(frozen=True, slots=True)
 class Position:
     row: int = -1
     col: int = -1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Value:
     row: int = 0
     col: int = 0
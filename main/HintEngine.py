@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .CandidateGrid import CandidateGrid
+from .GameBoard import GameBoard, Position
+from .Techniques import Technique, TechniqueFinder
+
+
+@dataclass(frozen=True)
+class Hint:
+    row: int
+    col: int
+    number: int
+    technique: Technique
+    reasons: tuple[Position, ...] = ()
+
+
+class HintEngine:
+    __finder: TechniqueFinder = None
+    __grid: CandidateGrid = None
+    __hint: Hint | None = None
+
+    def __init__(self, board: GameBoard, finder: TechniqueFinder = None):
+        self.__finder = finder if finder is not None else TechniqueFinder()
+        self.__board = board
+        self.__grid = CandidateGrid(board.get_board())
+
+    def place(self, row: int, col: int, num: int):
+        cell = self.__grid.geometry.cell(row, col)
+        if self.__grid.values[cell] == 0:
+            self.__grid.place(cell, num)
+            self.__hint = None
+
+    def hint(self) -> Hint | None:
+        if self.__hint is None and not self.__grid.is_solved():
+            self.__hint = self.__find_hint()
+        return self.__hint
+
+    def __find_hint(self) -> Hint:
+        grid = self.__grid
+        hardest = None
+        reasons: list[int] = []
+        while True:
+            deduction = self.__finder.find(grid)
+            if deduction is None:
+                return self.__guess()
+
+            if hardest is None or deduction.technique.weight() > hardest.weight():
+                hardest = deduction.technique
+            reasons.extend(cell for cell in deduction.reasons if cell not in reasons)
+            if deduction.placements:
+                cell, num = deduction.placements[0]
+                return self.__to_hint(cell, num, hardest, reasons)
+
+            # Eliminations stay true for the rest of the game, so they are kept
+            # in the grid and the next hint starts from the narrowed candidates.
+            deduction.apply_to(grid)
+
+    def __guess(self) -> Hint:
+        grid = self.__grid
+        open_cells = [cell for cell in range(grid.geometry.cells) if grid.values[cell] == 0]
+        cell = min(open_cells, key=lambda c: grid.candidates[c].bit_count())
+        row, col = grid.geometry.position(cell)
+        num = next(num for (r, c, num) in self.__board.get_moves() if (r, c) == (row, col))
+        return Hint(row, col, num, Technique.GUESS)
+
+    def __to_hint(self, cell: int, num: int, technique: Technique, reasons: list[int]) -> Hint:
+        geometry = self.__grid.geometry
+        row, col = geometry.position(cell)
+        return Hint(row, col, num, technique, tuple(Position(*geometry.position(r)) for r in reasons if r != cell))
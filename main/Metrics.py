@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from threading import Lock
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+DESCRIPTIONS = {
+    "sudoku_place_number_calls_total": "Calls to BoardFactoryImpl.place_number, including recursion.",
+    "sudoku_place_number_backtracks_total": "Placements undone by place_number.",
+    "sudoku_place_number_max_depth": "Deepest place_number recursion observed.",
+    "sudoku_is_valid_place_probes_total": "Calls to BoardFactoryImpl.is_valid_place.",
+    "sudoku_carve_attempts_total": "Clue groups (a cell or a symmetric pair) PuzzleCarver tried to remove.",
+    "sudoku_carve_rejections_total": "Clue groups PuzzleCarver put back because the puzzle lost uniqueness.",
+    "sudoku_carve_solver_checks_total": "Uniqueness checks that needed the solver.",
+    "sudoku_start_new_game_seconds": "Wall time of Sudoku.start_new_game.",
+    "sudoku_guess_number_seconds": "Wall time of Sudoku.guess_number.",
+}
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class MetricsRegistry:
+    enabled: bool = False
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.__counters: dict[str, int] = {}
+        self.__gauges: dict[str, float] = {}
+        self.__histograms: dict[str, Histogram] = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self.__lock:
+            self.__counters.clear()
+            self.__gauges.clear()
+            self.__histograms.clear()
+
+    def increment(self, name: str, amount: int = 1):
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + amount
+
+    def observe_max(self, name: str, value: float):
+        with self.__lock:
+            if value > self.__gauges.get(name, float("-inf")):
+                self.__gauges[name] = value
+
+    def observe(self, name: str, value: float):
+        with self.__lock:
+            histogram = self.__histograms.get(name)
+            if histogram is None:
+                histogram = self.__histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def counter(self, name: str) -> int:
+        return self.__counters.get(name, 0)
+
+    def gauge(self, name: str) -> float | None:
+        return self.__gauges.get(name)
+
+    def histogram(self, name: str) -> Histogram | None:
+        return self.__histograms.get(name)
+
+    def snapshot(self) -> dict:
+        with self.__lock:
+            return {
+                "counters": dict(self.__counters),
+                "gauges": dict(self.__gauges),
+                "histograms": {name: {"buckets": list(h.buckets), "counts": list(h.counts),
+                                      "count": h.count, "sum": h.sum}
+                               for name, h in self.__histograms.items()},
+            }
+
+
+def to_json(registry: MetricsRegistry) -> str:
+    return json.dumps(registry.snapshot(), indent=2, sort_keys=True)
+
+
+def to_prometheus(registry: MetricsRegistry) -> str:
+    snapshot = registry.snapshot()
+    lines = []
+    for name, value in sorted(snapshot["counters"].items()):
+        _describe(lines, name, "counter")
+        lines.append(f"{name} {value}")
+
+    for name, value in sorted(snapshot["gauges"].items()):
+        _describe(lines, name, "gauge")
+        lines.append(f"{name} {_format_number(value)}")
+
+    for name, histogram in sorted(snapshot["histograms"].items()):
+        _describe(lines, name, "histogram")
+        cumulative = 0
+        for bound, count in zip(histogram["buckets"], histogram["counts"]):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{_format_number(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {histogram["count"]}')
+        lines.append(f"{name}_sum {_format_number(histogram['sum'])}")
+        lines.append(f"{name}_count {histogram['count']}")
+
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _describe(lines: list[str], name: str, kind: str):
+    description = DESCRIPTIONS.get(name)
+    if description is not None:
+        lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+metrics = MetricsRegistry()
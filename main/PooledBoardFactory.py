@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+from collections import deque
+from threading import Condition, Thread
+from typing import Callable, Iterator
+
+from .BoardFactory import BoardFactory, Difficulty, GenerationReport
+from .GameBoard import GameBoard
+
+logger = logging.getLogger(__name__)
+
+
+class PooledBoardFactory(BoardFactory):
+    __factory: BoardFactory = None
+    __queues: dict[Difficulty, deque[GameBoard]]
+    __filling: set[Difficulty]
+    __low_watermark: int
+    __high_watermark: int
+    __hits: int = 0
+    __misses: int = 0
+    __closed: bool = False
+
+    def __init__(self, factory: BoardFactory,
+                 difficulties: tuple[Difficulty, ...] = (Difficulty.EASY, Difficulty.MEDIUM, Difficulty.HARD),
+                 low_watermark: int = 2, high_watermark: int = 5):
+        if not 0 < low_watermark <= high_watermark:
+            raise ValueError("Watermarks must satisfy 0 < low_watermark <= high_watermark")
+
+        self.__factory = factory
+        self.__queues = {difficulty: deque() for difficulty in difficulties}
+        self.__filling = set(difficulties)
+        self.__low_watermark = low_watermark
+        self.__high_watermark = high_watermark
+        self.__condition = Condition()
+        self.__worker = Thread(target=self.__refill, name="board-pool-refill", daemon=True)
+        self.__worker.start()
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        with self.__condition:
+            queue = self.__queues.get(difficulty)
+            if queue:
+                self.__hits += 1
+                board = queue.popleft()
+                if len(queue) < self.__low_watermark:
+                    self.__filling.add(difficulty)
+                    self.__condition.notify()
+                return board
+
+            self.__misses += 1
+            if queue is not None:
+                self.__filling.add(difficulty)
+                self.__condition.notify()
+
+        return self.__factory.generate_board(difficulty)
+
+    def generate_boards(self, count: int, difficulty: Difficulty, workers: int = None, chunk_size: int = 64,
+                        seed: int = None, report: Callable[[GenerationReport], None] = None) -> Iterator[GameBoard]:
+        return self.__factory.generate_boards(count, difficulty, workers, chunk_size, seed, report)
+
+    def hits(self) -> int:
+        return self.__hits
+
+    def misses(self) -> int:
+        return self.__misses
+
+    def pool_size(self, difficulty: Difficulty) -> int:
+        with self.__condition:
+            return len(self.__queues.get(difficulty, ()))
+
+    def close(self):
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__worker.join()
+
+    def __refill(self):
+        while True:
+            with self.__condition:
+                difficulty = self.__next_to_fill()
+                while difficulty is None and not self.__closed:
+                    self.__condition.wait()
+                    difficulty = self.__next_to_fill()
+                if self.__closed:
+                    return
+
+            try:
+                board = self.__factory.generate_board(difficulty)
+            except Exception:
+                # Stop refilling this difficulty until a consumer asks for it again,
+                # so a factory that keeps failing does not spin the thread.
+                logger.exception("Refilling the %s board pool failed", difficulty.name)
+                with self.__condition:
+                    self.__filling.discard(difficulty)
+                continue
+
+            with self.__condition:
+                self.__queues[difficulty].append(board)
+
+    def __next_to_fill(self) -> Difficulty | None:
+        for difficulty in list(self.__filling):
+            if len(self.__queues[difficulty]) >= self.__high_watermark:
+                self.__filling.discard(difficulty)
+            else:
+                return difficulty
+
+        return None
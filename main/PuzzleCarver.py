@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from enum import Enum
+from random import Random, shuffle
+
+from .BoardConstraints import BoardConstraints
+from .Metrics import metrics
+from .solver.DancingLinksSolver import DancingLinksSolver
+from .solver.Solver import Solver
+
+
+class Symmetry(Enum):
+    NONE = 0
+    ROTATIONAL = 1
+    MIRROR = 2
+    DIAGONAL = 3
+
+    def partner(self, row: int, col: int, size: int) -> (int, int):
+        if self is Symmetry.ROTATIONAL:
+            return size - 1 - row, size - 1 - col
+        elif self is Symmetry.MIRROR:
+            return row, size - 1 - col
+        elif self is Symmetry.DIAGONAL:
+            return col, row
+        else:
+            return row, col
+
+
+class PuzzleCarver:
+    __solver: Solver = None
+    __symmetry: Symmetry = Symmetry.NONE
+
+    def __init__(self, solver: Solver = None, symmetry: Symmetry = Symmetry.NONE):
+        self.__solver = solver if solver is not None else DancingLinksSolver()
+        self.__symmetry = symmetry
+
+    def get_symmetry(self) -> Symmetry:
+        return self.__symmetry
+
+    def carve(self, board: list[list[int]], empty_squares: int, rng: Random = None) -> set[(int, int, int)]:
+        if empty_squares <= 0:
+            return set([])
+
+        groups = self.__groups(len(board))
+        if rng is not None:
+            rng.shuffle(groups)
+        else:
+            shuffle(groups)
+
+        constraints = BoardConstraints.from_board(board)
+        removed = set([])
+        attempts = 0
+        rejections = 0
+        for group in groups:
+            if len(removed) >= empty_squares:
+                break
+            if len(removed) + len(group) > empty_squares:
+                continue
+            attempts += 1
+
+            cells = [(row, col, board[row][col]) for (row, col) in group]
+            for (row, col, val) in cells:
+                board[row][col] = 0
+                constraints.remove(row, col, val)
+            if self.__still_unique(board, constraints, cells):
+                removed.update(cells)
+            else:
+                rejections += 1
+                for (row, col, val) in cells:
+                    board[row][col] = val
+                    constraints.place(row, col, val)
+
+        if metrics.enabled:
+            metrics.increment("sudoku_carve_attempts_total", attempts)
+            metrics.increment("sudoku_carve_rejections_total", rejections)
+        return removed
+
+    def __groups(self, size: int) -> list[tuple[(int, int), ...]]:
+        groups = []
+        for row in range(size):
+            for col in range(size):
+                partner = self.__symmetry.partner(row, col, size)
+                if partner == (row, col):
+                    groups.append(((row, col),))
+                elif (row, col) < partner:
+                    groups.append(((row, col), partner))
+        return groups
+
+    def __still_unique(self, board, constraints: BoardConstraints, cells: list[(int, int, int)]) -> bool:
+        # Every removed clue still being forced by its peers leaves the solution
+        # unchanged, so the solver is only needed when some cell gained a choice.
+        if all(constraints.candidates(row, col) == 1 << val for (row, col, val) in cells):
+            return True
+        else:
+            if metrics.enabled:
+                metrics.increment("sudoku_carve_solver_checks_total")
+            return self.__solver.count_solutions(board, 2) == 1
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from random import Random
+from typing import BinaryIO, Iterable
+
+from .BoardFactory import BoardFactory, Difficulty
+from .GameBoard import GameBoard
+
+
+class CorpusFormatError(Exception):
+    pass
+
+
+class PuzzleCorpus:
+    MAGIC = b'SDKC'
+    VERSION = 1
+    HEADER_SIZE = 4096
+    RECORD_SIZE = 128
+    BOARD_SIZE = 9
+    __header = struct.Struct('<4sHHHH')
+    __index_entry = struct.Struct('<B7xQQ')
+    __packed_size = (BOARD_SIZE * BOARD_SIZE + 1) // 2
+
+    def __init__(self, path: str):
+        self.__file = open(path, 'rb')
+        try:
+            self.__data = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__file.close()
+            raise CorpusFormatError(f"{path} is empty")
+        try:
+            self.__sections = self.decode_header(self.__data[:self.HEADER_SIZE])
+        except CorpusFormatError:
+            self.close()
+            raise
+
+    def count(self, difficulty: Difficulty) -> int:
+        return self.__sections.get(difficulty, (0, 0))[1]
+
+    def get(self, difficulty: Difficulty, index: int) -> GameBoard:
+        offset, count = self.__sections.get(difficulty, (0, 0))
+        if not 0 <= index < count:
+            raise IndexError(f"{difficulty.name} puzzle {index} out of range, corpus holds {count}")
+
+        start = offset + index * self.RECORD_SIZE
+        return self.decode_record(self.__data[start:start + self.RECORD_SIZE])[0]
+
+    def close(self):
+        self.__data.close()
+        self.__file.close()
+
+    def __enter__(self) -> PuzzleCorpus:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @classmethod
+    def encode_header(cls, counts: dict[Difficulty, int]) -> bytes:
+        header = cls.__header.pack(cls.MAGIC, cls.VERSION, cls.RECORD_SIZE, cls.BOARD_SIZE, len(counts))
+        offset = cls.HEADER_SIZE
+        for difficulty, count in counts.items():
+            header += cls.__index_entry.pack(difficulty.value, offset, count)
+            offset += count * cls.RECORD_SIZE
+
+        if len(header) > cls.HEADER_SIZE:
+            raise CorpusFormatError("Too many sections for the corpus header")
+        return header.ljust(cls.HEADER_SIZE, b'\0')
+
+    @classmethod
+    def decode_header(cls, header: bytes) -> dict[Difficulty, (int, int)]:
+        if len(header) < cls.HEADER_SIZE:
+            raise CorpusFormatError("Corpus header is truncated")
+        magic, version, record_size, board_size, sections = cls.__header.unpack_from(header)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise CorpusFormatError("Not a puzzle corpus or unsupported version")
+        if record_size != cls.RECORD_SIZE or board_size != cls.BOARD_SIZE:
+            raise CorpusFormatError(f"Unsupported record layout {record_size} bytes for {board_size}x{board_size}")
+
+        index = {}
+        for i in range(sections):
+            value, offset, count = cls.__index_entry.unpack_from(header, cls.__header.size + i * cls.__index_entry.size)
+            index[cls.__difficulty(value)] = (offset, count)
+        return index
+
+    @classmethod
+    def encode_record(cls, board: GameBoard, difficulty: Difficulty) -> bytes:
+        grid = board.get_board()
+        if len(grid) != cls.BOARD_SIZE:
+            raise CorpusFormatError(f"Corpus records hold {cls.BOARD_SIZE}x{cls.BOARD_SIZE} boards, "
+                                    f"not {len(grid)}x{len(grid)}")
+
+        givens = [val for row in grid for val in row]
+        solution = givens[:]
+        for (row, col, val) in board.get_moves():
+            solution[row * cls.BOARD_SIZE + col] = val
+
+        if any(not 0 <= val <= cls.BOARD_SIZE for val in solution):
+            raise CorpusFormatError(f"Corpus records hold values between 0 and {cls.BOARD_SIZE}")
+
+        record = cls.__pack(givens) + cls.__pack(solution) + bytes([difficulty.value])
+        return record.ljust(cls.RECORD_SIZE, b'\0')
+
+    @classmethod
+    def decode_record(cls, record: bytes) -> (GameBoard, Difficulty):
+        givens = cls.__unpack(record[:cls.__packed_size])
+        solution = cls.__unpack(record[cls.__packed_size:2 * cls.__packed_size])
+        difficulty = cls.__difficulty(record[2 * cls.__packed_size])
+
+        size = cls.BOARD_SIZE
+        board = [givens[row * size:(row + 1) * size] for row in range(size)]
+        moves = {(i // size, i % size, solution[i]) for i in range(size * size) if givens[i] == 0}
+        return GameBoard(board, moves), difficulty
+
+    @staticmethod
+    def __difficulty(value: int) -> Difficulty:
+        try:
+            return Difficulty(value)
+        except ValueError:
+            raise CorpusFormatError(f"Unknown difficulty {value} in corpus") from None
+
+    @staticmethod
+    def __pack(values: list[int]) -> bytes:
+        if len(values) % 2:
+            values = values + [0]
+        return bytes((values[i] << 4) | values[i + 1] for i in range(0, len(values), 2))
+
+    @classmethod
+    def __unpack(cls, packed: bytes) -> list[int]:
+        values = []
+        for byte in packed:
+            values.append(byte >> 4)
+            values.append(byte & 0x0f)
+        return values[:cls.BOARD_SIZE * cls.BOARD_SIZE]
+
+
+class PuzzleCorpusWriter:
+
+    def __init__(self, path: str):
+        self.__file: BinaryIO = open(path, 'wb')
+        self.__counts: dict[Difficulty, int] = {}
+        self.__file.write(PuzzleCorpus.encode_header({}))
+
+    def write_section(self, difficulty: Difficulty, boards: Iterable[GameBoard]):
+        if difficulty in self.__counts:
+            raise CorpusFormatError(f"{difficulty.name} section already written")
+
+        count = 0
+        for board in boards:
+            self.__file.write(PuzzleCorpus.encode_record(board, difficulty))
+            count += 1
+        self.__counts[difficulty] = count
+
+    def close(self):
+        self.__file.seek(0)
+        self.__file.write(PuzzleCorpus.encode_header(self.__counts))
+        self.__file.close()
+
+    def __enter__(self) -> PuzzleCorpusWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class CorpusBoardFactory(BoardFactory):
+
+    def __init__(self, corpus: PuzzleCorpus, rng: Random = None):
+        self.__corpus = corpus
+        self.__rng = rng if rng is not None else Random()
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        count = self.__corpus.count(difficulty)
+        if count == 0:
+            raise LookupError(f"Corpus has no {difficulty.name} puzzles")
+
+        return self.__corpus.get(difficulty, self.__rng.randrange(count))
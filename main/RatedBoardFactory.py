@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from .BoardFactory import BoardFactory, Difficulty
+from .DifficultyGrader import DifficultyGrader
+from .GameBoard import GameBoard
+
+
+class RatingBandError(Exception):
+    pass
+
+
+class RatedBoardFactory(BoardFactory):
+    __factory: BoardFactory = None
+    __grader: DifficultyGrader = None
+    __bands: dict[Difficulty, (float, float)]
+    __max_attempts: int
+
+    def __init__(self, factory: BoardFactory, bands: dict[Difficulty, (float, float)] = None,
+                 grader: DifficultyGrader = None, max_attempts: int = 200):
+        self.__factory = factory
+        self.__bands = dict(bands) if bands is not None else {}
+        self.__grader = grader if grader is not None else DifficultyGrader()
+        self.__max_attempts = max_attempts
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        if difficulty in self.__bands:
+            low, high = self.__bands[difficulty]
+            return self.generate_rated_board(difficulty, low, high)
+        else:
+            return self.__factory.generate_board(difficulty)
+
+    def generate_rated_board(self, difficulty: Difficulty, low: float, high: float) -> GameBoard:
+        for _ in range(self.__max_attempts):
+            board = self.__factory.generate_board(difficulty)
+            if low <= self.__grader.grade(board.get_board()).rating <= high:
+                return board
+
+        raise RatingBandError(f"No {difficulty.name} board rated between {low} and {high} "
+                              f"after {self.__max_attempts} attempts")
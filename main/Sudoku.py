@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from math import isqrt
+from time import perf_counter
 from main.BoardFactory import BoardFactory, Difficulty
 from main.GameBoard import GameBoard, Position
+from main.HintEngine import Hint, HintEngine
+from main.Metrics import metrics
 
 
 class Sudoku:
     __started: bool = False
     __board_factory: BoardFactory = None
     __user_board: GameBoard = None
+    __hints: HintEngine = None
     __wrong_guesses: [Guess]
     __right_guesses: [Guess]
 
@@ -21,6 +26,15 @@ class Sudoku:
         return self.__started
 
     def guess_number(self, guess: Guess):
+        if metrics.enabled:
+            started = perf_counter()
+            try:
+                return self.__guess_number(guess)
+            finally:
+                metrics.observe("sudoku_guess_number_seconds", perf_counter() - started)
+        return self.__guess_number(guess)
+
+    def __guess_number(self, guess: Guess):
         if guess in self.__right_guesses:
             return True
         elif guess in self.__wrong_guesses:
@@ -31,6 +45,8 @@ class Sudoku:
     def __process_new_guess(self, guess):
         if self.__user_board.guess(guess.row, guess.col, guess.number):
             self.__right_guesses.append(guess)
+            if self.__hints is not None:
+                self.__hints.place(guess.row, guess.col, guess.number)
             return True
         else:
             self.__wrong_guesses.append(guess)
@@ -46,6 +62,25 @@ class Sudoku:
         else:
             return False
 
+    def toggle_note(self, row: int, col: int, num: int) -> int:
+        return self.__user_board.toggle_note(row, col, num)
+
+    def get_notes(self, row: int, col: int) -> int:
+        return self.__user_board.get_notes(row, col)
+
+    def get_hint(self) -> Hint | None:
+        if self.__user_board is None:
+            return None
+        if self.__hints is None:
+            self.__hints = HintEngine(self.__user_board)
+        return self.__hints.hint()
+
+    def get_size(self) -> int:
+        return self.__user_board.get_size()
+
+    def get_value(self, row: int, col: int) -> int:
+        return self.__user_board.get_value(row, col)
+
     def get_user_board(self) -> list[list[int]]:
         return self.__user_board.get_board()
 
@@ -56,10 +91,26 @@ class Sudoku:
         return BoardFormatter(self.__user_board.get_board()).format()
 
     def start_new_game(self, difficulty: Difficulty):
+        if self.__started:
+            raise IllegalStateException("Game already in progress.")
+        elif metrics.enabled:
+            started = perf_counter()
+            self.start_game(self.__board_factory.generate_board(difficulty))
+            metrics.observe("sudoku_start_new_game_seconds", perf_counter() - started)
+        else:
+            self.start_game(self.__board_factory.generate_board(difficulty))
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        return self.__board_factory.generate_board(difficulty)
+
+    def start_game(self, board: GameBoard):
         if self.__started:
             raise IllegalStateException("Game already in progress.")
         else:
-            self.__user_board = self.__board_factory.generate_board(difficulty)
+            self.__user_board = board
+            self.__hints = None
+            self.__right_guesses = []
+            self.__wrong_guesses = []
             self.__started = True
 
     def get_values(self):
@@ -77,34 +128,42 @@ class Guess:
 
 
 class BoardFormatter:
-    __header_footer = "=======================================\n"
-    __row_format = "| {0} | {1} | {2} || {3} | {4} | {5} || {6} | {7} | {8} |\n"
-    __cell_separator = "============||===========||============\n"
 
     def __init__(self, board: list[list[int]]):
         self.__board = board
+        self.__box = isqrt(len(board))
+        self.__width = len(str(len(board)))
 
     def format(self):
-        result: str = self.__header_footer
+        rows = [self.__format_row(row) for row in self.__board]
+        if not rows:
+            return ""
+
+        header_footer = "=" * len(rows[0]) + "\n"
+        cell_separator = "||".join("=" * len(part) for part in rows[0].split("||")) + "\n"
 
-        row_cnt: int = 0
-        for row in self.__board:
-            result += self.__row_format.format(*[self.__convert_to_str(x) for x in row])
+        result: str = header_footer
+        for row_cnt, row in enumerate(rows):
+            result += row + "\n"
             if self.__should_add_separator(row_cnt):
-                result += self.__cell_separator
-            row_cnt += 1
+                result += cell_separator
 
-        result += self.__header_footer
+        result += header_footer
         return result
 
+    def __format_row(self, row: list[int]) -> str:
+        boxes = [" | ".join(self.__convert_to_str(x) for x in row[start:start + self.__box])
+                 for start in range(0, len(row), self.__box)]
+        return "| " + " || ".join(boxes) + " |"
+
     def __should_add_separator(self, row_cnt):
-        return row_cnt == 2 or row_cnt == 5
+        return (row_cnt + 1) % self.__box == 0 and row_cnt != len(self.__board) - 1
 
     def __convert_to_str(self, x: int) -> str:
         if x == 0:
-            return ' '
+            return ' ' * self.__width
         else:
-            return str(x)
+            return str(x).rjust(self.__width)
 
 
 class IllegalStateException(Exception):
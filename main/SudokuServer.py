@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+
+from main.BoardFactory import BoardFactory, Difficulty
+from main.GameBoard import IllegalMoveError, format_values
+from main.Sudoku import Sudoku, Guess, IllegalStateException
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class SudokuSession:
+    __difficulty_mapping = {"easy": Difficulty.EASY, "medium": Difficulty.MEDIUM, "hard": Difficulty.HARD,
+                            "expert": Difficulty.EXPERT}
+    __sudoku: Sudoku = None
+
+    def __init__(self, board_factory: BoardFactory, executor: Executor = None):
+        self.__board_factory = board_factory
+        self.__executor = executor
+        self.__sudoku = Sudoku(board_factory)
+
+    async def handle(self, line: str) -> str:
+        parts = line.split()
+        if not parts:
+            raise ProtocolError("Empty command")
+
+        command, args = parts[0].upper(), parts[1:]
+        if command == "NEW":
+            return await self.__new_game(args)
+        elif command == "GUESS":
+            return self.__guess(args)
+        elif command == "BOARD":
+            self.__require_game()
+            return "BOARD " + self.__format_board()
+        elif command == "END":
+            self.__sudoku.end_game()
+            return "OK"
+        else:
+            raise ProtocolError(f"Unknown command {parts[0]}")
+
+    async def __new_game(self, args: list[str]) -> str:
+        if len(args) != 1 or args[0].lower() not in self.__difficulty_mapping:
+            raise ProtocolError("Usage: NEW easy|medium|hard|expert")
+        if self.__sudoku.game_started():
+            raise ProtocolError("Please end current game to start a new one.")
+
+        difficulty = self.__difficulty_mapping[args[0].lower()]
+        loop = asyncio.get_running_loop()
+        try:
+            board = await loop.run_in_executor(self.__executor, self.__board_factory.generate_board, difficulty)
+        except Exception as e:
+            raise ProtocolError(f"Could not generate a board: {e}")
+        try:
+            self.__sudoku.start_game(board)
+        except IllegalStateException as e:
+            raise ProtocolError(e.message)
+        return "BOARD " + self.__format_board()
+
+    def __guess(self, args: list[str]) -> str:
+        self.__require_game()
+        try:
+            row, col, num = (int(arg) for arg in args)
+        except ValueError:
+            raise ProtocolError("Usage: GUESS row col num")
+        size = self.__sudoku.get_size()
+        if not 1 <= num <= size:
+            raise ProtocolError(f"Number must be between 1 and {size}")
+
+        try:
+            correct = self.__sudoku.guess_number(Guess(row - 1, col - 1, num))
+        except IllegalMoveError:
+            raise ProtocolError(f"Row and column must be between 1 and {size}")
+
+        result = "CORRECT" if correct else "WRONG"
+        if self.__sudoku.game_over():
+            result += " WIN" if self.__sudoku.is_winner() else " LOSE"
+            self.__sudoku.end_game()
+        return result
+
+    def __require_game(self):
+        if not self.__sudoku.game_started():
+            raise ProtocolError("No game in progress")
+
+    def __format_board(self) -> str:
+        return format_values(val for row in self.__sudoku.get_user_board() for val in row)
+
+
+class SudokuServer:
+    __server: asyncio.AbstractServer = None
+
+    def __init__(self, board_factory: BoardFactory, executor: Executor = None, max_line: int = 256):
+        self.__board_factory = board_factory
+        self.__executor = executor
+        self.__max_line = max_line
+        self.__sessions = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self.__server = await asyncio.start_server(self.__handle_connection, host, port, limit=self.__max_line)
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self.__server:
+            await self.__server.serve_forever()
+
+    async def close(self):
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+    def session_count(self) -> int:
+        return self.__sessions
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = SudokuSession(self.__board_factory, self.__executor)
+        self.__sessions += 1
+        try:
+            while True:
+                try:
+                    raw = await reader.readline()
+                except ValueError:
+                    writer.write(b"ERROR Line too long\n")
+                    break
+                if not raw:
+                    break
+
+                try:
+                    line = raw.decode("ascii").strip()
+                except UnicodeDecodeError:
+                    writer.write(b"ERROR Commands must be ASCII\n")
+                    await writer.drain()
+                    continue
+                if line.upper() == "QUIT":
+                    writer.write(b"BYE\n")
+                    break
+
+                try:
+                    response = await session.handle(line)
+                except ProtocolError as e:
+                    response = f"ERROR {e}"
+                writer.write(response.encode("ascii", errors="replace") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+class SudokuClient:
+    __reader: asyncio.StreamReader = None
+    __writer: asyncio.StreamWriter = None
+
+    async def connect(self, host: str, port: int):
+        self.__reader, self.__writer = await asyncio.open_connection(host, port)
+
+    async def send(self, line: str) -> str:
+        self.__writer.write(line.encode("ascii") + b"\n")
+        await self.__writer.drain()
+        return (await self.__reader.readline()).decode("ascii").strip()
+
+    async def close(self):
+        self.__writer.close()
+        await self.__writer.wait_closed()
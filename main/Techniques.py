@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from itertools import combinations
+
+from .CandidateGrid import CandidateGrid
+
+
+class Technique(Enum):
+    NAKED_SINGLE = 1.0
+    HIDDEN_SINGLE = 1.5
+    LOCKED_CANDIDATES = 2.6
+    NAKED_PAIR = 3.0
+    X_WING = 3.2
+    HIDDEN_PAIR = 3.4
+    NAKED_TRIPLE = 3.6
+    SWORDFISH = 3.8
+    HIDDEN_TRIPLE = 4.0
+    GUESS = 10.0
+
+    def weight(self) -> float:
+        return self.value
+
+
+@dataclass(frozen=True)
+class Deduction:
+    technique: Technique
+    placements: tuple[(int, int), ...] = ()
+    eliminations: tuple[(int, int), ...] = ()
+    reasons: tuple[int, ...] = ()
+
+    def apply_to(self, grid: CandidateGrid):
+        for (cell, num) in self.eliminations:
+            grid.eliminate(cell, num)
+        for (cell, num) in self.placements:
+            if grid.values[cell] == 0:
+                grid.place(cell, num)
+
+
+class TechniqueFinder:
+    __techniques: tuple[Technique, ...]
+
+    def __init__(self, techniques: tuple[Technique, ...] = None):
+        if techniques is None:
+            techniques = tuple(technique for technique in Technique if technique is not Technique.GUESS)
+        self.__techniques = tuple(sorted(techniques, key=Technique.weight))
+        self.__finders = {
+            Technique.NAKED_SINGLE: self.__naked_single,
+            Technique.HIDDEN_SINGLE: self.__hidden_single,
+            Technique.LOCKED_CANDIDATES: self.__locked_candidates,
+            Technique.NAKED_PAIR: lambda grid: self.__naked_subset(grid, 2, Technique.NAKED_PAIR),
+            Technique.NAKED_TRIPLE: lambda grid: self.__naked_subset(grid, 3, Technique.NAKED_TRIPLE),
+            Technique.HIDDEN_PAIR: lambda grid: self.__hidden_subset(grid, 2, Technique.HIDDEN_PAIR),
+            Technique.HIDDEN_TRIPLE: lambda grid: self.__hidden_subset(grid, 3, Technique.HIDDEN_TRIPLE),
+            Technique.X_WING: lambda grid: self.__fish(grid, 2, Technique.X_WING),
+            Technique.SWORDFISH: lambda grid: self.__fish(grid, 3, Technique.SWORDFISH),
+        }
+
+    def __getstate__(self):
+        return self.__techniques
+
+    def __setstate__(self, techniques: tuple[Technique, ...]):
+        self.__init__(techniques)
+
+    def find(self, grid: CandidateGrid) -> Deduction | None:
+        for technique in self.__techniques:
+            deduction = self.__finders[technique](grid)
+            if deduction is not None:
+                return deduction
+
+        return None
+
+    def __naked_single(self, grid: CandidateGrid) -> Deduction | None:
+        single = grid.next_naked_single()
+        if single is None:
+            return None
+
+        cell, num = single
+        reasons = tuple(peer for peer in grid.geometry.peers[cell] if grid.values[peer])
+        return Deduction(Technique.NAKED_SINGLE, placements=((cell, num),), reasons=reasons)
+
+    def __hidden_single(self, grid: CandidateGrid) -> Deduction | None:
+        single = grid.next_hidden_single()
+        if single is None:
+            return None
+
+        cell, num, unit = single
+        reasons = []
+        for other in grid.geometry.units[unit]:
+            if other != cell and grid.values[other] == 0:
+                blocker = next((peer for peer in grid.geometry.peers[other] if grid.values[peer] == num), None)
+                if blocker is not None and blocker not in reasons:
+                    reasons.append(blocker)
+        return Deduction(Technique.HIDDEN_SINGLE, placements=((cell, num),), reasons=tuple(reasons))
+
+    def __locked_candidates(self, grid: CandidateGrid) -> Deduction | None:
+        geometry = grid.geometry
+        size, box = geometry.size, geometry.box
+        box_units = range(2 * size, 3 * size)
+        for unit in range(3 * size):
+            for num in range(1, size + 1):
+                positions = grid.places[unit * grid.stride + num]
+                if positions == 0 or positions & (positions - 1) == 0:
+                    continue
+                cells = [cell for index, cell in enumerate(geometry.units[unit]) if positions >> index & 1]
+                if unit in box_units:
+                    rows = {geometry.row_of[cell] for cell in cells}
+                    cols = {geometry.col_of[cell] for cell in cells}
+                    targets = []
+                    if len(rows) == 1:
+                        targets = geometry.units[rows.pop()]
+                    elif len(cols) == 1:
+                        targets = geometry.units[size + cols.pop()]
+                    outside = [cell for cell in targets if geometry.box_of[cell] != unit - 2 * size]
+                else:
+                    boxes = {geometry.box_of[cell] for cell in cells}
+                    if len(boxes) != 1:
+                        continue
+                    outside = [cell for cell in geometry.units[2 * size + boxes.pop()]
+                               if cell not in geometry.units[unit]]
+
+                eliminations = tuple((cell, num) for cell in outside if grid.candidates[cell] >> num & 1)
+                if eliminations:
+                    return Deduction(Technique.LOCKED_CANDIDATES, eliminations=eliminations, reasons=tuple(cells))
+
+        return None
+
+    def __naked_subset(self, grid: CandidateGrid, count: int, technique: Technique) -> Deduction | None:
+        for members in grid.geometry.units:
+            open_cells = [cell for cell in members if grid.candidates[cell]]
+            small = [cell for cell in open_cells if 2 <= grid.candidates[cell].bit_count() <= count]
+            for subset in combinations(small, count):
+                union = 0
+                for cell in subset:
+                    union |= grid.candidates[cell]
+                if union.bit_count() != count:
+                    continue
+
+                eliminations = tuple((cell, num) for cell in open_cells if cell not in subset
+                                     for num in self.__digits(grid.candidates[cell] & union))
+                if eliminations:
+                    return Deduction(technique, eliminations=eliminations, reasons=subset)
+
+        return None
+
+    def __hidden_subset(self, grid: CandidateGrid, count: int, technique: Technique) -> Deduction | None:
+        for unit, members in enumerate(grid.geometry.units):
+            base = unit * grid.stride
+            nums = [num for num in range(1, grid.stride)
+                    if 2 <= grid.places[base + num].bit_count() <= count]
+            for subset in combinations(nums, count):
+                positions = 0
+                for num in subset:
+                    positions |= grid.places[base + num]
+                if positions.bit_count() != count:
+                    continue
+
+                keep = sum(1 << num for num in subset)
+                cells = tuple(cell for index, cell in enumerate(members) if positions >> index & 1)
+                eliminations = tuple((cell, num) for cell in cells
+                                     for num in self.__digits(grid.candidates[cell] & ~keep))
+                if eliminations:
+                    return Deduction(technique, eliminations=eliminations, reasons=cells)
+
+        return None
+
+    def __fish(self, grid: CandidateGrid, count: int, technique: Technique) -> Deduction | None:
+        geometry = grid.geometry
+        size = geometry.size
+        for base, cover in ((0, size), (size, 0)):
+            for num in range(1, size + 1):
+                lines = [line for line in range(size)
+                         if 2 <= grid.places[(base + line) * grid.stride + num].bit_count() <= count]
+                for subset in combinations(lines, count):
+                    positions = 0
+                    for line in subset:
+                        positions |= grid.places[(base + line) * grid.stride + num]
+                    if positions.bit_count() != count:
+                        continue
+
+                    covered = [index for index in range(size) if positions >> index & 1]
+                    eliminations = tuple((cell, num) for index in covered
+                                         for line, cell in enumerate(geometry.units[cover + index])
+                                         if line not in subset and grid.candidates[cell] >> num & 1)
+                    if eliminations:
+                        reasons = tuple(geometry.units[base + line][index] for line in subset for index in covered
+                                        if grid.candidates[geometry.units[base + line][index]] >> num & 1)
+                        return Deduction(technique, eliminations=eliminations, reasons=reasons)
+
+        return None
+
+    def __digits(self, mask: int) -> list[int]:
+        digits = []
+        while mask:
+            low = mask & -mask
+            digits.append(low.bit_length() - 1)
+            mask ^= low
+        return digits
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from math import isqrt
+from random import choice, random, shuffle
+
+from .BoardFactory import BoardFactory, BoardFactoryImpl, Difficulty
+from .GameBoard import GameBoard
+from .PuzzleCarver import PuzzleCarver
+
+
+class TransformBoardFactory(BoardFactory):
+    __seeds: list[list[list[int]]]
+    __carver: PuzzleCarver = None
+
+    def __init__(self, seeds: list[list[list[int]]] = None, carver: PuzzleCarver = None, bank_size: int = 8):
+        if seeds is None:
+            factory = BoardFactoryImpl()
+            seeds = [factory.generate_board(Difficulty.OFF).get_board() for _ in range(bank_size)]
+        elif not seeds:
+            raise ValueError("At least one seed grid is required")
+
+        self.__seeds = [[row[:] for row in seed] for seed in seeds]
+        self.__carver = carver if carver is not None else PuzzleCarver()
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        board = self.random_grid()
+        return GameBoard(board, self.__carver.carve(board, difficulty.empty_squares(len(board))))
+
+    def random_grid(self) -> list[list[int]]:
+        grid = choice(self.__seeds)
+        size = len(grid)
+        rows = self.__line_order(size)
+        cols = self.__line_order(size)
+        digits = list(range(1, size + 1))
+        shuffle(digits)
+        relabel = [0] + digits
+
+        if random() < 0.5:
+            return [[relabel[grid[row][col]] for col in cols] for row in rows]
+        else:
+            return [[relabel[grid[row][col]] for row in rows] for col in cols]
+
+    def __line_order(self, size: int) -> list[int]:
+        box = isqrt(size)
+        bands = list(range(box))
+        shuffle(bands)
+        order = []
+        for band in bands:
+            lines = list(range(band * box, (band + 1) * box))
+            shuffle(lines)
+            order.extend(lines)
+        return order
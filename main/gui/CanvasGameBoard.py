@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import tkinter.messagebox
+from concurrent.futures import ThreadPoolExecutor
+from math import isqrt
+from tkinter import *
+from tkinter import ttk
+from typing import Callable
+
+from main.BoardFactory import BoardFactoryImpl
+from main.BoardPresenter import SudokuPresenter
+from main.GameBoard import SYMBOLS, note_digits
+from main.PooledBoardFactory import PooledBoardFactory
+from main.Sudoku import Sudoku
+from main.gui.GuiRunner import CallbackQueue, GenerationStatus, MenuBar, StartButtons
+from main.gui.SudokuViewInterface import SudokuViewInterface, CellChange, CellStyle
+
+
+def cell_at(x: int, y: int, cell_px: int, margin: int) -> (int, int):
+    return (y - margin) // cell_px, (x - margin) // cell_px
+
+
+class CanvasGameBoard(SudokuViewInterface):
+    __cell_px = 48
+    __margin = 3
+    __backgrounds = {CellStyle.NORMAL: '#ffffff', CellStyle.HIGHLIGHTED: '#848788', CellStyle.ACTIVE: '#ccffff'}
+    __root: Tk = None
+    __canvas: Canvas = None
+    __presenter: SudokuPresenter = None
+    __start_buttons: StartButtons = None
+    __generation_status: GenerationStatus = None
+    __callbacks: CallbackQueue = None
+    __size = 9
+    __active: (int, int) = None
+
+    def __init__(self, root: Tk, sudoku: Sudoku = None, size: int = 9):
+        self.__root = root
+        self.__size = size
+        self.__callbacks = CallbackQueue(root)
+        self.__presenter = SudokuPresenter(self, sudoku if sudoku is not None
+                                           else Sudoku(PooledBoardFactory(BoardFactoryImpl())),
+                                           lambda: ThreadPoolExecutor(1, thread_name_prefix="board-generator"))
+        self.__root.title("Sudoku")
+        self.__root.option_add('*tearOff', FALSE)
+        self.__menu_bar = MenuBar(self.__root, self.__presenter)
+        self.__root.configure(menu=self.__menu_bar)
+        ttk.Style().configure('Difficulty.TButton', font="Times 16")
+
+        cells = size * size
+        self.__values = [""] * cells
+        self.__notes: list[str] = [""] * cells
+        self.__colors = ['#000000'] * cells
+        self.__styles = [CellStyle.NORMAL] * cells
+        self.__setup_game_board()
+
+    def set_grid_value(self, row: int, col: int, num: str):
+        if self.__on_board(row, col):
+            self.__set_value(row * self.__size + col, num)
+
+    def disable_start_button(self) -> None:
+        self.__start_buttons.disable()
+
+    def set_cell_font_color(self, row: int, col: int, color: str):
+        if self.__on_board(row, col):
+            self.__set_color(row * self.__size + col, color)
+
+    def set_cell_notes(self, row: int, col: int, notes: list[int]):
+        if self.__on_board(row, col):
+            self.__set_notes(row * self.__size + col, notes)
+
+    def show_acknowledge_dialog(self, title: str, msg: str):
+        tkinter.messagebox.showinfo(title=title, message=msg)
+
+    def activate(self, row: int, col: int):
+        if self.__on_board(row, col):
+            self.__set_style(row, col, CellStyle.ACTIVE)
+
+    def deactivate(self, row: int, col: int):
+        if self.__on_board(row, col):
+            self.__set_style(row, col, CellStyle.NORMAL)
+
+    def highlight(self, row: int, col: int):
+        if self.__on_board(row, col):
+            self.__set_style(row, col, CellStyle.HIGHLIGHTED)
+
+    def unhighlight(self, row: int, col: int):
+        if self.__on_board(row, col):
+            self.__set_style(row, col, CellStyle.NORMAL)
+
+    def show_generating(self, generating: bool):
+        if generating:
+            self.__generation_status.show()
+        else:
+            self.__generation_status.hide()
+
+    def post(self, callback: Callable[[], None]):
+        self.__callbacks.put(callback)
+
+    def apply_changes(self, changes: list[CellChange]):
+        size = self.__size
+        for change in changes:
+            if not self.__on_board(change.row, change.col):
+                continue
+            cell = change.row * size + change.col
+            if change.value is not None:
+                self.__set_value(cell, change.value)
+            if change.color is not None:
+                self.__set_color(cell, change.color)
+            if change.notes is not None:
+                self.__set_notes(cell, note_digits(change.notes))
+            if change.style is not None:
+                self.__set_style(change.row, change.col, change.style)
+
+    def enable_end_game_button(self) -> None:
+        self.__menu_bar.enable_end_game_option()
+
+    def disable_end_game_button(self) -> None:
+        self.__menu_bar.disable_end_game_option()
+
+    def enable_start_button(self) -> None:
+        self.__start_buttons.enable()
+
+    def get_presenter(self) -> SudokuPresenter:
+        return self.__presenter
+
+    def run(self):
+        self.__root.mainloop()
+
+    def __setup_game_board(self):
+        mainframe = ttk.Frame(self.__root)
+        mainframe.grid(column=0, row=0, pady=5, padx=5)
+        width = self.__size * self.__cell_px + 2 * self.__margin
+        self.__canvas = Canvas(mainframe, width=width, height=width, highlightthickness=0, background='#ffffff')
+        self.__canvas.grid(column=0, row=0, padx=5, pady=5)
+        self.__canvas.bind("<Button-1>", self.__click_handler)
+        self.__canvas.bind("<Key>", self.__key_press_handler)
+        self.__start_buttons = StartButtons(mainframe, self.__presenter)
+        self.__start_buttons.grid(row=2, column=0, columnspan=3, rowspan=2)
+        self.__generation_status = GenerationStatus(mainframe, self.__presenter)
+        self.__generation_status.grid(row=4, column=0, columnspan=3, pady=5)
+        self.__generation_status.hide()
+        self.__draw_grid()
+        self.disable_end_game_button()
+
+    def __draw_grid(self):
+        canvas, size, px, margin = self.__canvas, self.__size, self.__cell_px, self.__margin
+        for row in range(size):
+            for col in range(size):
+                x, y = margin + col * px, margin + row * px
+                tag = f"c{row * size + col}"
+                canvas.create_rectangle(x, y, x + px, y + px, fill=self.__backgrounds[CellStyle.NORMAL],
+                                        outline='#000000', tags=(tag, tag + "bg"))
+                canvas.create_text(x + px // 2, y + px // 2, text="", font="Times 16", tags=(tag, tag + "value"))
+                canvas.create_text(x + px // 2, y + px // 2, text="", font="Times 7", tags=(tag, tag + "notes"))
+
+        box = isqrt(size)
+        end = margin + size * px
+        for line in range(0, size + 1, box):
+            offset = margin + line * px
+            canvas.create_line(margin, offset, end, offset, width=3)
+            canvas.create_line(offset, margin, offset, end, width=3)
+
+    def __set_value(self, cell: int, value: str):
+        if self.__notes[cell]:
+            self.__notes[cell] = ""
+            self.__canvas.itemconfigure(f"c{cell}notes", text="")
+        if self.__values[cell] != value:
+            self.__values[cell] = value
+            self.__canvas.itemconfigure(f"c{cell}value", text=value)
+
+    def __set_notes(self, cell: int, notes: list[int]):
+        text = ""
+        if notes:
+            box = isqrt(self.__size)
+            rows = [" ".join(SYMBOLS[n] if n in notes else " " for n in range(start, start + box))
+                    for start in range(1, self.__size + 1, box)]
+            text = "\n".join(rows)
+            self.__set_value(cell, "")
+        if self.__notes[cell] != text:
+            self.__notes[cell] = text
+            self.__canvas.itemconfigure(f"c{cell}notes", text=text)
+
+    def __set_color(self, cell: int, color: str):
+        if self.__colors[cell] != color:
+            self.__colors[cell] = color
+            self.__canvas.itemconfigure(f"c{cell}value", fill=color)
+
+    def __set_style(self, row: int, col: int, style: CellStyle):
+        cell = row * self.__size + col
+        if style is CellStyle.ACTIVE:
+            self.__active = (row, col)
+            self.__canvas.focus_set()
+        elif self.__active == (row, col):
+            self.__active = None
+        if self.__styles[cell] is not style:
+            self.__styles[cell] = style
+            self.__canvas.itemconfigure(f"c{cell}bg", fill=self.__backgrounds[style])
+
+    def __click_handler(self, event: Event):
+        row, col = cell_at(event.x, event.y, self.__cell_px, self.__margin)
+        if not self.__on_board(row, col):
+            return
+        value = self.__values[row * self.__size + col]
+        self.__presenter.select(row, col, SYMBOLS.find(value) if value.strip() else 0)
+
+    def __key_press_handler(self, event: Event):
+        if self.__active is None:
+            return
+        row, col = self.__active
+        char: str = event.char
+        number = self.__symbol_value(event.keysym)
+        if event.state & 0x4 and number:
+            self.__presenter.toggle_note(row, col, str(number))
+        elif char == "?" or char == "h" and not number:
+            self.__presenter.show_hint()
+        elif number:
+            self.__set_value(row * self.__size + col, SYMBOLS[number])
+            self.__presenter.guess_number(row, col, str(number))
+
+    def __symbol_value(self, keysym: str) -> int:
+        if len(keysym) != 1:
+            return 0
+        number = SYMBOLS.find(keysym.upper())
+        return number if 0 < number <= self.__size else 0
+
+    def __on_board(self, row: int, col: int) -> bool:
+        return 0 <= row < self.__size and 0 <= col < self.__size
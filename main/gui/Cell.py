@@ -9,6 +9,7 @@ class Cell:
     __presenter: SudokuPresenter = None
     __row: int
     __column: int
+    __showing_notes: bool = False
 
     def __init__(self, row: int, col: int, parent: Frame, presenter: SudokuPresenter):
         self.__row = row
@@ -31,9 +32,13 @@ class Cell:
 
     def __key_press_handler(self, event: Event):
         char: str = event.char
-        if char.isdigit() and char != "0":
+        if event.state & 0x4 and event.keysym.isdigit() and event.keysym != "0":
+            self.__presenter.toggle_note(self.__row, self.__column, event.keysym)
+        elif char.isdigit() and char != "0":
             self.__label.configure(text=char)
             self.__presenter.guess_number(self.__row, self.__column, char)
+        elif char in ("h", "?"):
+            self.__presenter.show_hint()
 
     def __click_handler(self, event: Event):
         num = 0
@@ -52,7 +57,17 @@ class Cell:
         self.__label['style'] = 'TLabel'
 
     def set_value(self, value: str):
-        self.__label.configure(text=value)
+        self.__showing_notes = False
+        self.__label.configure(text=value, font="Times 16")
+
+    def set_notes(self, notes: list[int]):
+        if notes:
+            self.__showing_notes = True
+            rows = [" ".join(str(n) if n in notes else " " for n in range(start, start + 3)) for start in (1, 4, 7)]
+            self.__label.configure(text="\n".join(rows), font="Times 7")
+        elif self.__showing_notes:
+            self.__showing_notes = False
+            self.__label.configure(text="", font="Times 16")
 
     def change_font_color(self, color: str):
         self.__label.configure(foreground=color)
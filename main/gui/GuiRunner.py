@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import tkinter.messagebox
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, SimpleQueue
 from tkinter import *
 from tkinter import ttk
+from typing import Callable
 
 from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.PooledBoardFactory import PooledBoardFactory
+from main.GameBoard import note_digits
 from main.Sudoku import Sudoku
 from main.BoardPresenter import SudokuPresenter
 from main.gui.Cell import Cell
-from main.gui.SudokuViewInterface import SudokuViewInterface
+from main.gui.SudokuViewInterface import SudokuViewInterface, CellChange, CellStyle
 
 
 class GameBoard(SudokuViewInterface):
@@ -17,13 +22,16 @@ class GameBoard(SudokuViewInterface):
     __cells: list[list[Cell]] = [[None for _ in range(9)] for _ in range(9)]
     __active_cell_row: int = None
     __active_cell_col: int = None
-    __easy: Button = None
-    __med: Button = None
-    __hard: Button = None
+    __start_buttons: StartButtons = None
+    __generation_status: GenerationStatus = None
+    __callbacks: CallbackQueue = None
 
-    def __init__(self, root: Tk):
+    def __init__(self, root: Tk, sudoku: Sudoku = None):
         self.__root = root
-        self.__presenter = SudokuPresenter(self, Sudoku(BoardFactoryImpl()))
+        self.__callbacks = CallbackQueue(root)
+        self.__presenter = SudokuPresenter(self, sudoku if sudoku is not None
+                                           else Sudoku(PooledBoardFactory(BoardFactoryImpl())),
+                                           lambda: ThreadPoolExecutor(1, thread_name_prefix="board-generator"))
         self.__root.title("Sudoku")
         self.__root.option_add('*tearOff', FALSE)
         self.__menu_bar = MenuBar(self.__root, self.__presenter)
@@ -35,13 +43,14 @@ class GameBoard(SudokuViewInterface):
         self.__cells[row][col].set_value(num)
 
     def disable_start_button(self) -> None:
-        self.__easy['state'] = 'disabled'
-        self.__med['state'] = 'disabled'
-        self.__hard['state'] = 'disabled'
+        self.__start_buttons.disable()
 
     def set_cell_font_color(self, row: int, col: int, color: str):
         self.__cells[row][col].change_font_color(color)
 
+    def set_cell_notes(self, row: int, col: int, notes: list[int]):
+        self.__cells[row][col].set_notes(notes)
+
     def show_acknowledge_dialog(self, title: str, msg: str):
         tkinter.messagebox.showinfo(title=title, message=msg)
 
@@ -61,6 +70,31 @@ class GameBoard(SudokuViewInterface):
         if 0 <= row <= 8 and 0 <= col <= 8:
             self.__cells[row][col].unhighlight()
 
+    def show_generating(self, generating: bool):
+        if generating:
+            self.__generation_status.show()
+        else:
+            self.__generation_status.hide()
+
+    def post(self, callback: Callable[[], None]):
+        self.__callbacks.put(callback)
+
+    def apply_changes(self, changes: list[CellChange]):
+        for change in changes:
+            cell = self.__cells[change.row][change.col]
+            if change.value is not None:
+                cell.set_value(change.value)
+            if change.color is not None:
+                cell.change_font_color(change.color)
+            if change.notes is not None:
+                cell.set_notes(note_digits(change.notes))
+            if change.style is CellStyle.ACTIVE:
+                cell.select()
+            elif change.style is CellStyle.HIGHLIGHTED:
+                cell.highlight()
+            elif change.style is CellStyle.NORMAL:
+                cell.unhighlight()
+
     def enable_end_game_button(self) -> None:
         self.__menu_bar.enable_end_game_option()
 
@@ -68,16 +102,18 @@ class GameBoard(SudokuViewInterface):
         self.__menu_bar.disable_end_game_option()
 
     def enable_start_button(self) -> None:
-        self.__easy['state'] = 'normal'
-        self.__med['state'] = 'normal'
-        self.__hard['state'] = 'normal'
+        self.__start_buttons.enable()
 
     def __setup_game_board(self):
         mainframe = ttk.Frame(self.__root)
         mainframe.grid(column=0, row=0, pady=5, padx=5)
         cell_frame = ttk.Frame(mainframe)
         cell_frame.grid(column=0, row=0, columnspan=1, rowspan=1, padx=5, pady=5)
-        self.__add_start_buttons(mainframe)
+        self.__start_buttons = StartButtons(mainframe, self.__presenter)
+        self.__start_buttons.grid(row=2, column=0, columnspan=3, rowspan=2)
+        self.__generation_status = GenerationStatus(mainframe, self.__presenter)
+        self.__generation_status.grid(row=4, column=0, columnspan=3, pady=5)
+        self.__generation_status.hide()
         self.__add_cells(cell_frame)
         self.disable_end_game_button()
 
@@ -86,29 +122,86 @@ class GameBoard(SudokuViewInterface):
             for col in range(9):
                 self.__cells[row][col] = Cell(row, col, mainframe, self.__presenter)
 
-    def __add_start_buttons(self, frame: Frame):
-        button_frame = ttk.Frame(frame)
-        button_frame.grid(row=2, column=0, columnspan=3, rowspan=2)
-        self.__easy = ttk.Button(button_frame, text="Easy", style='Difficulty.TButton',
-                                 command=lambda: self.__presenter.start_new_game(Difficulty.EASY))
-        self.__easy.grid(row=1, column=0, rowspan=2, columnspan=6, sticky=E)
-        self.__med = ttk.Button(button_frame, text="Medium", style='Difficulty.TButton',
-                                command=lambda: self.__presenter.start_new_game(Difficulty.MEDIUM))
-        self.__med.grid(row=1, column=6, rowspan=2, columnspan=6, sticky=(E, W))
-        self.__hard = ttk.Button(button_frame, text="Hard", style='Difficulty.TButton',
-                                 command=lambda: self.__presenter.start_new_game(Difficulty.HARD))
-        self.__hard.grid(row=1, column=12, rowspan=2, columnspan=6, sticky=W)
-
     def __set_game_styles(self):
         style = ttk.Style()
         style.configure('Selected.TLabel', background='#ccffff')
         style.configure('Highlight.TLabel', background='#848788')
         style.configure('Difficulty.TButton', font="Times 16")
 
+    def get_presenter(self) -> SudokuPresenter:
+        return self.__presenter
+
     def run(self):
         self.__root.mainloop()
 
 
+class StartButtons(ttk.Frame):
+
+    def __init__(self, parent: Widget, presenter: SudokuPresenter):
+        super().__init__(parent)
+        self.__easy = ttk.Button(self, text="Easy", style='Difficulty.TButton',
+                                 command=lambda: presenter.start_new_game(Difficulty.EASY))
+        self.__easy.grid(row=1, column=0, rowspan=2, columnspan=6, sticky=E)
+        self.__med = ttk.Button(self, text="Medium", style='Difficulty.TButton',
+                                command=lambda: presenter.start_new_game(Difficulty.MEDIUM))
+        self.__med.grid(row=1, column=6, rowspan=2, columnspan=6, sticky=(E, W))
+        self.__hard = ttk.Button(self, text="Hard", style='Difficulty.TButton',
+                                 command=lambda: presenter.start_new_game(Difficulty.HARD))
+        self.__hard.grid(row=1, column=12, rowspan=2, columnspan=6, sticky=(E, W))
+        self.__expert = ttk.Button(self, text="Expert", style='Difficulty.TButton',
+                                   command=lambda: presenter.start_new_game(Difficulty.EXPERT))
+        self.__expert.grid(row=1, column=18, rowspan=2, columnspan=6, sticky=W)
+
+    def enable(self):
+        for button in (self.__easy, self.__med, self.__hard, self.__expert):
+            button['state'] = 'normal'
+
+    def disable(self):
+        for button in (self.__easy, self.__med, self.__hard, self.__expert):
+            button['state'] = 'disabled'
+
+
+class GenerationStatus(ttk.Frame):
+
+    def __init__(self, parent: Widget, presenter: SudokuPresenter):
+        super().__init__(parent)
+        self.__progress = ttk.Progressbar(self, mode='indeterminate', length=200)
+        self.__progress.grid(row=0, column=0, padx=5)
+        self.__label = ttk.Label(self, text="Generating board...")
+        self.__label.grid(row=0, column=1, padx=5)
+        self.__cancel = ttk.Button(self, text="Cancel", command=presenter.cancel_new_game)
+        self.__cancel.grid(row=0, column=2, padx=5)
+
+    def show(self):
+        self.grid()
+        self.__progress.start(15)
+
+    def hide(self):
+        self.__progress.stop()
+        self.grid_remove()
+
+
+class CallbackQueue:
+    __poll_ms = 50
+
+    def __init__(self, root: Tk):
+        self.__root = root
+        self.__callbacks = SimpleQueue()
+        self.__root.after(self.__poll_ms, self.__poll)
+
+    def put(self, callback: Callable[[], None]):
+        self.__callbacks.put(callback)
+
+    def __poll(self):
+        while True:
+            try:
+                callback = self.__callbacks.get_nowait()
+            except Empty:
+                break
+            callback()
+        self.__root.after(self.__poll_ms, self.__poll)
+
+
 class MenuBar(Menu):
 
     def __init__(self, win: Tk, presenter: SudokuPresenter):
@@ -1,4 +1,27 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable
+from enum import Enum
+
+from main.GameBoard import note_digits
+
+
+class CellStyle(Enum):
+    NORMAL = 0
+    HIGHLIGHTED = 1
+    ACTIVE = 2
+
+
+@dataclass(frozen=True)
+class CellChange:
+    row: int
+    col: int
+    value: str | None = None
+    style: CellStyle | None = None
+    color: str | None = None
+    notes: int | None = None
 
 
 class SudokuViewInterface(ABC):
@@ -27,6 +50,10 @@ class SudokuViewInterface(ABC):
     def set_cell_font_color(self, row: int, col: int, color: str):
         pass
 
+    @abstractmethod
+    def set_cell_notes(self, row: int, col: int, notes: list[int]):
+        pass
+
     @abstractmethod
     def show_acknowledge_dialog(self, title: str, msg: str):
         pass
@@ -46,3 +73,25 @@ class SudokuViewInterface(ABC):
     @abstractmethod
     def unhighlight(self, row: int, col: int):
         pass
+
+    @abstractmethod
+    def show_generating(self, generating: bool):
+        pass
+
+    def post(self, callback: Callable[[], None]):
+        callback()
+
+    def apply_changes(self, changes: list[CellChange]):
+        for change in changes:
+            if change.value is not None:
+                self.set_grid_value(change.row, change.col, change.value)
+            if change.color is not None:
+                self.set_cell_font_color(change.row, change.col, change.color)
+            if change.notes is not None:
+                self.set_cell_notes(change.row, change.col, note_digits(change.notes))
+            if change.style is CellStyle.ACTIVE:
+                self.activate(change.row, change.col)
+            elif change.style is CellStyle.HIGHLIGHTED:
+                self.highlight(change.row, change.col)
+            elif change.style is CellStyle.NORMAL:
+                self.unhighlight(change.row, change.col)
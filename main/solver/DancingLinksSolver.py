@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from math import isqrt
+from random import Random
+
+from .Solver import Solver
+
+
+class DancingLinksSolver(Solver):
+    __rng: Random = None
+
+    def __init__(self, rng: Random = None):
+        self.__rng = rng
+
+    def solutions(self, board: list[list[int]], limit: int = 1) -> list[list[list[int]]]:
+        found = []
+        self.__solve(board, limit, found)
+        return found
+
+    def count_solutions(self, board: list[list[int]], limit: int = 2) -> int:
+        return self.__solve(board, limit, None)
+
+    def __solve(self, board: list[list[int]], limit: int, found: list | None) -> int:
+        if limit < 1:
+            raise ValueError("Solution limit must be at least 1")
+
+        size = len(board)
+        box = isqrt(size)
+        if box * box != size or any(len(row) != size for row in board):
+            raise ValueError("Board must be N x N where N is a square number")
+
+        rows = [0] * size
+        cols = [0] * size
+        boxes = [0] * size
+        empties: list[(int, int, int)] = []
+        for r in range(size):
+            for c in range(size):
+                b = (r // box) * box + c // box
+                num = board[r][c]
+                if num == 0:
+                    empties.append((r, c, b))
+                    continue
+                if not 1 <= num <= size:
+                    raise ValueError(f"Board values must be between 0 and {size}")
+                bit = 1 << num
+                if (rows[r] | cols[c] | boxes[b]) & bit:
+                    return 0
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+
+        board = [row[:] for row in board]
+        full = ((1 << size) - 1) << 1
+        progress = True
+        while progress and empties:
+            progress = False
+            remaining = []
+            for (r, c, b) in empties:
+                free = full & ~(rows[r] | cols[c] | boxes[b])
+                if free == 0:
+                    return 0
+                elif free & (free - 1) == 0:
+                    board[r][c] = free.bit_length() - 1
+                    rows[r] |= free
+                    cols[c] |= free
+                    boxes[b] |= free
+                    progress = True
+                else:
+                    remaining.append((r, c, b))
+            empties = remaining
+
+        if not empties:
+            if found is not None:
+                found.append(board)
+            return 1
+
+        if self.__rng is not None:
+            self.__rng.shuffle(empties)
+
+        # Exact cover columns exist only for constraints the givens leave open:
+        # one per empty cell plus one per missing digit in each row, column and box.
+        column_ids: dict[int, int] = {}
+        area = size * size
+        for (r, c, _) in empties:
+            column_ids[r * size + c] = len(column_ids) + 1
+        for unit, offset in ((rows, area), (cols, 2 * area), (boxes, 3 * area)):
+            for i in range(size):
+                for num in range(1, size + 1):
+                    if not unit[i] & (1 << num):
+                        column_ids[offset + i * size + num - 1] = len(column_ids) + 1
+
+        column_count = len(column_ids)
+        left = [i - 1 for i in range(column_count + 1)]
+        right = [i + 1 for i in range(column_count + 1)]
+        left[0] = column_count
+        right[column_count] = 0
+        up = list(range(column_count + 1))
+        down = list(range(column_count + 1))
+        column = list(range(column_count + 1))
+        sizes = [0] * (column_count + 1)
+        choice = [None] * (column_count + 1)
+
+        for (r, c, b) in empties:
+            used = rows[r] | cols[c] | boxes[b]
+            nums = [num for num in range(1, size + 1) if not used & (1 << num)]
+            if self.__rng is not None:
+                self.__rng.shuffle(nums)
+            for num in nums:
+                first = len(left)
+                row_columns = (column_ids[r * size + c],
+                               column_ids[area + r * size + num - 1],
+                               column_ids[2 * area + c * size + num - 1],
+                               column_ids[3 * area + b * size + num - 1])
+                left.extend((first + 3, first, first + 1, first + 2))
+                right.extend((first + 1, first + 2, first + 3, first))
+                column.extend(row_columns)
+                choice.extend(((r, c, num),) * 4)
+                for node, col in enumerate(row_columns, first):
+                    up.append(up[col])
+                    down.append(col)
+                    down[up[col]] = node
+                    up[col] = node
+                    sizes[col] += 1
+
+        def cover(col: int):
+            right[left[col]] = right[col]
+            left[right[col]] = left[col]
+            i = down[col]
+            while i != col:
+                j = right[i]
+                while j != i:
+                    up[down[j]] = up[j]
+                    down[up[j]] = down[j]
+                    sizes[column[j]] -= 1
+                    j = right[j]
+                i = down[i]
+
+        def uncover(col: int):
+            i = up[col]
+            while i != col:
+                j = left[i]
+                while j != i:
+                    sizes[column[j]] += 1
+                    up[down[j]] = j
+                    down[up[j]] = j
+                    j = left[j]
+                i = up[i]
+            right[left[col]] = col
+            left[right[col]] = col
+
+        partial: list[(int, int, int)] = []
+        count = 0
+
+        def search() -> bool:
+            nonlocal count
+            col = right[0]
+            if col == 0:
+                count += 1
+                if found is not None:
+                    solution = [row[:] for row in board]
+                    for (r, c, num) in partial:
+                        solution[r][c] = num
+                    found.append(solution)
+                return count >= limit
+
+            best = col
+            best_size = sizes[col]
+            while col != 0 and best_size > 1:
+                if sizes[col] < best_size:
+                    best = col
+                    best_size = sizes[col]
+                col = right[col]
+            if best_size == 0:
+                return False
+
+            cover(best)
+            node = down[best]
+            while node != best:
+                partial.append(choice[node])
+                j = right[node]
+                while j != node:
+                    cover(column[j])
+                    j = right[j]
+                if search():
+                    return True
+                j = left[node]
+                while j != node:
+                    uncover(column[j])
+                    j = left[j]
+                partial.pop()
+                node = down[node]
+            uncover(best)
+            return False
+
+        search()
+        return count
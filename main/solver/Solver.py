@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class Solver(ABC):
+
+    @abstractmethod
+    def solutions(self, board: list[list[int]], limit: int = 1) -> list[list[list[int]]]:
+        pass
+
+    @abstractmethod
+    def count_solutions(self, board: list[list[int]], limit: int = 2) -> int:
+        pass
+
+    def solve(self, board: list[list[int]]) -> list[list[int]] | None:
+        found = self.solutions(board, 1)
+        if found:
+            return found[0]
+        else:
+            return None
+
+    def has_unique_solution(self, board: list[list[int]]) -> bool:
+        return self.count_solutions(board, 2) == 1
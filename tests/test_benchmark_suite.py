@@ -0,0 +1,65 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.suite import BenchmarkResult, measure, find_regressions, append_history, save_baseline, \
+    load_baseline, hot_paths
+
+
+def result(name: str, median: float, minimum: float = None) -> BenchmarkResult:
+    return BenchmarkResult(name, 1, 5, median, median, 0.0, minimum if minimum is not None else median, median)
+
+
+class BenchmarkSuiteTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name)
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_measure_collects_requested_samples(self):
+        measured = measure("sum", lambda: sum(range(100)), repeat=5, warmup=1, min_time=0.001)
+
+        self.assertEqual(5, measured.samples)
+        self.assertGreaterEqual(measured.median, measured.min)
+        self.assertGreater(measured.loops, 0)
+
+    def test_slowdown_above_threshold_is_a_regression(self):
+        regressions = find_regressions([result("a", 1.2)], {"a": {"median": 1.0}}, 0.10)
+
+        self.assertEqual(["a"], [regression.name for regression in regressions])
+        self.assertAlmostEqual(1.2, regressions[0].ratio())
+
+    def test_slowdown_within_threshold_is_not_a_regression(self):
+        self.assertEqual([], find_regressions([result("a", 1.05)], {"a": {"median": 1.0}}, 0.10))
+
+    def test_noisy_run_that_overlaps_baseline_is_not_a_regression(self):
+        self.assertEqual([], find_regressions([result("a", 1.2, minimum=0.9)], {"a": {"median": 1.0}}, 0.10))
+
+    def test_benchmarks_missing_from_baseline_are_skipped(self):
+        self.assertEqual([], find_regressions([result("new", 5.0)], {"a": {"median": 1.0}}, 0.10))
+
+    def test_history_appends_one_line_per_run(self):
+        history = self.path / "history.jsonl"
+        append_history(history, [result("a", 1.0)])
+        append_history(history, [result("a", 2.0)])
+
+        runs = [json.loads(line) for line in history.read_text().splitlines()]
+        self.assertEqual([1.0, 2.0], [run["results"]["a"]["median"] for run in runs])
+
+    def test_baseline_round_trips(self):
+        baseline = self.path / "baseline.json"
+        save_baseline(baseline, [result("a", 1.5)])
+
+        self.assertEqual(1.5, load_baseline(baseline)["a"]["median"])
+        self.assertEqual({}, load_baseline(self.path / "missing.json"))
+
+    def test_hot_paths_cover_requested_functions(self):
+        names = " ".join(hot_paths())
+
+        for expected in ("generate_board[EASY]", "generate_board[HARD]", "place_number", "is_valid_place",
+                         "get_selection", "get_values", "BoardFormatter.format"):
+            self.assertIn(expected, names)
@@ -0,0 +1,46 @@
+import unittest
+
+from main.BoardConstraints import BoardConstraints
+
+
+class BoardConstraintsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.constraints = BoardConstraints()
+
+    def test_empty_board_allows_any_number(self):
+        for num in range(1, 10):
+            self.assertTrue(self.constraints.can_place(4, 4, num))
+
+    def test_placed_number_blocks_row_col_and_square(self):
+        self.constraints.place(0, 0, 5)
+
+        self.assertFalse(self.constraints.can_place(0, 8, 5))
+        self.assertFalse(self.constraints.can_place(8, 0, 5))
+        self.assertFalse(self.constraints.can_place(2, 2, 5))
+        self.assertTrue(self.constraints.can_place(3, 3, 5))
+        self.assertTrue(self.constraints.can_place(0, 8, 4))
+
+    def test_removed_number_can_be_placed_again(self):
+        self.constraints.place(4, 4, 7)
+        self.constraints.remove(4, 4, 7)
+
+        self.assertTrue(self.constraints.can_place(4, 0, 7))
+        self.assertTrue(self.constraints.can_place(0, 4, 7))
+        self.assertTrue(self.constraints.can_place(5, 5, 7))
+
+    def test_from_board_matches_existing_numbers(self):
+        board = [[0 for _ in range(9)] for _ in range(9)]
+        board[6][7] = 1
+        constraints = BoardConstraints.from_board(board)
+
+        self.assertFalse(constraints.can_place(7, 8, 1))
+        self.assertFalse(constraints.can_place(6, 0, 1))
+        self.assertTrue(constraints.can_place(3, 2, 1))
+
+    def test_candidates_excludes_used_numbers(self):
+        self.constraints.place(0, 1, 1)
+        self.constraints.place(1, 0, 2)
+        self.constraints.place(8, 0, 3)
+
+        self.assertEqual(0b1111110000, self.constraints.candidates(0, 0))
@@ -1,5 +1,18 @@
+import random
+import threading
 import unittest
 from main.BoardFactory import BoardFactory, BoardFactoryImpl, GameBoard, Difficulty
+from main.RatedBoardFactory import RatedBoardFactory
+from main.solver.DancingLinksSolver import DancingLinksSolver
+
+
+class UnpicklableBoardFactory(BoardFactory):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        return BoardFactoryImpl().generate_board(difficulty)
 
 
 class BoardFactoryTest(unittest.TestCase):
@@ -116,6 +129,149 @@ class BoardFactoryTest(unittest.TestCase):
         for (x, y, num) in steps:
             self.assertTrue(1 <= num <= 9, f"Solution step generated with invalid number {num}")
 
+    def test_hard_board_has_unique_solution(self):
+        game: GameBoard = self.bf.generate_board(Difficulty.HARD)
+
+        self.assertEqual(35, len(game.get_moves()))
+        self.assertEqual(1, DancingLinksSolver().count_solutions(game.get_board()))
+
+    def test_expert_board_is_minimal_and_unique(self):
+        game: GameBoard = self.bf.generate_board(Difficulty.EXPERT, seed=7)
+        board = game.get_board()
+
+        self.assertGreater(len(game.get_moves()), 35)
+        self.assertEqual(1, DancingLinksSolver().count_solutions(board))
+        for (row, col) in [(r, c) for r in range(9) for c in range(9) if board[r][c] != 0]:
+            val = board[row][col]
+            board[row][col] = 0
+            self.assertEqual(2, DancingLinksSolver().count_solutions(board))
+            board[row][col] = val
+
+    def test_last_row_and_column_can_be_emptied(self):
+        rows, cols = set([]), set([])
+        for _ in range(10):
+            for (x, y, _) in self.bf.generate_board(Difficulty.HARD).get_moves():
+                rows.add(x)
+                cols.add(y)
+
+        self.assertIn(8, rows)
+        self.assertIn(8, cols)
+
+    def test_generate_boards_streams_requested_count(self):
+        reports = []
+        boards = list(self.bf.generate_boards(7, Difficulty.EASY, workers=2, chunk_size=3, report=reports.append))
+
+        self.assertEqual(7, len(boards))
+        for game in boards:
+            self.assertEqual(15, len(game.get_moves()))
+        self.assertEqual(7, reports[0].boards)
+        self.assertEqual(2, reports[0].workers)
+        self.assertGreater(reports[0].boards_per_second, 0)
+        self.assertLessEqual(reports[0].p50_latency, reports[0].max_latency)
+
+    def test_generate_boards_with_same_seed_are_identical(self):
+        first = list(self.bf.generate_boards(4, Difficulty.MEDIUM, workers=2, chunk_size=2, seed=42))
+        second = list(self.bf.generate_boards(4, Difficulty.MEDIUM, workers=2, chunk_size=2, seed=42))
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first[0], first[2], "Chunks should be seeded independently")
+
+    def test_generate_boards_runs_through_picklable_wrapper(self):
+        boards = list(RatedBoardFactory(self.bf).generate_boards(3, Difficulty.EASY, workers=1))
+
+        self.assertEqual(3, len(boards))
+        for game in boards:
+            self.assertEqual(15, len(game.get_moves()))
+
+    def test_generate_boards_rejects_unpicklable_factory(self):
+        with self.assertRaises(TypeError):
+            list(UnpicklableBoardFactory().generate_boards(1, Difficulty.EASY, workers=1))
+
+    def test_same_seed_and_difficulty_give_identical_boards(self):
+        first = BoardFactoryImpl().generate_board(Difficulty.HARD, seed=2024)
+        second = BoardFactoryImpl().generate_board(Difficulty.HARD, seed=2024)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first.get_moves(), second.get_moves())
+        self.assertNotEqual(first, BoardFactoryImpl().generate_board(Difficulty.HARD, seed=2025))
+
+    def test_seeded_generation_does_not_touch_global_random(self):
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        self.bf.generate_board(Difficulty.EASY, seed="daily")
+
+        self.assertEqual(expected, random.random())
+
+    def test_repeated_seed_is_served_from_cache(self):
+        first = self.bf.generate_board(Difficulty.MEDIUM, seed=1)
+        first.guess(*next(iter(first.get_moves())))
+        second = self.bf.generate_board(Difficulty.MEDIUM, seed=1)
+
+        info = self.bf.cache_info()
+        self.assertEqual((1, 1, 1), (info.hits, info.misses, info.size))
+        self.assertEqual(0.5, info.hit_rate())
+        self.assertEqual(25, len(second.get_moves()), "Cached boards must not share guesses")
+
+    def test_cache_evicts_least_recently_used_seed(self):
+        factory = BoardFactoryImpl(cache_size=2)
+        factory.generate_board(Difficulty.EASY, seed=1)
+        factory.generate_board(Difficulty.EASY, seed=2)
+        factory.generate_board(Difficulty.EASY, seed=1)
+        factory.generate_board(Difficulty.EASY, seed=3)
+        factory.generate_board(Difficulty.EASY, seed=2)
+
+        info = factory.cache_info()
+        self.assertEqual((1, 4, 2, 2), (info.hits, info.misses, info.size, info.max_size))
+
+    def test_empty_squares_scale_with_board_size(self):
+        self.assertEqual(35, Difficulty.HARD.empty_squares())
+        self.assertEqual(7, Difficulty.HARD.empty_squares(4))
+        self.assertEqual(111, Difficulty.HARD.empty_squares(16))
+        self.assertEqual(270, Difficulty.HARD.empty_squares(25))
+
+    def test_expert_is_capped_on_large_boards(self):
+        self.assertEqual(64, Difficulty.EXPERT.empty_squares())
+        self.assertEqual(141, Difficulty.EXPERT.empty_squares(16))
+        self.assertEqual(288, Difficulty.EXPERT.empty_squares(25))
+
+    def test_large_expert_board_is_unique(self):
+        game = BoardFactoryImpl(size=16).generate_board(Difficulty.EXPERT, seed=1)
+
+        self.assertEqual(141, len(game.get_moves()))
+        self.assertEqual(1, DancingLinksSolver().count_solutions(game.get_board()))
+
+    def test_board_size_must_be_square(self):
+        with self.assertRaises(ValueError):
+            BoardFactoryImpl(size=10)
+
+    def test_board_size_is_at_most_25(self):
+        with self.assertRaises(ValueError):
+            BoardFactoryImpl(size=36)
+
+    def test_generates_valid_unique_boards_of_other_sizes(self):
+        for size in (4, 16, 25):
+            game = BoardFactoryImpl(size=size).generate_board(Difficulty.HARD, seed=size)
+            board = game.get_board()
+
+            self.assertEqual(size, game.get_size())
+            self.assertEqual(Difficulty.HARD.empty_squares(size), len(game.get_moves()))
+            self.assertEqual(1, DancingLinksSolver().count_solutions(board, 2))
+            for (row, col, num) in game.get_moves():
+                board[row][col] = num
+            self.assertTrue(all(sorted(row) == list(range(1, size + 1)) for row in board))
+            self.assertTrue(all(sorted(col) == list(range(1, size + 1)) for col in zip(*board)))
+
+    def test_valid_place_uses_board_size_boxes(self):
+        factory = BoardFactoryImpl(size=4)
+        board = [[1, 0, 0, 0],
+                 [0, 0, 0, 0],
+                 [0, 0, 0, 0],
+                 [0, 0, 0, 0]]
+
+        self.assertFalse(factory.is_valid_place(board, 1, 1, 1))
+        self.assertTrue(factory.is_valid_place(board, 2, 2, 1))
+
     def is_valid(self, board):
         if self.__contains_invalid_row(board):
             return False
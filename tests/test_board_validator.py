@@ -0,0 +1,86 @@
+import unittest
+
+try:
+    import numpy as np
+    from main.BoardValidator import BoardValidator
+except ImportError:
+    np = None
+
+solved = [[8, 1, 2, 7, 5, 3, 6, 4, 9],
+          [9, 4, 3, 6, 8, 2, 1, 7, 5],
+          [6, 7, 5, 4, 9, 1, 2, 8, 3],
+          [1, 5, 4, 2, 3, 7, 8, 9, 6],
+          [3, 6, 9, 8, 4, 5, 7, 2, 1],
+          [2, 8, 7, 1, 6, 9, 5, 3, 4],
+          [5, 2, 1, 9, 7, 4, 3, 6, 8],
+          [4, 3, 8, 5, 2, 6, 9, 1, 7],
+          [7, 9, 6, 3, 1, 8, 4, 5, 2]]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class BoardValidatorTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.validator = BoardValidator(chunk_size=2)
+
+    def test_solved_board_is_valid_and_complete(self):
+        result = self.validator.validate(np.array([solved]))
+
+        self.assertTrue(result.valid[0])
+        self.assertTrue(result.complete[0])
+        self.assertFalse(result.conflicts.any())
+
+    def test_partial_board_is_valid_but_incomplete(self):
+        board = np.array(solved)
+        board[0, 0] = 0
+        board[4, 4] = 0
+        result = self.validator.validate(board)
+
+        self.assertTrue(result.valid[0])
+        self.assertFalse(result.complete[0])
+
+    def test_row_conflict_marks_both_cells(self):
+        board = np.zeros((9, 9), dtype=np.int8)
+        board[2, 0] = 5
+        board[2, 8] = 5
+        result = self.validator.validate(board)
+
+        self.assertFalse(result.valid[0])
+        self.assertEqual([(2, 0), (2, 8)], list(zip(*np.nonzero(result.conflicts[0]))))
+
+    def test_column_and_box_conflicts_are_located(self):
+        board = np.zeros((9, 9), dtype=np.int8)
+        board[0, 4] = 3
+        board[8, 4] = 3
+        board[6, 6] = 7
+        board[8, 8] = 7
+        result = self.validator.validate(board)
+
+        self.assertEqual([(0, 4), (6, 6), (8, 4), (8, 8)], list(zip(*np.nonzero(result.conflicts[0]))))
+
+    def test_out_of_range_values_are_conflicts(self):
+        board = np.array(solved)
+        board[1, 1] = 10
+        result = self.validator.validate(board)
+
+        self.assertFalse(result.valid[0])
+        self.assertTrue(result.conflicts[0, 1, 1])
+
+    def test_validates_batches_across_chunks(self):
+        boards = np.array([solved] * 5)
+        boards[3, 0, 0] = boards[3, 0, 1]
+        result = self.validator.validate(boards)
+
+        self.assertEqual([True, True, True, False, True], result.valid.tolist())
+        self.assertEqual((5, 9, 9), result.conflicts.shape)
+
+    def test_validates_4x4_boards(self):
+        boards = np.array([[[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]],
+                           [[1, 2, 3, 4], [2, 1, 4, 3], [3, 4, 1, 2], [4, 3, 2, 1]]])
+        result = self.validator.validate(boards)
+
+        self.assertEqual([True, False], result.complete.tolist())
+
+    def test_rejects_non_square_boards(self):
+        with self.assertRaises(ValueError):
+            self.validator.validate(np.zeros((2, 9, 8)))
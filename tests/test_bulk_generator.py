@@ -0,0 +1,102 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from main import BulkGenerator, BulkSolver
+from main.BoardFactory import Difficulty
+from main.PuzzleCorpus import PuzzleCorpus
+from tests.test_sudoku import StubbedBoardFactory
+from tests.test_bulk_solver import PUZZLE, SOLUTION
+
+
+class BulkGeneratorTest(unittest.TestCase):
+
+    def test_line_holds_puzzle_and_solution(self):
+        self.assertEqual(f"{PUZZLE} {SOLUTION}", BulkGenerator.format_line(StubbedBoardFactory().generate_board(Difficulty.OFF)))
+
+    def test_lines_are_flushed_in_chunks(self):
+        out = FlushCountingStream()
+        boards = (StubbedBoardFactory().generate_board(Difficulty.OFF) for _ in range(5))
+
+        self.assertEqual(5, BulkGenerator.write_lines(boards, out, chunk_size=2))
+        self.assertEqual(3, out.flushes)
+        self.assertEqual(5, out.getvalue().count("\n"))
+
+    def test_generated_lines_solve_uniquely(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        BulkGenerator.main(["6", "--difficulty", "hard", "--workers", "1", "--chunk-size", "4", "--seed", "9"],
+                           stdout=stdout, stderr=stderr)
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(6, len(lines))
+        for line in lines:
+            puzzle, solution = line.split()
+            self.assertEqual(35, puzzle.count("0"))
+            self.assertEqual(f"{solution} 1", BulkSolver.solve_line(puzzle))
+        self.assertIn("Generated 6 HARD puzzles", stderr.getvalue())
+
+    def test_binary_output_is_a_puzzle_corpus(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "puzzles.bin")
+            BulkGenerator.main(["3", "--difficulty", "easy", "--format", "binary", "--output", path,
+                                "--workers", "1"], stderr=io.StringIO())
+
+            with PuzzleCorpus(path) as corpus:
+                self.assertEqual(3, corpus.count(Difficulty.EASY))
+                self.assertEqual(15, len(corpus.get(Difficulty.EASY, 2).get_moves()))
+
+    def test_binary_header_counts_records_written_before_a_stop(self):
+        def boards():
+            for _ in range(3):
+                yield StubbedBoardFactory().generate_board(Difficulty.OFF)
+            raise KeyboardInterrupt()
+
+        out = io.BytesIO()
+        with self.assertRaises(KeyboardInterrupt):
+            BulkGenerator.write_binary(boards(), out, Difficulty.HARD, chunk_size=2)
+
+        data = out.getvalue()
+        self.assertEqual(PuzzleCorpus.HEADER_SIZE + 2 * PuzzleCorpus.RECORD_SIZE, len(data))
+        offset, count = PuzzleCorpus.decode_header(data[:PuzzleCorpus.HEADER_SIZE])[Difficulty.HARD]
+        self.assertEqual(2, count)
+
+    def test_binary_output_refuses_unseekable_streams(self):
+        with self.assertRaises(ValueError):
+            BulkGenerator.write_binary(iter([]), UnseekableStream(), Difficulty.HARD)
+
+    def test_size_option_generates_other_board_sizes(self):
+        stdout = io.StringIO()
+        BulkGenerator.main(["2", "--size", "4", "--difficulty", "easy", "--workers", "1"],
+                           stdout=stdout, stderr=io.StringIO())
+
+        for line in stdout.getvalue().splitlines():
+            puzzle, solution = line.split()
+            self.assertEqual(16, len(puzzle))
+            self.assertEqual(f"{solution} 1", BulkSolver.solve_line(puzzle))
+
+    def test_binary_output_rejects_other_board_sizes(self):
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+            BulkGenerator.main(["1", "--size", "16", "--format", "binary"], stdout=io.StringIO())
+
+    def test_size_above_25_is_rejected(self):
+        stderr = io.StringIO()
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(stderr):
+            BulkGenerator.main(["1", "--size", "36"], stdout=io.StringIO())
+
+        self.assertIn("larger than 25", stderr.getvalue())
+
+
+class FlushCountingStream(io.StringIO):
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class UnseekableStream(io.BytesIO):
+
+    def seekable(self):
+        return False
@@ -0,0 +1,125 @@
+import io
+import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from main import BulkSolver
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.GameBoard import SYMBOLS, format_values
+
+PUZZLE = "061842753857963241243157968196284375785396124324715896619428537578639402432571689"
+SOLUTION = "961842753857963241243157968196284375785396124324715896619428537578639412432571689"
+
+
+class BulkSolverTest(unittest.TestCase):
+
+    def test_unique_puzzle_is_solved(self):
+        self.assertEqual(f"{SOLUTION} 1", BulkSolver.solve_line(PUZZLE))
+
+    def test_dots_are_blanks(self):
+        self.assertEqual(f"{SOLUTION} 1", BulkSolver.solve_line(PUZZLE.replace("0", ".")))
+
+    def test_puzzle_with_several_solutions_reports_many(self):
+        self.assertTrue(BulkSolver.solve_line("0" * 81).endswith(" many"))
+
+    def test_unsolvable_and_malformed_lines_report_zero(self):
+        contradiction = "11" + "0" * 79
+
+        self.assertEqual(f"{contradiction} 0", BulkSolver.solve_line(contradiction))
+        self.assertEqual("12345 0", BulkSolver.solve_line("12345"))
+        self.assertEqual(f"{'x' * 81} 0", BulkSolver.solve_line("x" * 81))
+
+    def test_stream_keeps_input_order_across_workers(self):
+        lines = [PUZZLE, "0" * 81, "11" + "0" * 79] * 20
+        with ThreadPoolExecutor(3) as executor:
+            results = list(BulkSolver.solve_stream(lines, executor, chunk_size=2, window=3))
+
+        self.assertEqual([BulkSolver.solve_line(line) for line in lines], results)
+
+    def test_slow_chunk_does_not_stop_other_chunks(self):
+        lines = [PUZZLE] * 8
+        with GatedExecutor(2) as executor:
+            results = BulkSolver.solve_stream(lines, executor, chunk_size=1, window=2, buffer=4)
+            reader = ThreadPoolExecutor(1)
+            collected = reader.submit(list, results)
+            self.assertTrue(executor.all_but_first_ran.wait(5))
+            executor.gate.set()
+            self.assertEqual([f"{SOLUTION} 1"] * 8, collected.result(5))
+            reader.shutdown()
+        self.assertEqual(6, executor.submitted_while_gated)
+
+    def test_main_stops_quietly_when_reader_goes_away(self):
+        self.assertEqual(1, BulkSolver.main(["--workers", "0"], stdin=io.StringIO(PUZZLE + "\n"),
+                                            stdout=ClosedPipe(), stderr=io.StringIO()))
+
+    def test_stream_skips_blank_and_comment_lines(self):
+        results = list(BulkSolver.solve_stream(["# header\n", "\n", PUZZLE + "\n"]))
+
+        self.assertEqual([f"{SOLUTION} 1"], results)
+
+    def test_stream_is_lazy(self):
+        def lines():
+            yield PUZZLE
+            raise AssertionError("read past the first chunk")
+
+        results = BulkSolver.solve_stream(lines(), chunk_size=1)
+        self.assertEqual(f"{SOLUTION} 1", next(results))
+
+    def test_main_reads_stdin_and_reports_rate(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        BulkSolver.main(["--workers", "0"], stdin=io.StringIO(PUZZLE + "\n" + PUZZLE + "\n"),
+                        stdout=stdout, stderr=stderr)
+
+        self.assertEqual(f"{SOLUTION} 1\n" * 2, stdout.getvalue())
+        self.assertIn("Solved 2 puzzles", stderr.getvalue())
+        self.assertIn("puzzles/s", stderr.getvalue())
+
+    def test_large_boards_use_letters_for_values_above_nine(self):
+        board = BoardFactoryImpl(size=16).generate_board(Difficulty.MEDIUM, seed=3)
+        puzzle = format_values(val for row in board.get_board() for val in row)
+        solution, count = BulkSolver.solve_line(puzzle.replace("0", ".")).split()
+
+        self.assertEqual("1", count)
+        self.assertEqual(256, len(solution))
+        self.assertIn("G", solution)
+        for (row, col, val) in board.get_moves():
+            self.assertEqual(SYMBOLS[val], solution[row * 16 + col])
+
+    def test_symbols_beyond_board_size_are_malformed(self):
+        self.assertTrue(BulkSolver.solve_line("5" + "0" * 15).endswith(" 0"))
+
+
+class GatedExecutor(ThreadPoolExecutor):
+
+    def __init__(self, workers: int):
+        super().__init__(workers)
+        self.gate = threading.Event()
+        self.all_but_first_ran = threading.Event()
+        self.submitted_while_gated = 0
+        self.__submitted = 0
+        self.__ran = 0
+        self.__lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        with self.__lock:
+            first = self.__submitted == 0
+            self.__submitted += 1
+            if not self.gate.is_set():
+                self.submitted_while_gated += 1
+        return super().submit(self.__run, first, fn, *args)
+
+    def __run(self, first, fn, *args):
+        if first:
+            self.gate.wait(5)
+        result = fn(*args)
+        with self.__lock:
+            self.__ran += 1
+            if self.__ran == 5:
+                self.all_but_first_ran.set()
+        return result
+
+
+class ClosedPipe(io.StringIO):
+
+    def write(self, text):
+        raise BrokenPipeError()
@@ -0,0 +1,65 @@
+import unittest
+
+from main.CandidateGrid import CandidateGrid
+
+
+class CandidateGridTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.grid = CandidateGrid([[0 for _ in range(9)] for _ in range(9)])
+
+    def test_empty_grid_allows_every_digit(self):
+        self.assertEqual(81, self.grid.empty)
+        self.assertEqual(0b1111111110, self.grid.candidates[40])
+
+    def test_givens_remove_candidates_from_peers(self):
+        board = [[0 for _ in range(9)] for _ in range(9)]
+        board[0][0] = 5
+        grid = CandidateGrid(board)
+
+        self.assertFalse(grid.candidates[8] >> 5 & 1)
+        self.assertFalse(grid.candidates[72] >> 5 & 1)
+        self.assertFalse(grid.candidates[20] >> 5 & 1)
+        self.assertTrue(grid.candidates[30] >> 5 & 1)
+        self.assertEqual(0, grid.candidates[0])
+
+    def test_place_updates_peers_incrementally(self):
+        self.grid.place(40, 7)
+
+        self.assertEqual(80, self.grid.empty)
+        self.assertEqual(7, self.grid.values[40])
+        for peer in self.grid.geometry.peers[40]:
+            self.assertFalse(self.grid.candidates[peer] >> 7 & 1)
+
+    def test_eliminating_to_one_candidate_makes_naked_single(self):
+        self.assertIsNone(self.grid.next_naked_single())
+        for num in range(2, 10):
+            self.grid.eliminate(10, num)
+
+        self.assertEqual((10, 1), self.grid.next_naked_single())
+        self.assertEqual((10, 1), self.grid.next_naked_single())
+
+    def test_eliminating_digit_from_unit_makes_hidden_single(self):
+        self.assertIsNone(self.grid.next_hidden_single())
+        for col in range(1, 9):
+            self.grid.eliminate(col, 4)
+
+        cell, num, _ = self.grid.next_hidden_single()
+        self.assertEqual((0, 4), (cell, num))
+
+    def test_eliminate_reports_whether_candidate_was_removed(self):
+        self.assertTrue(self.grid.eliminate(0, 1))
+        self.assertFalse(self.grid.eliminate(0, 1))
+
+    def test_copy_is_independent(self):
+        clone = self.grid.copy()
+        clone.place(0, 1)
+
+        self.assertEqual(0, self.grid.values[0])
+        self.assertTrue(self.grid.candidates[1] >> 1 & 1)
+
+    def test_detects_contradiction(self):
+        for num in range(1, 10):
+            self.grid.eliminate(0, num)
+
+        self.assertTrue(self.grid.has_contradiction())
@@ -0,0 +1,28 @@
+import unittest
+
+from main.gui.CanvasGameBoard import cell_at
+
+CELL_PX = 48
+MARGIN = 3
+
+
+class CellAtTest(unittest.TestCase):
+
+    def test_first_pixel_of_the_board_is_the_top_left_cell(self):
+        self.assertEqual((0, 0), cell_at(MARGIN, MARGIN, CELL_PX, MARGIN))
+
+    def test_cell_edges_belong_to_the_cell_that_starts_there(self):
+        self.assertEqual((0, 0), cell_at(MARGIN + CELL_PX - 1, MARGIN + CELL_PX - 1, CELL_PX, MARGIN))
+        self.assertEqual((1, 1), cell_at(MARGIN + CELL_PX, MARGIN + CELL_PX, CELL_PX, MARGIN))
+
+    def test_x_is_the_column_and_y_is_the_row(self):
+        self.assertEqual((7, 2), cell_at(MARGIN + 2 * CELL_PX + 10, MARGIN + 7 * CELL_PX + 30, CELL_PX, MARGIN))
+
+    def test_last_cell_of_a_large_board(self):
+        end = MARGIN + 16 * CELL_PX - 1
+        self.assertEqual((15, 15), cell_at(end, end, CELL_PX, MARGIN))
+
+    def test_clicks_in_the_margin_fall_outside_the_board(self):
+        self.assertEqual((-1, -1), cell_at(0, 0, CELL_PX, MARGIN))
+        self.assertEqual((9, 0), cell_at(MARGIN, MARGIN + 9 * CELL_PX, CELL_PX, MARGIN))
+
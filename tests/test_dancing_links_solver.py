@@ -0,0 +1,94 @@
+import unittest
+from random import Random
+
+from main.solver.DancingLinksSolver import DancingLinksSolver
+from main.solver.Solver import Solver
+
+
+def parse(puzzle: str) -> list[list[int]]:
+    return [[int(puzzle[row * 9 + col]) for col in range(9)] for row in range(9)]
+
+
+class DancingLinksSolverTest(unittest.TestCase):
+    hard_puzzle = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+    hard_solution = "812753649943682175675491283154237896369845721287169534521974368438526917796318452"
+
+    def setUp(self) -> None:
+        self.solver: Solver = DancingLinksSolver()
+
+    def test_solves_hard_puzzle(self):
+        self.assertEqual(parse(self.hard_solution), self.solver.solve(parse(self.hard_puzzle)))
+
+    def test_hard_puzzle_has_unique_solution(self):
+        self.assertEqual(1, self.solver.count_solutions(parse(self.hard_puzzle)))
+        self.assertTrue(self.solver.has_unique_solution(parse(self.hard_puzzle)))
+
+    def test_solving_does_not_modify_board(self):
+        board = parse(self.hard_puzzle)
+        self.solver.solve(board)
+
+        self.assertEqual(parse(self.hard_puzzle), board)
+
+    def test_count_stops_at_limit(self):
+        empty = [[0 for _ in range(9)] for _ in range(9)]
+
+        self.assertEqual(2, self.solver.count_solutions(empty, 2))
+        self.assertEqual(25, self.solver.count_solutions(empty, 25))
+
+    def test_returns_first_n_distinct_solutions(self):
+        board = parse(self.hard_solution)
+        for (row, col) in [(0, 0), (0, 4), (4, 0), (4, 4)]:
+            board[row][col] = 0
+
+        self.assertEqual(1, len(self.solver.solutions(board, 5)))
+
+        empty = [[0 for _ in range(9)] for _ in range(9)]
+        found = self.solver.solutions(empty, 3)
+        self.assertEqual(3, len(found))
+        self.assertEqual(3, len({str(solution) for solution in found}))
+        for solution in found:
+            self.assertEqual(1, self.solver.count_solutions(solution))
+
+    def test_conflicting_givens_have_no_solution(self):
+        board = parse(self.hard_puzzle)
+        board[0][1] = 8
+
+        self.assertEqual(0, self.solver.count_solutions(board))
+        self.assertIsNone(self.solver.solve(board))
+
+    def test_unsolvable_board_has_no_solution(self):
+        board = [[1, 2, 0, 0],
+                 [0, 0, 3, 0],
+                 [0, 0, 4, 0],
+                 [0, 0, 0, 0]]
+
+        self.assertEqual(0, self.solver.count_solutions(board))
+
+    def test_solves_4x4_board(self):
+        board = [[1, 0, 0, 0],
+                 [0, 0, 1, 0],
+                 [0, 1, 0, 0],
+                 [0, 0, 0, 1]]
+        solution = self.solver.solve(board)
+
+        for row in solution:
+            self.assertEqual({1, 2, 3, 4}, set(row))
+
+    def test_random_solver_generates_different_grids(self):
+        empty = [[0 for _ in range(9)] for _ in range(9)]
+        first = DancingLinksSolver(Random(1)).solve(empty)
+        second = DancingLinksSolver(Random(2)).solve(empty)
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(first, DancingLinksSolver(Random(1)).solve(empty))
+
+    def test_rejects_non_square_board(self):
+        with self.assertRaises(ValueError):
+            self.solver.count_solutions([[0, 0, 0]])
+
+    def test_rejects_out_of_range_values(self):
+        board = parse(self.hard_puzzle)
+        board[0][1] = 10
+
+        with self.assertRaises(ValueError):
+            self.solver.count_solutions(board)
@@ -0,0 +1,122 @@
+import unittest
+
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.CandidateGrid import CandidateGrid
+from main.DifficultyGrader import DifficultyGrader
+from main.RatedBoardFactory import RatedBoardFactory, RatingBandError
+from main.Techniques import Technique, TechniqueFinder
+
+
+def parse(puzzle: str) -> list[list[int]]:
+    return [[int(puzzle[row * 9 + col]) for col in range(9)] for row in range(9)]
+
+
+class DifficultyGraderTest(unittest.TestCase):
+    hidden_singles = "000000010400000000020000000000050407008000300001090000300400200050100000000806000"
+    hardest = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+    def setUp(self) -> None:
+        self.grader = DifficultyGrader()
+
+    def test_easy_board_needs_only_naked_singles(self):
+        board = BoardFactoryImpl().generate_board(Difficulty.EASY).get_board()
+        grade = self.grader.grade(board)
+
+        self.assertEqual(Technique.NAKED_SINGLE, grade.hardest)
+        self.assertEqual(1.0, grade.rating)
+        self.assertEqual(15, grade.steps[Technique.NAKED_SINGLE])
+
+    def test_rates_by_hardest_technique(self):
+        grade = self.grader.grade(parse(self.hidden_singles))
+
+        self.assertEqual(Technique.HIDDEN_SINGLE, grade.hardest)
+        self.assertEqual(64, sum(grade.steps.values()))
+
+    def test_puzzle_beyond_techniques_needs_guesses(self):
+        grade = self.grader.grade(parse(self.hardest))
+
+        self.assertEqual(Technique.GUESS, grade.hardest)
+        self.assertEqual(Technique.GUESS.weight(), grade.rating)
+
+    def test_solved_board_has_no_rating(self):
+        grade = self.grader.grade(BoardFactoryImpl().generate_board(Difficulty.OFF).get_board())
+
+        self.assertEqual(0.0, grade.rating)
+        self.assertIsNone(grade.hardest)
+
+    def test_unsolvable_board_raises(self):
+        board = parse(self.hardest)
+        board[0][1] = 8
+        board[0][2] = 0
+
+        with self.assertRaises(ValueError):
+            self.grader.grade(board)
+
+
+class TechniqueFinderTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.grid = CandidateGrid([[0 for _ in range(9)] for _ in range(9)])
+
+    def test_locked_candidates_in_box_eliminate_from_row(self):
+        for cell in (9, 10, 11, 18, 19, 20):
+            self.grid.eliminate(cell, 1)
+        deduction = TechniqueFinder((Technique.LOCKED_CANDIDATES,)).find(self.grid)
+
+        self.assertEqual(Technique.LOCKED_CANDIDATES, deduction.technique)
+        self.assertEqual(tuple((col, 1) for col in range(3, 9)), deduction.eliminations)
+        self.assertEqual((0, 1, 2), deduction.reasons)
+
+    def test_naked_pair_eliminates_from_unit(self):
+        for cell in (0, 1):
+            for num in range(3, 10):
+                self.grid.eliminate(cell, num)
+        deduction = TechniqueFinder((Technique.NAKED_PAIR,)).find(self.grid)
+
+        self.assertEqual((0, 1), deduction.reasons)
+        self.assertIn((2, 1), deduction.eliminations)
+        self.assertIn((8, 2), deduction.eliminations)
+
+    def test_x_wing_eliminates_from_columns(self):
+        for row in (0, 4):
+            for col in (1, 2, 3, 4, 6, 7, 8):
+                self.grid.eliminate(row * 9 + col, 6)
+        deduction = TechniqueFinder((Technique.X_WING,)).find(self.grid)
+
+        self.assertEqual(Technique.X_WING, deduction.technique)
+        self.assertEqual(14, len(deduction.eliminations))
+        self.assertEqual((0, 5, 36, 41), deduction.reasons)
+        deduction.apply_to(self.grid)
+        self.assertFalse(self.grid.candidates[9] >> 6 & 1)
+        self.assertFalse(self.grid.candidates[77] >> 6 & 1)
+
+    def test_hidden_pair_removes_other_candidates(self):
+        for col in range(2, 9):
+            self.grid.eliminate(col, 1)
+            self.grid.eliminate(col, 2)
+        deduction = TechniqueFinder((Technique.HIDDEN_PAIR,)).find(self.grid)
+
+        self.assertEqual((0, 1), deduction.reasons)
+        deduction.apply_to(self.grid)
+        self.assertEqual(0b110, self.grid.candidates[0])
+        self.assertEqual(0b110, self.grid.candidates[1])
+
+
+class RatedBoardFactoryTest(unittest.TestCase):
+
+    def test_generates_board_in_band(self):
+        factory = RatedBoardFactory(BoardFactoryImpl(), {Difficulty.EASY: (1.0, 1.0)})
+        board = factory.generate_board(Difficulty.EASY)
+
+        self.assertEqual(1.0, DifficultyGrader().grade(board.get_board()).rating)
+
+    def test_unbanded_difficulty_is_delegated(self):
+        board = RatedBoardFactory(BoardFactoryImpl()).generate_board(Difficulty.MEDIUM)
+
+        self.assertEqual(25, len(board.get_moves()))
+
+    def test_unreachable_band_raises(self):
+        factory = RatedBoardFactory(BoardFactoryImpl(), max_attempts=3)
+
+        with self.assertRaises(RatingBandError):
+            factory.generate_rated_board(Difficulty.EASY, 5.0, 6.0)
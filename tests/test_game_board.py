@@ -1,6 +1,8 @@
+import pickle
 import unittest
 
 from main.BoardFactory import GameBoard
+from main.GameBoard import IllegalMoveError, Position, note_digits
 
 
 class GameBoardTest(unittest.TestCase):
@@ -38,3 +40,151 @@ class GameBoardTest(unittest.TestCase):
         board.guess(8, 8, 9)
 
         self.assertTrue(board.is_solved())
+
+    def test_larger_boards_accept_moves_across_whole_grid(self):
+        grid = [[0] * 16 for _ in range(16)]
+        board: GameBoard = GameBoard(grid, {(15, 15, 16), (0, 0, 1)})
+
+        self.assertEqual(16, board.get_size())
+        self.assertTrue(board.guess(15, 15, 16))
+        self.assertEqual(256, len(board.get_values()))
+        with self.assertRaises(IllegalMoveError):
+            board.guess(16, 0, 1)
+
+    def test_values_above_nine_are_letters(self):
+        board: GameBoard = GameBoard([[0] * 16 for _ in range(16)], {(0, 0, 10), (15, 15, 16)})
+        board.guess(0, 0, 10)
+        board.guess(15, 15, 16)
+        values = board.get_values()
+
+        self.assertEqual("A", values[0].value)
+        self.assertEqual("G", values[-1].value)
+        self.assertEqual(" ", values[1].value)
+
+    def test_get_board_returns_copy(self):
+        board: GameBoard = GameBoard([[0, 2], [2, 1]], {(0, 0, 1)})
+        grid = board.get_board()
+        grid[0][0] = 9
+
+        self.assertEqual([[0, 2], [2, 1]], board.get_board())
+
+    def test_moves_shrink_as_guesses_are_made(self):
+        board: GameBoard = GameBoard([[0, 0], [2, 1]], {(0, 0, 1), (0, 1, 2)})
+        self.assertEqual({(0, 0, 1), (0, 1, 2)}, board.get_moves())
+
+        self.assertTrue(board.guess(0, 1, 2))
+        self.assertEqual({(0, 0, 1)}, board.get_moves())
+        self.assertFalse(board.is_solved())
+
+    def test_cannot_guess_filled_cell_twice(self):
+        board: GameBoard = GameBoard([[0]], {(0, 0, 1)})
+
+        self.assertTrue(board.guess(0, 0, 1))
+        self.assertFalse(board.guess(0, 0, 1))
+
+    def test_cells_view_is_read_only(self):
+        board: GameBoard = GameBoard([[0, 2], [2, 1]], {(0, 0, 1)})
+        cells = board.get_cells()
+
+        self.assertEqual([0, 2, 2, 1], list(cells))
+        with self.assertRaises(TypeError):
+            cells[0] = 1
+
+    def test_board_round_trips_through_pickle(self):
+        board: GameBoard = GameBoard([[0, 2], [2, 1]], {(0, 0, 1)})
+        copy: GameBoard = pickle.loads(pickle.dumps(board))
+
+        self.assertEqual(board, copy)
+        self.assertEqual(board.get_moves(), copy.get_moves())
+
+    def test_board_has_no_instance_dict(self):
+        self.assertFalse(hasattr(GameBoard([[0]], {(0, 0, 1)}), '__dict__'))
+
+    def test_selection_has_no_duplicates(self):
+        board: GameBoard = GameBoard(self.__solved_grid(), set([]))
+        selection = board.get_selection(1, 2, 6)
+
+        self.assertEqual(len(selection), len(set(selection)))
+        self.assertEqual(20 + 6, len(selection))
+
+    def test_selection_without_number_is_peers(self):
+        board: GameBoard = GameBoard(self.__solved_grid(), set([]))
+        selection = set(board.get_selection(4, 4, 0))
+
+        self.assertEqual(20, len(selection))
+        self.assertIn(Position(4, 0), selection)
+        self.assertIn(Position(0, 4), selection)
+        self.assertIn(Position(3, 5), selection)
+        self.assertNotIn(Position(4, 4), selection)
+
+    def test_selection_includes_guessed_numbers(self):
+        grid = self.__solved_grid()
+        grid[8][8] = 0
+        board: GameBoard = GameBoard(grid, {(8, 8, 9)})
+        self.assertNotIn(Position(8, 8), board.get_selection(0, 1, 9))
+
+        board.guess(8, 8, 9)
+        self.assertIn(Position(8, 8), board.get_selection(0, 1, 9))
+
+    def test_get_value_reads_one_cell(self):
+        board: GameBoard = GameBoard([[0, 0], [2, 1]], {(0, 0, 1), (0, 1, 2)})
+        board.guess(0, 1, 2)
+
+        self.assertEqual(0, board.get_value(0, 0))
+        self.assertEqual(2, board.get_value(0, 1))
+        self.assertEqual(2, board.get_value(1, 0))
+
+    def test_selection_is_rebuilt_after_selecting_another_cell(self):
+        board: GameBoard = GameBoard(self.__solved_grid(), set([]))
+        first = board.get_selection(0, 0, 9)
+        board.get_selection(4, 4, 9)
+
+        self.assertEqual(first, board.get_selection(0, 0, 9))
+        self.assertNotEqual(first, board.get_selection(0, 0, 1))
+
+    def __solved_grid(self) -> list[list[int]]:
+        return [[9, 6, 1, 8, 4, 2, 7, 5, 3],
+                [8, 5, 7, 9, 6, 3, 2, 4, 1],
+                [2, 4, 3, 1, 5, 7, 9, 6, 8],
+                [1, 9, 6, 2, 8, 4, 3, 7, 5],
+                [7, 8, 5, 3, 9, 6, 1, 2, 4],
+                [3, 2, 4, 7, 1, 5, 8, 9, 6],
+                [6, 1, 9, 4, 2, 8, 5, 3, 7],
+                [5, 7, 8, 6, 3, 9, 4, 1, 2],
+                [4, 3, 2, 5, 7, 1, 6, 8, 9]]
+
+    def test_notes_toggle_as_bitmask(self):
+        board: GameBoard = GameBoard([[0] * 4 for _ in range(4)], {(0, 0, 1)})
+
+        self.assertEqual(0b101, board.toggle_note(0, 0, 1) | board.toggle_note(0, 0, 3))
+        self.assertEqual(0b100, board.toggle_note(0, 0, 1))
+        self.assertEqual([3], note_digits(board.get_notes(0, 0)))
+        self.assertEqual(0, board.get_notes(0, 1))
+
+    def test_filled_cells_take_no_notes(self):
+        board: GameBoard = GameBoard([[0, 0], [2, 1]], {(0, 0, 1), (0, 1, 2)})
+
+        self.assertEqual(0, board.toggle_note(1, 0, 1))
+        with self.assertRaises(IllegalMoveError):
+            board.toggle_note(0, 0, 3)
+
+    def test_correct_guess_removes_digit_from_peer_notes(self):
+        grid = [[0] * 9 for _ in range(9)]
+        board: GameBoard = GameBoard(grid, {(0, 0, 5), (8, 8, 1)})
+        for (row, col) in ((0, 8), (8, 0), (2, 2), (8, 8)):
+            board.toggle_note(row, col, 5)
+            board.toggle_note(row, col, 7)
+        board.toggle_note(0, 0, 5)
+
+        self.assertTrue(board.guess(0, 0, 5))
+        self.assertEqual(0, board.get_notes(0, 0))
+        for (row, col) in ((0, 8), (8, 0), (2, 2)):
+            self.assertEqual([7], note_digits(board.get_notes(row, col)))
+        self.assertEqual([5, 7], note_digits(board.get_notes(8, 8)))
+
+    def test_wrong_guess_keeps_notes(self):
+        board: GameBoard = GameBoard([[0, 0], [2, 1]], {(0, 0, 1), (0, 1, 2)})
+        board.toggle_note(0, 1, 1)
+
+        self.assertFalse(board.guess(0, 0, 2))
+        self.assertEqual([1], note_digits(board.get_notes(0, 1)))
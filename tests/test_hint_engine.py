@@ -0,0 +1,65 @@
+import unittest
+
+from main.GameBoard import GameBoard, Position
+from main.HintEngine import HintEngine
+from main.Techniques import Technique
+from main.BoardFactory import Difficulty
+from tests.test_sudoku import StubbedBoardFactory
+
+SOLVED = [[9, 6, 1, 8, 4, 2, 7, 5, 3],
+          [8, 5, 7, 9, 6, 3, 2, 4, 1],
+          [2, 4, 3, 1, 5, 7, 9, 6, 8],
+          [1, 9, 6, 2, 8, 4, 3, 7, 5],
+          [7, 8, 5, 3, 9, 6, 1, 2, 4],
+          [3, 2, 4, 7, 1, 5, 8, 9, 6],
+          [6, 1, 9, 4, 2, 8, 5, 3, 7],
+          [5, 7, 8, 6, 3, 9, 4, 1, 2],
+          [4, 3, 2, 5, 7, 1, 6, 8, 9]]
+
+
+def carve(cells: list[(int, int)]) -> GameBoard:
+    grid = [row[:] for row in SOLVED]
+    for (row, col) in cells:
+        grid[row][col] = 0
+    return GameBoard(grid, {(row, col, SOLVED[row][col]) for (row, col) in cells})
+
+
+class HintEngineTest(unittest.TestCase):
+
+    def test_single_blank_is_a_naked_single(self):
+        hint = HintEngine(StubbedBoardFactory().generate_board(Difficulty.OFF)).hint()
+
+        self.assertIn((hint.row, hint.col, hint.number), {(0, 0, 9), (7, 7, 1)})
+        self.assertEqual(Technique.NAKED_SINGLE, hint.technique)
+        self.assertTrue(hint.reasons)
+        self.assertNotIn(Position(hint.row, hint.col), hint.reasons)
+
+    def test_hint_is_correct_and_advances_with_placements(self):
+        blanks = [(row, col) for row in range(9) for col in range(9) if (row + 2 * col) % 3 == 0]
+        board = carve(blanks)
+        engine = HintEngine(board)
+
+        for _ in blanks:
+            hint = engine.hint()
+            self.assertEqual(SOLVED[hint.row][hint.col], hint.number)
+            self.assertTrue(board.guess(hint.row, hint.col, hint.number))
+            engine.place(hint.row, hint.col, hint.number)
+
+        self.assertIsNone(engine.hint())
+
+    def test_hint_is_cached_until_next_placement(self):
+        engine = HintEngine(carve([(0, 0), (4, 4), (8, 8)]))
+        first = engine.hint()
+
+        self.assertIs(first, engine.hint())
+        engine.place(first.row, first.col, first.number)
+        self.assertNotEqual((first.row, first.col), (engine.hint().row, engine.hint().col))
+
+    def test_falls_back_to_guess_when_no_technique_applies(self):
+        # The four cells form a deadly pattern, so logic alone cannot pick between the two fillings.
+        board = GameBoard([[0, 0, 3, 4], [3, 4, 1, 2], [0, 0, 4, 3], [4, 3, 2, 1]],
+                          {(0, 0, 1), (0, 1, 2), (2, 0, 2), (2, 1, 1)})
+        hint = HintEngine(board).hint()
+
+        self.assertEqual(Technique.GUESS, hint.technique)
+        self.assertIn((hint.row, hint.col, hint.number), board.get_moves())
@@ -0,0 +1,40 @@
+import json
+import unittest
+
+from benchmarks.load_harness import run_load, play_games, percentiles
+from tests.test_sudoku import StubbedBoardFactory
+
+
+class LoadHarnessTest(unittest.TestCase):
+
+    def test_percentiles_use_nearest_rank(self):
+        samples = [ms * 1_000_000 for ms in range(1, 101)]
+
+        self.assertEqual({"p50": 50.0, "p95": 95.0, "p99": 99.0}, percentiles(samples))
+
+    def test_percentiles_of_no_samples_are_zero(self):
+        self.assertEqual({"p50": 0.0, "p95": 0.0, "p99": 0.0}, percentiles([]))
+
+    def test_player_finishes_every_game(self):
+        result = play_games(StubbedBoardFactory, 5, 0.0, seed=1)
+
+        self.assertEqual(5, result.games)
+        self.assertEqual(5, result.wins)
+        self.assertEqual(10, result.guesses)
+        self.assertEqual(5, len(result.start_ns))
+
+    def test_wrong_guesses_can_lose_games(self):
+        result = play_games(StubbedBoardFactory, 5, 1.0, seed=1)
+
+        self.assertEqual(5, result.games)
+        self.assertEqual(0, result.wins)
+
+    def test_report_aggregates_players_and_serializes(self):
+        report = run_load(players=3, games_per_player=4, wrong_rate=0.0, factory_type=StubbedBoardFactory)
+
+        self.assertEqual(12, report.games)
+        self.assertEqual(24, report.guesses)
+        self.assertGreater(report.games_per_second, 0)
+        data = json.loads(report.to_json())
+        self.assertEqual("threads", data["mode"])
+        self.assertEqual({"p50", "p95", "p99"}, set(data["guess_latency_ms"]))
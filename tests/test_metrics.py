@@ -0,0 +1,104 @@
+import json
+import random
+import unittest
+
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.Metrics import MetricsRegistry, metrics, to_json, to_prometheus
+from main.Sudoku import Sudoku, Guess
+from tests.test_sudoku import StubbedBoardFactory
+
+
+class MetricsRegistryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.registry = MetricsRegistry()
+
+    def test_counters_accumulate(self):
+        self.registry.increment("a_total")
+        self.registry.increment("a_total", 4)
+
+        self.assertEqual(5, self.registry.counter("a_total"))
+        self.assertEqual(0, self.registry.counter("missing_total"))
+
+    def test_max_gauge_keeps_largest_value(self):
+        self.registry.observe_max("depth", 3)
+        self.registry.observe_max("depth", 9)
+        self.registry.observe_max("depth", 5)
+
+        self.assertEqual(9, self.registry.gauge("depth"))
+
+    def test_histogram_buckets_values(self):
+        for value in (0.00005, 0.002, 0.002, 3.0):
+            self.registry.observe("t_seconds", value)
+
+        histogram = self.registry.histogram("t_seconds")
+        self.assertEqual(4, histogram.count)
+        self.assertEqual(1, histogram.counts[0])
+        self.assertEqual(1, histogram.counts[-1])
+
+    def test_prometheus_export(self):
+        self.registry.increment("sudoku_carve_attempts_total", 7)
+        self.registry.observe("sudoku_guess_number_seconds", 0.002)
+
+        text = to_prometheus(self.registry)
+        self.assertIn("# TYPE sudoku_carve_attempts_total counter\nsudoku_carve_attempts_total 7\n", text)
+        self.assertIn('sudoku_guess_number_seconds_bucket{le="0.001"} 0\n', text)
+        self.assertIn('sudoku_guess_number_seconds_bucket{le="0.005"} 1\n', text)
+        self.assertIn('sudoku_guess_number_seconds_bucket{le="+Inf"} 1\n', text)
+        self.assertIn("sudoku_guess_number_seconds_count 1\n", text)
+
+    def test_json_export(self):
+        self.registry.increment("a_total", 2)
+        self.registry.observe_max("depth", 4)
+
+        data = json.loads(to_json(self.registry))
+        self.assertEqual(2, data["counters"]["a_total"])
+        self.assertEqual(4, data["gauges"]["depth"])
+
+    def test_reset_clears_everything(self):
+        self.registry.increment("a_total")
+        self.registry.reset()
+
+        self.assertEqual("", to_prometheus(self.registry))
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self) -> None:
+        metrics.disable()
+        metrics.reset()
+
+    def test_generation_records_counters(self):
+        random.seed(5)
+        BoardFactoryImpl().generate_board(Difficulty.HARD)
+
+        self.assertGreater(metrics.counter("sudoku_place_number_calls_total"), 0)
+        self.assertEqual(10, metrics.gauge("sudoku_place_number_max_depth"))
+        self.assertGreaterEqual(metrics.counter("sudoku_carve_attempts_total"), 35)
+
+    def test_is_valid_place_counts_probes(self):
+        factory = BoardFactoryImpl()
+        board = [[0] * 9 for _ in range(9)]
+        factory.is_valid_place(board, 0, 0, 1)
+        factory.is_valid_place(board, 0, 1, 1)
+
+        self.assertEqual(2, metrics.counter("sudoku_is_valid_place_probes_total"))
+
+    def test_sudoku_calls_are_timed(self):
+        sudoku = Sudoku(StubbedBoardFactory())
+        sudoku.start_new_game(Difficulty.EASY)
+        sudoku.guess_number(Guess(0, 0, 9))
+        sudoku.guess_number(Guess(0, 0, 8))
+
+        self.assertEqual(1, metrics.histogram("sudoku_start_new_game_seconds").count)
+        self.assertEqual(2, metrics.histogram("sudoku_guess_number_seconds").count)
+
+    def test_nothing_is_recorded_when_disabled(self):
+        metrics.disable()
+        BoardFactoryImpl().generate_board(Difficulty.EASY)
+
+        self.assertEqual({"counters": {}, "gauges": {}, "histograms": {}}, metrics.snapshot())
@@ -0,0 +1,117 @@
+import time
+import unittest
+from threading import Event, current_thread
+
+from main.BoardFactory import BoardFactory, BoardFactoryImpl, Difficulty
+from main.GameBoard import GameBoard
+from main.PooledBoardFactory import PooledBoardFactory
+
+
+class CountingBoardFactory(BoardFactory):
+
+    def __init__(self):
+        self.generated = 0
+        self.refill_allowed = Event()
+        self.refill_allowed.set()
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        if current_thread().name == "board-pool-refill":
+            self.refill_allowed.wait()
+        self.generated += 1
+        return GameBoard([[self.generated]], set([]))
+
+
+class FailingOnceBoardFactory(CountingBoardFactory):
+
+    def __init__(self):
+        super().__init__()
+        self.failed = Event()
+
+    def generate_board(self, difficulty: Difficulty) -> GameBoard:
+        if not self.failed.is_set():
+            self.failed.set()
+            raise RuntimeError("generator broke")
+        return super().generate_board(difficulty)
+
+
+class PooledBoardFactoryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.factory = CountingBoardFactory()
+        self.pool = PooledBoardFactory(self.factory, (Difficulty.EASY,), low_watermark=2, high_watermark=4)
+
+    def tearDown(self) -> None:
+        self.factory.refill_allowed.set()
+        self.pool.close()
+
+    def wait_for_pool_size(self, size: int):
+        deadline = time.monotonic() + 5
+        while self.pool.pool_size(Difficulty.EASY) != size:
+            if time.monotonic() > deadline:
+                self.fail(f"Pool never reached {size} boards")
+            time.sleep(0.001)
+
+    def test_fills_pool_to_high_watermark(self):
+        self.wait_for_pool_size(4)
+        time.sleep(0.05)
+
+        self.assertEqual(4, self.pool.pool_size(Difficulty.EASY))
+        self.assertEqual(4, self.factory.generated)
+
+    def test_serves_pooled_boards_as_hits(self):
+        self.wait_for_pool_size(4)
+        board = self.pool.generate_board(Difficulty.EASY)
+
+        self.assertEqual(GameBoard([[1]], set([])), board)
+        self.assertEqual(1, self.pool.hits())
+        self.assertEqual(0, self.pool.misses())
+
+    def test_refills_only_after_dropping_below_low_watermark(self):
+        self.wait_for_pool_size(4)
+        self.pool.generate_board(Difficulty.EASY)
+        self.pool.generate_board(Difficulty.EASY)
+        time.sleep(0.05)
+        self.assertEqual(2, self.pool.pool_size(Difficulty.EASY))
+
+        self.pool.generate_board(Difficulty.EASY)
+        self.wait_for_pool_size(4)
+
+    def test_generates_directly_when_pool_is_empty(self):
+        self.wait_for_pool_size(4)
+        self.factory.refill_allowed.clear()
+        for _ in range(4):
+            self.pool.generate_board(Difficulty.EASY)
+
+        self.assertIsNotNone(self.pool.generate_board(Difficulty.EASY))
+        self.assertEqual(4, self.pool.hits())
+        self.assertEqual(1, self.pool.misses())
+
+    def test_unpooled_difficulty_is_a_miss(self):
+        self.pool.generate_board(Difficulty.HARD)
+
+        self.assertEqual(1, self.pool.misses())
+
+    def test_refill_survives_a_failing_factory(self):
+        self.pool.close()
+        factory = FailingOnceBoardFactory()
+        with self.assertLogs("main.PooledBoardFactory", "ERROR") as logs:
+            self.pool = PooledBoardFactory(factory, (Difficulty.EASY,), low_watermark=2, high_watermark=4)
+            self.assertTrue(factory.failed.wait(5))
+            deadline = time.monotonic() + 5
+            while not logs.output and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+        self.assertEqual("generator broke", str(logs.records[0].exc_info[1]))
+        self.assertIsNotNone(self.pool.generate_board(Difficulty.EASY))
+        self.wait_for_pool_size(4)
+
+    def test_generate_boards_delegates_to_wrapped_factory(self):
+        pool = PooledBoardFactory(BoardFactoryImpl(), (Difficulty.EASY,))
+        try:
+            boards = list(pool.generate_boards(3, Difficulty.EASY, workers=1))
+        finally:
+            pool.close()
+
+        self.assertEqual(3, len(boards))
+        for game in boards:
+            self.assertEqual(15, len(game.get_moves()))
@@ -0,0 +1,63 @@
+import unittest
+
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.PuzzleCarver import PuzzleCarver, Symmetry
+from main.solver.DancingLinksSolver import DancingLinksSolver
+
+
+class PuzzleCarverTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.carver = PuzzleCarver()
+        self.solver = DancingLinksSolver()
+        self.board: list[list[int]] = BoardFactoryImpl().generate_board(Difficulty.OFF).get_board()
+
+    def test_carves_requested_number_of_squares(self):
+        removed = self.carver.carve(self.board, 40)
+
+        self.assertEqual(40, len(removed))
+        self.assertEqual(40, sum(row.count(0) for row in self.board))
+
+    def test_removed_squares_hold_original_values(self):
+        solution = [row[:] for row in self.board]
+        removed = self.carver.carve(self.board, 30)
+
+        for (row, col, val) in removed:
+            self.assertEqual(0, self.board[row][col])
+            self.assertEqual(solution[row][col], val)
+
+    def test_carved_board_has_unique_solution(self):
+        solution = [row[:] for row in self.board]
+        self.carver.carve(self.board, 50)
+
+        self.assertEqual(1, self.solver.count_solutions(self.board))
+        self.assertEqual(solution, self.solver.solve(self.board))
+
+    def test_stops_when_no_square_can_be_removed(self):
+        removed = self.carver.carve(self.board, 81)
+
+        self.assertLess(len(removed), 81)
+        self.assertEqual(1, self.solver.count_solutions(self.board))
+
+    def test_carving_every_square_leaves_a_minimal_puzzle(self):
+        self.carver.carve(self.board, 81)
+
+        for (row, col) in [(r, c) for r in range(9) for c in range(9) if self.board[r][c] != 0]:
+            val = self.board[row][col]
+            self.board[row][col] = 0
+            self.assertEqual(2, self.solver.count_solutions(self.board))
+            self.board[row][col] = val
+
+    def test_rotational_symmetry_removes_squares_in_pairs(self):
+        removed = PuzzleCarver(symmetry=Symmetry.ROTATIONAL).carve(self.board, 81)
+
+        for (row, col, _) in removed:
+            self.assertEqual(0, self.board[8 - row][8 - col])
+        self.assertEqual(1, self.solver.count_solutions(self.board))
+
+    def test_mirror_symmetry_never_exceeds_requested_squares(self):
+        removed = PuzzleCarver(symmetry=Symmetry.MIRROR).carve(self.board, 41)
+
+        self.assertLessEqual(len(removed), 41)
+        for (row, col, _) in removed:
+            self.assertEqual(0, self.board[row][8 - col])
@@ -0,0 +1,104 @@
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+from random import Random
+
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.GameBoard import GameBoard
+from main.PuzzleCorpus import CorpusBoardFactory, CorpusFormatError, PuzzleCorpus, PuzzleCorpusWriter
+
+
+class PuzzleCorpusTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        factory = BoardFactoryImpl()
+        self.easy: list[GameBoard] = [factory.generate_board(Difficulty.EASY) for _ in range(3)]
+        self.hard: list[GameBoard] = [factory.generate_board(Difficulty.HARD) for _ in range(5)]
+        handle, self.path = tempfile.mkstemp(suffix='.corpus')
+        os.close(handle)
+        with PuzzleCorpusWriter(self.path) as writer:
+            writer.write_section(Difficulty.EASY, self.easy)
+            writer.write_section(Difficulty.HARD, iter(self.hard))
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_file_is_header_plus_fixed_width_records(self):
+        self.assertEqual(PuzzleCorpus.HEADER_SIZE + 8 * PuzzleCorpus.RECORD_SIZE, os.path.getsize(self.path))
+
+    def test_counts_puzzles_per_difficulty(self):
+        with PuzzleCorpus(self.path) as corpus:
+            self.assertEqual(3, corpus.count(Difficulty.EASY))
+            self.assertEqual(5, corpus.count(Difficulty.HARD))
+            self.assertEqual(0, corpus.count(Difficulty.MEDIUM))
+
+    def test_round_trips_boards_and_solutions(self):
+        with PuzzleCorpus(self.path) as corpus:
+            for index, expected in enumerate(self.hard):
+                board = corpus.get(Difficulty.HARD, index)
+                self.assertEqual(expected, board)
+                self.assertEqual(expected.get_moves(), board.get_moves())
+
+    def test_lookup_out_of_range_raises(self):
+        with PuzzleCorpus(self.path) as corpus:
+            with self.assertRaises(IndexError):
+                corpus.get(Difficulty.EASY, 3)
+            with self.assertRaises(IndexError):
+                corpus.get(Difficulty.MEDIUM, 0)
+
+    def test_factory_serves_solvable_boards_for_difficulty(self):
+        with PuzzleCorpus(self.path) as corpus:
+            factory = CorpusBoardFactory(corpus, Random(3))
+            board = factory.generate_board(Difficulty.EASY)
+            self.assertIn(board, self.easy)
+
+            for (row, col, val) in board.get_moves():
+                self.assertTrue(board.guess(row, col, val))
+            self.assertTrue(board.is_solved())
+
+    def test_factory_without_puzzles_for_difficulty_raises(self):
+        with PuzzleCorpus(self.path) as corpus:
+            with self.assertRaises(LookupError):
+                CorpusBoardFactory(corpus).generate_board(Difficulty.MEDIUM)
+
+    def test_rejects_files_that_are_not_a_corpus(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'\1' * PuzzleCorpus.HEADER_SIZE)
+
+        with self.assertRaises(CorpusFormatError):
+            PuzzleCorpus(self.path)
+
+    def test_unknown_difficulty_is_a_format_error_and_closes_file(self):
+        header = bytearray(PuzzleCorpus.encode_header({Difficulty.EASY: 0}))
+        header[12] = 99
+        with open(self.path, 'wb') as file:
+            file.write(header)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with self.assertRaises(CorpusFormatError):
+                PuzzleCorpus(self.path)
+            gc.collect()
+        self.assertFalse([w for w in caught if issubclass(w.category, ResourceWarning)])
+
+    def test_unknown_difficulty_in_record_is_a_format_error(self):
+        record = bytearray(PuzzleCorpus.encode_record(self.easy[0], Difficulty.EASY))
+        record[82] = 99
+
+        with self.assertRaises(CorpusFormatError):
+            PuzzleCorpus.decode_record(bytes(record))
+
+    def test_encoding_other_board_sizes_is_rejected(self):
+        board = BoardFactoryImpl(size=16).generate_board(Difficulty.EASY)
+
+        with self.assertRaises(CorpusFormatError):
+            PuzzleCorpus.encode_record(board, Difficulty.EASY)
+
+    def test_encoding_values_that_do_not_fit_is_rejected(self):
+        grid = self.easy[0].get_board()
+        grid[0][0] = 16
+
+        with self.assertRaises(CorpusFormatError):
+            PuzzleCorpus.encode_record(GameBoard(grid, set([])), Difficulty.EASY)
@@ -1,7 +1,7 @@
 import unittest
 
 from main.GameBoard import GameBoard, IllegalMoveError, Position, Value
-from main.Sudoku import Sudoku, Guess, IllegalStateException
+from main.Sudoku import Sudoku, Guess, IllegalStateException, BoardFormatter
 from main.BoardFactory import BoardFactory, Difficulty
 
 
@@ -111,6 +111,36 @@ class SudokuTest(unittest.TestCase):
 """
         self.assertEqual(board, str(self.s))
 
+    def test_can_print_smaller_board(self):
+        board: str = """\
+==================
+| 1 | 2 ||   | 4 |
+| 3 | 4 || 1 | 2 |
+========||========
+| 2 | 1 || 4 | 3 |
+| 4 | 3 || 2 | 1 |
+==================
+"""
+        self.assertEqual(board, BoardFormatter([[1, 2, 0, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]).format())
+
+    def test_hint_points_at_a_remaining_move(self):
+        hint = self.s.get_hint()
+
+        self.assertIn((hint.row, hint.col, hint.number), {(0, 0, 9), (7, 7, 1)})
+
+    def test_hint_follows_correct_guesses(self):
+        self.s.get_hint()
+        self.s.guess_number(Guess(0, 0, 9))
+
+        hint = self.s.get_hint()
+        self.assertEqual((7, 7, 1), (hint.row, hint.col, hint.number))
+
+    def test_no_hint_once_board_is_solved(self):
+        self.s.guess_number(Guess(0, 0, 9))
+        self.s.guess_number(Guess(7, 7, 1))
+
+        self.assertIsNone(self.s.get_hint())
+
     def test_get_values(self):
         itr = self.s.get_values()
         self.assertEqual(81, len(itr))
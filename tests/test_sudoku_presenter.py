@@ -1,8 +1,13 @@
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from main.BoardFactory import Difficulty
+from main.BoardFactory import BoardFactory, Difficulty
 from main.gui.GuiRunner import SudokuPresenter, SudokuViewInterface
+from main.gui.SudokuViewInterface import CellChange, CellStyle
 from main.Sudoku import Sudoku
+from main.BoardFactory import BoardFactoryImpl
 from tests.test_sudoku import StubbedBoardFactory
 
 
@@ -20,10 +25,20 @@ class SpySudokuInterface(SudokuViewInterface):
         self.unhighlights = set([])
         self.end_game_enabled = False
         self.moves: [(int, int, str)] = []
+        self.batches: [list[CellChange]] = []
+        self.notes: dict[(int, int), list[int]] = {}
+        self.generating = False
+
+    def apply_changes(self, changes: list[CellChange]):
+        self.batches.append(changes)
+        super().apply_changes(changes)
 
     def set_grid_value(self, row: int, col: int, num: str):
         self.moves.append((row, col, num))
 
+    def set_cell_notes(self, row: int, col: int, notes: list[int]):
+        self.notes[(row, col)] = notes
+
     def disable_start_button(self) -> None:
         self.start_disabled = not self.start_disabled
 
@@ -55,6 +70,9 @@ class SpySudokuInterface(SudokuViewInterface):
     def disable_end_game_button(self) -> None:
         self.end_game_enabled = False
 
+    def show_generating(self, generating: bool):
+        self.generating = generating
+
 
 class TestSudokuPresenter(unittest.TestCase):
 
@@ -101,16 +119,18 @@ class TestSudokuPresenter(unittest.TestCase):
         self.assertFalse(self.view_spy.start_disabled)
 
     def test_guessing_number_deactivates_cell(self):
+        self.presenter.select(0, 0)
         self.presenter.guess_number(0, 0, "9")
 
-        self.assertTrue(self.view_spy.last_deactivated)
+        self.assertTrue((0, 0) in self.view_spy.unhighlights)
 
     def test_choosing_cell_sets_active_cell_and_deactivates_old(self):
         self.presenter.select(0, 0)
         self.presenter.select(0, 2)
 
         self.assertEqual((0, 2), self.view_spy.active_cell)
-        self.assertEqual((0, 0), self.view_spy.last_deactivated)
+        self.assertNotIn((0, 0), self.view_spy.unhighlights)
+        self.assertIn(CellChange(0, 0, style=CellStyle.HIGHLIGHTED), self.view_spy.batches[-1])
 
     def test_choosing_cell_highlights_row_and_col_except_selected_cell(self):
         self.presenter.select(0, 0)
@@ -122,8 +142,11 @@ class TestSudokuPresenter(unittest.TestCase):
         self.presenter.select(1, 2)
         self.presenter.select(0, 0)
 
-        self.__row_was_unhighlighted(2, 1)
-        self.__col_was_unhighlighted(1, 2)
+        for col in range(3, 9):
+            self.assertIn((1, col), self.view_spy.unhighlights)
+        for row in range(3, 9):
+            self.assertIn((row, 2), self.view_spy.unhighlights)
+        self.assertNotIn((0, 2), self.view_spy.unhighlights)
 
     def test_choosing_cell_highlights_square_of_selected_cell(self):
         self.presenter.select(1, 2)
@@ -132,7 +155,7 @@ class TestSudokuPresenter(unittest.TestCase):
 
     def test_choosing_cell_unhighlights_previous_square_of_selected_cell(self):
         self.presenter.select(1, 2)
-        self.presenter.select(0, 0)
+        self.presenter.select(4, 4)
 
         self.__square_was_modified(1, 2, self.view_spy.unhighlights)
 
@@ -149,9 +172,10 @@ class TestSudokuPresenter(unittest.TestCase):
         self.presenter.select(1, 2, 6)
         self.presenter.select(1, 2, 9)
 
-        expected_values = {(0, 1), (1, 4), (2, 7), (3, 2), (4, 5), (5, 8), (6, 0), (7, 3), (8, 6)}
+        expected_values = {(2, 7), (4, 5), (5, 8), (6, 0), (7, 3), (8, 6)}
         for (row, col) in expected_values:
             self.assertTrue((row, col) in self.view_spy.unhighlights)
+        self.assertFalse((1, 4) in self.view_spy.unhighlights)
 
     def test_shouldnt_highlight_number_when_zero(self):
         self.presenter.select(3, 3, 0)
@@ -180,9 +204,119 @@ class TestSudokuPresenter(unittest.TestCase):
         self.view_spy.moves.clear()
         self.presenter.end_game()
 
-        self.assertEqual(81, len(self.view_spy.moves))
+        self.assertEqual(79, len(self.view_spy.moves))
         self.assertEqual(0, len(list(filter(lambda move: move[2] != " ", self.view_spy.moves))))
 
+    def test_ending_game_clears_guessed_cells(self):
+        self.presenter.guess_number(0, 0, "9")
+        self.view_spy.moves.clear()
+        self.presenter.end_game()
+
+        self.assertIn((0, 0, " "), self.view_spy.moves)
+
+    def test_ending_game_clears_whole_board_of_other_sizes(self):
+        view = SpySudokuInterface()
+        presenter = SudokuPresenter(view, Sudoku(BoardFactoryImpl(size=16)))
+        presenter.start_new_game(Difficulty.EASY)
+        presenter.select(15, 15)
+        view.moves.clear()
+        presenter.end_game()
+
+        self.assertEqual((15, 15), view.active_cell)
+        self.assertEqual(256 - Difficulty.EASY.empty_squares(16), len(view.moves))
+        self.assertTrue(all(num == " " for (_, _, num) in view.moves))
+
+    def test_guesses_above_nine_are_shown_as_letters(self):
+        view = SpySudokuInterface()
+        sudoku = Sudoku(BoardFactoryImpl(size=16))
+        presenter = SudokuPresenter(view, sudoku)
+        presenter.start_new_game(Difficulty.EASY)
+        row, col = next((row, col) for row in range(16) for col in range(16) if sudoku.get_value(row, col) == 0)
+        presenter.guess_number(row, col, "10")
+
+        self.assertEqual((row, col, "A"), view.moves[-1])
+
+    def test_hint_activates_hinted_cell_and_highlights_reasons(self):
+        self.presenter.show_hint()
+
+        self.assertIn(self.view_spy.active_cell, {(0, 0), (7, 7)})
+        self.assertTrue(self.view_spy.highlights)
+        self.assertEqual(2, len(self.view_spy.batches))
+
+    def test_hint_without_game_does_nothing(self):
+        self.presenter.end_game()
+        batches = len(self.view_spy.batches)
+        self.presenter.show_hint()
+
+        self.assertEqual(batches, len(self.view_spy.batches))
+
+    def test_toggling_note_renders_only_that_cell(self):
+        self.presenter.toggle_note(0, 0, "3")
+        self.presenter.toggle_note(0, 0, "9")
+
+        self.assertEqual({(0, 0): [3, 9]}, self.view_spy.notes)
+        self.assertEqual([CellChange(0, 0, notes=0b100000100)], self.view_spy.batches[-1])
+
+    def test_note_on_wrong_guess_clears_the_guess(self):
+        self.presenter.guess_number(0, 0, "5")
+        self.presenter.toggle_note(0, 0, "3")
+
+        self.assertEqual([CellChange(0, 0, value=" ", notes=0b100)], self.view_spy.batches[-1])
+        self.presenter.guess_number(0, 0, "5")
+        self.assertEqual((0, 0, "5"), self.view_spy.moves[-1])
+
+    def test_note_on_filled_cell_changes_nothing(self):
+        batches = len(self.view_spy.batches)
+        self.presenter.toggle_note(0, 1, "3")
+
+        self.assertEqual(batches, len(self.view_spy.batches))
+
+    def test_correct_guess_redraws_only_peers_whose_notes_changed(self):
+        self.presenter.toggle_note(0, 0, "1")
+        self.presenter.toggle_note(7, 7, "9")
+        self.presenter.toggle_note(7, 7, "1")
+        self.presenter.guess_number(0, 0, "9")
+
+        changed_notes = {(change.row, change.col) for change in self.view_spy.batches[-1] if change.notes is not None}
+        self.assertEqual({(0, 0)}, changed_notes)
+        self.assertEqual([], self.view_spy.notes[(0, 0)])
+
+    def test_peer_notes_lose_guessed_digit(self):
+        board = Sudoku(BoardFactoryImpl())
+        view = SpySudokuInterface()
+        presenter = SudokuPresenter(view, board)
+        presenter.start_new_game(Difficulty.HARD)
+        hint = board.get_hint()
+        row, col, num = hint.row, hint.col, hint.number
+        peer = next(pos for pos in board.get_selection(row, col, 0) if board.get_user_board()[pos.row][pos.col] == 0)
+        presenter.toggle_note(peer.row, peer.col, str(num))
+        presenter.guess_number(row, col, str(num))
+
+        self.assertEqual([], view.notes[(peer.row, peer.col)])
+        self.assertIn(CellChange(peer.row, peer.col, notes=0), view.batches[-1])
+
+    def test_each_action_sends_a_single_batch(self):
+        self.assertEqual(1, len(self.view_spy.batches))
+
+        self.presenter.select(1, 2)
+        self.presenter.guess_number(0, 0, "9")
+
+        self.assertEqual(3, len(self.view_spy.batches))
+
+    def test_reselecting_same_cell_sends_no_changes(self):
+        self.presenter.select(1, 2, 6)
+        self.presenter.select(1, 2, 6)
+
+        self.assertEqual(2, len(self.view_spy.batches))
+
+    def test_moving_selection_only_sends_changed_cells(self):
+        self.presenter.select(0, 0)
+        self.presenter.select(0, 1)
+
+        changed = {(change.row, change.col) for change in self.view_spy.batches[-1]}
+        self.assertEqual({(0, 0), (0, 1), (3, 0), (4, 0), (5, 0), (6, 0), (7, 0), (8, 0),
+                          (3, 1), (4, 1), (5, 1), (6, 1), (7, 1), (8, 1)}, changed)
+
     def __row_was_highlighted(self, col_exclude: int, row: int):
         for col in range(9):
             if col != col_exclude and (row, col) not in self.view_spy.highlights:
@@ -202,16 +336,6 @@ class TestSudokuPresenter(unittest.TestCase):
                     if (x, y) not in moves:
                         self.fail(f"Expected to find (row={x}, col={y}), but only had {moves})")
 
-    def __row_was_unhighlighted(self, col_exclude: int, row: int):
-        for col in range(9):
-            if col != col_exclude and (row, col) not in self.view_spy.unhighlights:
-                self.fail(f"Expected to find (row={row}, col={col})")
-
-    def __col_was_unhighlighted(self, row_exclude: int, col: int):
-        for row in range(9):
-            if row != row_exclude and (row, col) not in self.view_spy.unhighlights:
-                self.fail(f"Expected to find (row={row}, col={col})")
-
     def __get_starting(self, num: int) -> int:
         if 0 <= num <= 2:
             return 0
@@ -219,3 +343,135 @@ class TestSudokuPresenter(unittest.TestCase):
             return 3
         else:
             return 6
+
+
+class QueuedSpySudokuInterface(SpySudokuInterface):
+
+    def __init__(self):
+        super().__init__()
+        self.posted = []
+
+    def post(self, callback):
+        self.posted.append(callback)
+
+    def run_posted(self):
+        while self.posted:
+            self.posted.pop(0)()
+
+
+class GatedBoardFactory(BoardFactory):
+
+    def __init__(self, error: Exception = None):
+        self.release = threading.Event()
+        self.error = error
+        self.calls = 0
+        self.gates: list[threading.Event] = []
+
+    def generate_board(self, difficulty: Difficulty):
+        gate = threading.Event()
+        self.gates.append(gate)
+        self.calls += 1
+        while not (gate.is_set() or self.release.is_set()):
+            gate.wait(0.01)
+        if self.error is not None:
+            raise self.error
+        return StubbedBoardFactory().generate_board(difficulty)
+
+    def wait_for_call(self, count: int):
+        for _ in range(500):
+            if len(self.gates) >= count:
+                return self.gates[count - 1]
+            time.sleep(0.01)
+        raise AssertionError(f"generate_board was not called {count} times")
+
+
+class TestBackgroundGeneration(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.view_spy = QueuedSpySudokuInterface()
+        self.factory = GatedBoardFactory()
+        self.executors: list[ThreadPoolExecutor] = []
+        self.presenter = SudokuPresenter(self.view_spy, Sudoku(self.factory), self.__new_executor)
+
+    def tearDown(self) -> None:
+        self.factory.release.set()
+        self.__wait_for_executors()
+
+    def __new_executor(self) -> ThreadPoolExecutor:
+        self.executors.append(ThreadPoolExecutor(1))
+        return self.executors[-1]
+
+    def __wait_for_executors(self):
+        for executor in self.executors:
+            executor.shutdown(wait=True)
+
+    def __finish_generation(self):
+        self.factory.release.set()
+        self.__wait_for_executors()
+        self.view_spy.run_posted()
+
+    def test_start_returns_before_board_is_generated(self):
+        self.presenter.start_new_game(Difficulty.EASY)
+
+        self.assertTrue(self.view_spy.generating)
+        self.assertTrue(self.view_spy.start_disabled)
+        self.assertTrue(self.presenter.is_generating())
+        self.assertEqual([], self.view_spy.moves)
+
+    def test_generated_board_is_shown_on_the_ui_thread(self):
+        self.presenter.start_new_game(Difficulty.EASY)
+        self.__finish_generation()
+
+        self.assertFalse(self.view_spy.generating)
+        self.assertFalse(self.presenter.is_generating())
+        self.assertTrue(self.view_spy.end_game_enabled)
+        self.assertEqual(81, len(self.view_spy.moves))
+
+    def test_cancelled_generation_is_discarded(self):
+        self.presenter.start_new_game(Difficulty.EASY)
+        self.presenter.cancel_new_game()
+
+        self.assertFalse(self.view_spy.generating)
+        self.assertFalse(self.view_spy.start_disabled)
+        self.__finish_generation()
+        self.assertEqual([], self.view_spy.moves)
+        self.assertFalse(self.view_spy.end_game_enabled)
+
+    def test_new_game_can_start_after_cancel(self):
+        self.presenter.start_new_game(Difficulty.EASY)
+        self.presenter.cancel_new_game()
+        self.presenter.start_new_game(Difficulty.HARD)
+        self.__finish_generation()
+
+        self.assertEqual(2, self.factory.calls)
+        self.assertEqual(81, len(self.view_spy.moves))
+
+    def test_new_game_after_cancel_does_not_wait_for_the_abandoned_one(self):
+        self.presenter.start_new_game(Difficulty.EASY)
+        self.factory.wait_for_call(1)
+        self.presenter.cancel_new_game()
+        self.presenter.start_new_game(Difficulty.HARD)
+        self.factory.wait_for_call(2).set()
+        self.executors[1].shutdown(wait=True)
+        self.view_spy.run_posted()
+
+        self.assertFalse(self.factory.gates[0].is_set())
+        self.assertFalse(self.presenter.is_generating())
+        self.assertEqual(81, len(self.view_spy.moves))
+
+    def test_second_request_while_generating_is_ignored(self):
+        self.presenter.start_new_game(Difficulty.EASY)
+        self.presenter.start_new_game(Difficulty.HARD)
+        self.__finish_generation()
+
+        self.assertEqual(1, self.factory.calls)
+
+    def test_failed_generation_reports_error_and_enables_start(self):
+        self.factory.error = LookupError("no boards")
+        self.presenter.start_new_game(Difficulty.EASY)
+        self.__finish_generation()
+
+        self.assertEqual("Error", self.view_spy.title)
+        self.assertIn("no boards", self.view_spy.msg)
+        self.assertFalse(self.view_spy.start_disabled)
+        self.assertFalse(self.view_spy.generating)
@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+
+from main.BoardFactory import BoardFactory, BoardFactoryImpl, Difficulty
+from main.GameBoard import SYMBOLS
+from main.SudokuServer import SudokuServer, SudokuClient
+from tests.test_sudoku import StubbedBoardFactory
+
+
+class SudokuServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        self.server = SudokuServer(StubbedBoardFactory(), max_line=64)
+        self.port = await self.server.start()
+        self.client = await self.connect()
+
+    async def asyncTearDown(self) -> None:
+        await self.client.close()
+        await self.server.close()
+
+    async def connect(self) -> SudokuClient:
+        client = SudokuClient()
+        await client.connect("127.0.0.1", self.port)
+        return client
+
+    async def test_new_game_returns_board(self):
+        response = await self.client.send("NEW easy")
+
+        self.assertEqual("BOARD 061842753857963241243157968196284375785396124324715896"
+                         "619428537578639402432571689", response)
+
+    async def test_correct_guess_for_last_number_wins(self):
+        await self.client.send("NEW easy")
+
+        self.assertEqual("CORRECT", await self.client.send("GUESS 1 1 9"))
+        self.assertEqual("CORRECT WIN", await self.client.send("GUESS 8 8 1"))
+
+    async def test_three_wrong_guesses_loses(self):
+        await self.client.send("NEW hard")
+        await self.client.send("GUESS 1 1 1")
+        await self.client.send("GUESS 1 1 2")
+
+        self.assertEqual("WRONG LOSE", await self.client.send("GUESS 1 1 3"))
+
+    async def test_guess_without_game_is_an_error(self):
+        self.assertEqual("ERROR No game in progress", await self.client.send("GUESS 1 1 9"))
+
+    async def test_second_new_game_must_end_first(self):
+        await self.client.send("NEW easy")
+
+        self.assertEqual("ERROR Please end current game to start a new one.", await self.client.send("NEW easy"))
+        self.assertEqual("OK", await self.client.send("END"))
+        self.assertTrue((await self.client.send("NEW medium")).startswith("BOARD "))
+
+    async def test_board_reflects_guesses(self):
+        await self.client.send("NEW easy")
+        await self.client.send("GUESS 1 1 9")
+
+        self.assertTrue((await self.client.send("BOARD")).startswith("BOARD 961842753"))
+
+    async def test_malformed_commands_are_errors(self):
+        self.assertTrue((await self.client.send("JUMP")).startswith("ERROR"))
+        self.assertTrue((await self.client.send("NEW impossible")).startswith("ERROR"))
+        await self.client.send("NEW easy")
+        self.assertTrue((await self.client.send("GUESS a b c")).startswith("ERROR"))
+        self.assertTrue((await self.client.send("GUESS 10 1 1")).startswith("ERROR"))
+
+    async def test_overlong_line_closes_connection(self):
+        self.assertEqual("ERROR Line too long", await self.client.send("BOARD " + "x" * 200))
+
+    async def test_non_ascii_line_is_an_error_and_keeps_the_session(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        try:
+            writer.write(b"\xffHELLO\n")
+            await writer.drain()
+            self.assertEqual(b"ERROR Commands must be ASCII\n", await reader.readline())
+
+            writer.write(b"BOARD\n")
+            await writer.drain()
+            self.assertEqual(b"ERROR No game in progress\n", await reader.readline())
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_failed_board_generation_is_an_error(self):
+        server = SudokuServer(FailingBoardFactory())
+        port = await server.start()
+        client = SudokuClient()
+        await client.connect("127.0.0.1", port)
+        try:
+            self.assertEqual("ERROR Could not generate a board: no boards", await client.send("NEW easy"))
+            self.assertEqual("ERROR No game in progress", await client.send("BOARD"))
+        finally:
+            await client.close()
+            await server.close()
+
+    async def test_quit_closes_session(self):
+        self.assertEqual("BYE", await self.client.send("QUIT"))
+
+    async def test_sessions_are_independent(self):
+        other = await self.connect()
+        try:
+            await self.client.send("NEW easy")
+            await other.send("NEW easy")
+            await self.client.send("GUESS 1 1 9")
+
+            self.assertTrue((await other.send("BOARD")).startswith("BOARD 061842753"))
+            self.assertEqual(2, self.server.session_count())
+        finally:
+            await other.close()
+
+    async def test_many_concurrent_sessions(self):
+        clients = await asyncio.gather(*(self.connect() for _ in range(100)))
+        try:
+            responses = await asyncio.gather(*(client.send("NEW easy") for client in clients))
+            self.assertTrue(all(response.startswith("BOARD ") for response in responses))
+
+            responses = await asyncio.gather(*(client.send("GUESS 1 1 9") for client in clients))
+            self.assertEqual(["CORRECT"] * 100, responses)
+        finally:
+            await asyncio.gather(*(client.close() for client in clients))
+
+    async def test_large_boards_use_letters_and_accept_large_numbers(self):
+        server = SudokuServer(BoardFactoryImpl(size=16))
+        port = await server.start()
+        client = SudokuClient()
+        await client.connect("127.0.0.1", port)
+        try:
+            board = (await client.send("NEW easy")).split()[1]
+            self.assertEqual(256, len(board))
+            self.assertTrue(set(board) <= set(SYMBOLS[:17]))
+            self.assertIn(await client.send("GUESS 1 1 16"), ("CORRECT", "WRONG"))
+            self.assertTrue((await client.send("GUESS 1 1 17")).startswith("ERROR Number must be between 1 and 16"))
+        finally:
+            await client.close()
+            await server.close()
+
+
+class FailingBoardFactory(BoardFactory):
+
+    def generate_board(self, difficulty: Difficulty):
+        raise LookupError("no boards")
@@ -0,0 +1,60 @@
+import unittest
+
+from main.BoardFactory import BoardFactoryImpl, Difficulty
+from main.solver.DancingLinksSolver import DancingLinksSolver
+from main.TransformBoardFactory import TransformBoardFactory
+
+
+class TransformBoardFactoryTest(unittest.TestCase):
+    seed = [[1, 2, 3, 4, 5, 6, 7, 8, 9],
+            [4, 5, 6, 7, 8, 9, 1, 2, 3],
+            [7, 8, 9, 1, 2, 3, 4, 5, 6],
+            [2, 3, 4, 5, 6, 7, 8, 9, 1],
+            [5, 6, 7, 8, 9, 1, 2, 3, 4],
+            [8, 9, 1, 2, 3, 4, 5, 6, 7],
+            [3, 4, 5, 6, 7, 8, 9, 1, 2],
+            [6, 7, 8, 9, 1, 2, 3, 4, 5],
+            [9, 1, 2, 3, 4, 5, 6, 7, 8]]
+
+    def setUp(self) -> None:
+        self.factory = TransformBoardFactory([self.seed])
+        self.solver = DancingLinksSolver()
+
+    def test_transformed_grids_are_complete_and_valid(self):
+        for _ in range(20):
+            grid = self.factory.random_grid()
+            self.assertEqual(1, self.solver.count_solutions(grid))
+            for row in grid:
+                self.assertEqual(set(range(1, 10)), set(row))
+
+    def test_transforms_produce_distinct_grids(self):
+        grids = {str(self.factory.random_grid()) for _ in range(20)}
+
+        self.assertGreater(len(grids), 15)
+
+    def test_seed_grid_is_not_modified(self):
+        seed = [row[:] for row in self.seed]
+        TransformBoardFactory([seed]).random_grid()
+
+        self.assertEqual(self.seed, seed)
+
+    def test_generated_board_has_unique_solution(self):
+        game = self.factory.generate_board(Difficulty.HARD)
+
+        self.assertEqual(35, len(game.get_moves()))
+        self.assertEqual(1, self.solver.count_solutions(game.get_board()))
+
+    def test_default_seed_bank_generates_boards(self):
+        game = TransformBoardFactory(bank_size=1).generate_board(Difficulty.EASY)
+
+        self.assertEqual(15, len(game.get_moves()))
+
+    def test_requires_a_seed(self):
+        with self.assertRaises(ValueError):
+            TransformBoardFactory([])
+
+    def test_carves_by_the_seed_grid_size(self):
+        grid = BoardFactoryImpl(size=16).generate_board(Difficulty.OFF).get_board()
+        board = TransformBoardFactory([grid]).generate_board(Difficulty.EASY)
+
+        self.assertEqual(Difficulty.EASY.empty_squares(16), len(board.get_moves()))